@@ -5,9 +5,13 @@ This is the simplest possible entry point to avoid conflicts
 import os
 import sys
 import logging
+import threading
+import functools
+
+from backend.logging_config import setup_logging
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+setup_logging()
 logger = logging.getLogger(__name__)
 
 # Set environment for Streamlit Cloud
@@ -16,18 +20,28 @@ os.environ.setdefault("STREAMLIT_CLOUD", "true")
 # Add backend to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
-# Initialize database and setup environment
-def setup_environment():
-    """Setup environment for Streamlit Cloud"""
+# NLTK corpora are baked in at build time by setup.sh; the runtime only points at them
+NLTK_DATA_DIR = os.environ.setdefault("NLTK_DATA", "/opt/nltk_data")
+
+# NLTK packages and the resource paths nltk.data.find() expects for them
+NLTK_PACKAGES = {
+    'punkt': 'tokenizers/punkt',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',
+    'stopwords': 'corpora/stopwords',
+}
+
+def _nltk_setup():
+    """Verify NLTK packages, downloading any that are missing"""
     try:
-        # Setup NLP packages gracefully
         import nltk
-        nltk_packages = ['punkt', 'averaged_perceptron_tagger', 'stopwords']
-        for package in nltk_packages:
+        if NLTK_DATA_DIR not in nltk.data.path:
+            nltk.data.path.insert(0, NLTK_DATA_DIR)
+        for package, resource in NLTK_PACKAGES.items():
             try:
-                nltk.data.find(f'tokenizers/{package}')
+                nltk.data.find(resource)
                 logger.info(f"NLTK {package} already available")
             except LookupError:
+                # Only reached when the image was built without setup.sh
                 try:
                     logger.info(f"Downloading NLTK {package}...")
                     nltk.download(package, quiet=True)
@@ -39,7 +53,18 @@ def setup_environment():
     except Exception as e:
         logger.warning(f"NLTK setup failed: {e}")
         logger.info("App will continue with basic functionality")
-    
+
+def start_nltk_bootstrap():
+    """Run the NLTK setup in a background thread so it never blocks the first render"""
+    if os.getenv("NLTK_SKIP_BOOTSTRAP") == "1":
+        logger.info("NLTK bootstrap skipped (NLTK_SKIP_BOOTSTRAP=1)")
+        return
+    threading.Thread(target=_nltk_setup, name="nltk-bootstrap", daemon=True).start()
+
+# Initialize database and setup environment
+@functools.lru_cache(maxsize=1)
+def setup_environment():
+    """Setup environment for Streamlit Cloud"""
     # Initialize database
     try:
         from backend.db.init_db import init_database
@@ -51,9 +76,12 @@ def setup_environment():
 
 def main():
     """Main entry point - just run the Streamlit app"""
-    # Setup environment first
-    setup_environment()
-    
+    import streamlit as st
+
+    # Streamlit re-executes this script on every rerun, which resets the
+    # lru_cache above; cache_resource keeps the setup to once per process
+    st.cache_resource(show_spinner=False)(setup_environment)()
+
     try:
         # Import and run the main Streamlit app
         from frontend.streamlit_app import main as streamlit_main
@@ -61,10 +89,13 @@ def main():
     except ImportError as e:
         logger.error(f"Could not import streamlit app: {e}")
         # Fallback to basic Streamlit app
-        import streamlit as st
         st.title("HireLens - AI Resume Evaluator")
         st.error("Application failed to load. Please check the logs.")
         st.info("This is a fallback interface.")
 
+    # NLTK is only needed once a resume is tokenized, so bootstrap it after the
+    # first frame has rendered
+    st.cache_resource(show_spinner=False)(start_nltk_bootstrap)()
+
 if __name__ == "__main__":
     main()
@@ -3,33 +3,42 @@ FastAPI main application for HireLens
 """
 from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
 from typing import List, Optional
+import functools
+import hashlib
 import os
 import shutil
 from pathlib import Path
 import logging
+import aiofiles
 
-from backend.db.database import get_db, create_tables
-from backend.db.models import User, Job, Resume, Evaluation
-from backend.auth.dependencies import get_current_active_user, require_role
-from backend.langchain_pipelines.evaluation_pipeline import ResumeEvaluationPipeline, EvaluationResult
-from backend.parsers.resume_parser import ResumeParser
-from backend.parsers.jd_parser import JDParser
-from backend.auth.security import create_access_token, get_password_hash, verify_password
+from backend.config import config
+from backend.logging_config import setup_logging
+from backend.db.database import get_db, warm_pool
+from backend.db.init_db import ensure_schema
+from backend.db.models import User, Job, Resume, Evaluation, evaluation_upsert_statement
+from backend.auth.dependencies import AuthenticatedUser, get_current_active_user, require_role
+from backend.auth.security import create_access_token, get_password_hash, verify_password, password_needs_rehash
 from pydantic import BaseModel, EmailStr
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+setup_logging()
 logger = logging.getLogger(__name__)
 
 # Create FastAPI app
 app = FastAPI(
     title="HireLens API",
     description="AI-Powered Resume Relevance Check System",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -37,8 +46,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:8501", "http://127.0.0.1:8501"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
 # Security
@@ -75,7 +85,7 @@ class JobResponse(BaseModel):
     requirements: Optional[str]
     skills_required: List[str]
     skills_preferred: List[str]
-    created_at: str
+    created_at: datetime
 
 class ResumeResponse(BaseModel):
     id: int
@@ -83,7 +93,7 @@ class ResumeResponse(BaseModel):
     original_filename: str
     file_type: str
     skills: List[str]
-    created_at: str
+    created_at: datetime
 
 class EvaluationResponse(BaseModel):
     id: int
@@ -97,32 +107,104 @@ class EvaluationResponse(BaseModel):
     missing_skills: List[str]
     skill_coverage: float
     feedback: dict
-    created_at: str
+    created_at: datetime
 
-# Initialize evaluation pipeline
-evaluation_pipeline = ResumeEvaluationPipeline()
+# The pipeline and parsers pull in LangChain, scikit-learn and sentence-transformers,
+# so they are imported and built on first use (once per process), not at import time
+@functools.lru_cache(maxsize=1)
+def get_pipeline():
+    """Get the shared resume evaluation pipeline"""
+    from backend.langchain_pipelines.evaluation_pipeline import ResumeEvaluationPipeline
+    return ResumeEvaluationPipeline()
+
+@functools.lru_cache(maxsize=1)
+def get_resume_parser():
+    """Get the shared resume parser"""
+    from backend.parsers.resume_parser import ResumeParser
+    return ResumeParser()
+
+@functools.lru_cache(maxsize=1)
+def get_jd_parser():
+    """Get the shared job description parser"""
+    from backend.parsers.jd_parser import JDParser
+    return JDParser()
+
+def content_hash(data: bytes) -> str:
+    """Short blake2b digest used to key parse caches and deduplicate uploads"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+@functools.lru_cache(maxsize=512)
+def _parse_jd_cached(text_hash: str, jd_text: str) -> dict:
+    """Parse a job description once per distinct text"""
+    return get_jd_parser().parse_jd(jd_text)
+
+def resolve_upload_dir() -> Path:
+    """
+    Pick the upload directory: config.UPLOAD_FOLDER by default, or a tmpfs
+    (/dev/shm) when UPLOAD_TMPFS=true and it has room. tmpfs is opt-in because
+    its contents do not survive a restart.
+    """
+    if os.getenv("UPLOAD_TMPFS") == "true" and os.path.isdir("/dev/shm"):
+        if shutil.disk_usage("/dev/shm").free >= TMPFS_MIN_FREE_BYTES:
+            return Path("/dev/shm/hirelens")
+        logger.warning("Not enough free space on /dev/shm, using disk for uploads")
+    return Path(config.UPLOAD_FOLDER)
+
+def prefetch_files(paths: List[str]):
+    """Ask the kernel to read ahead the given files so pool workers hit the page cache"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
 
 # Create upload directory
-UPLOAD_DIR = Path("uploads")
-UPLOAD_DIR.mkdir(exist_ok=True)
+TMPFS_MIN_FREE_BYTES = 256 * 1024 * 1024  # 256 MiB
+UPLOAD_DIR = resolve_upload_dir()
+UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+ALLOWED_RESUME_SUFFIXES = frozenset({'.pdf', '.docx'})
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database and create tables"""
+    """Initialize database, create tables and warm the connection pool and models"""
     try:
-        create_tables()
-        logger.info("Database tables created successfully")
+        if ensure_schema():
+            logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Error creating database tables: {e}")
+    
+    try:
+        await warm_pool()
+        logger.info("Database connection pool warmed")
+    except Exception as e:
+        logger.warning(f"Could not warm database connection pool: {e}")
+    
+    try:
+        await run_in_threadpool(lambda: get_pipeline().warm_up())
+    except Exception as e:
+        logger.warning(f"Could not warm up evaluation pipeline: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the batch evaluation workers"""
+    if get_pipeline.cache_info().currsize:
+        get_pipeline().shutdown()
 
 # Authentication endpoints
 @app.post("/auth/register", response_model=Token)
-async def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """Register a new user"""
     # Check if user already exists
-    existing_user = db.query(User).filter(
-        (User.email == user.email) | (User.username == user.username)
-    ).first()
+    existing_user = (await db.execute(
+        select(User).where((User.email == user.email) | (User.username == user.username))
+    )).scalars().first()
     
     if existing_user:
         raise HTTPException(
@@ -140,8 +222,8 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     # Create access token
     access_token = create_access_token(
@@ -151,10 +233,12 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
     return {"access_token": access_token, "token_type": "bearer"}
 
 @app.post("/auth/login", response_model=Token)
-async def login(user: UserLogin, db: Session = Depends(get_db)):
+async def login(user: UserLogin, db: AsyncSession = Depends(get_db)):
     """Login user"""
     # Find user
-    db_user = db.query(User).filter(User.username == user.username).first()
+    db_user = (await db.execute(
+        select(User).where(User.username == user.username)
+    )).scalar_one_or_none()
     
     if not db_user or not verify_password(user.password, db_user.hashed_password):
         raise HTTPException(
@@ -168,6 +252,11 @@ async def login(user: UserLogin, db: Session = Depends(get_db)):
             detail="Inactive user"
         )
     
+    # Upgrade legacy bcrypt hashes to argon2 now that we have the plain password
+    if password_needs_rehash(db_user.hashed_password):
+        db_user.hashed_password = get_password_hash(user.password)
+        await db.commit()
+    
     # Create access token
     access_token = create_access_token(
         data={"sub": user.username, "user_id": db_user.id}
@@ -179,13 +268,12 @@ async def login(user: UserLogin, db: Session = Depends(get_db)):
 @app.post("/jobs/", response_model=JobResponse)
 async def create_job(
     job: JobCreate,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new job description"""
     # Parse job description to extract skills
-    jd_parser = JDParser()
-    parsed_jd = jd_parser.parse_jd(job.description)
+    parsed_jd = _parse_jd_cached(content_hash(job.description.encode()), job.description)
     
     # Create job in database
     db_job = Job(
@@ -200,8 +288,8 @@ async def create_job(
     )
     
     db.add(db_job)
-    db.commit()
-    db.refresh(db_job)
+    await db.commit()
+    await db.refresh(db_job)
     
     return JobResponse(
         id=db_job.id,
@@ -212,16 +300,18 @@ async def create_job(
         requirements=db_job.requirements,
         skills_required=db_job.skills_required or [],
         skills_preferred=db_job.skills_preferred or [],
-        created_at=db_job.created_at.isoformat()
+        created_at=db_job.created_at
     )
 
 @app.get("/jobs/", response_model=List[JobResponse])
 async def get_jobs(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get all jobs for current user"""
-    jobs = db.query(Job).filter(Job.user_id == current_user.id).all()
+    jobs = (await db.execute(
+        select(Job).where(Job.user_id == current_user.id)
+    )).scalars().all()
     
     return [
         JobResponse(
@@ -233,43 +323,72 @@ async def get_jobs(
             requirements=job.requirements,
             skills_required=job.skills_required or [],
             skills_preferred=job.skills_preferred or [],
-            created_at=job.created_at.isoformat()
+            created_at=job.created_at
         )
         for job in jobs
     ]
 
 # Resume upload and parsing endpoints
+async def _find_resume_by_hash(db: AsyncSession, user_id: int, file_hash: str) -> Optional[Resume]:
+    """The user's resume with these file contents, if one was uploaded before"""
+    return (await db.execute(
+        select(Resume).where(Resume.user_id == user_id, Resume.content_hash == file_hash)
+    )).scalar_one_or_none()
+
 @app.post("/resumes/upload", response_model=ResumeResponse)
 async def upload_resume(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Upload and parse a resume"""
     # Validate file type
-    if not file.filename.endswith(('.pdf', '.docx')):
+    file_suffix = Path(file.filename).suffix.lower()
+    if file_suffix not in ALLOWED_RESUME_SUFFIXES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only PDF and DOCX files are allowed"
         )
     
-    # Save file
+    # Save file in 1 MiB chunks without blocking the event loop, hashing and
+    # counting on the way so the file is never stat'ed
     file_path = UPLOAD_DIR / f"{current_user.id}_{file.filename}"
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    hasher = hashlib.blake2b(digest_size=16)
+    bytes_written = 0
+    async with aiofiles.open(file_path, "wb") as buffer:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+            bytes_written += len(chunk)
+            await buffer.write(chunk)
+    
+    # Re-uploads of an identical file reuse the already parsed resume
+    file_hash = hasher.hexdigest()
+    existing_resume = await _find_resume_by_hash(db, current_user.id, file_hash)
+    
+    if existing_resume:
+        if Path(existing_resume.file_path) != file_path:
+            file_path.unlink()
+        return ResumeResponse(
+            id=existing_resume.id,
+            filename=existing_resume.filename,
+            original_filename=existing_resume.original_filename,
+            file_type=existing_resume.file_type,
+            skills=existing_resume.skills or [],
+            created_at=existing_resume.created_at
+        )
     
     try:
         # Parse resume
-        resume_parser = ResumeParser()
-        parsed_data = resume_parser.parse_file(str(file_path))
+        parsed_data = get_resume_parser().parse_file(str(file_path))
         
         # Save to database
         db_resume = Resume(
             filename=file_path.name,
             original_filename=file.filename,
             file_path=str(file_path),
-            file_size=file_path.stat().st_size,
-            file_type=file.filename.split('.')[-1],
+            file_size=bytes_written,
+            file_type=file_suffix.lstrip('.'),
+            content_hash=file_hash,
             raw_text=parsed_data.get('raw_text', ''),
             skills=parsed_data.get('skills', []),
             education=parsed_data.get('education', []),
@@ -281,8 +400,8 @@ async def upload_resume(
         )
         
         db.add(db_resume)
-        db.commit()
-        db.refresh(db_resume)
+        await db.commit()
+        await db.refresh(db_resume)
         
         return ResumeResponse(
             id=db_resume.id,
@@ -290,9 +409,26 @@ async def upload_resume(
             original_filename=db_resume.original_filename,
             file_type=db_resume.file_type,
             skills=db_resume.skills or [],
-            created_at=db_resume.created_at.isoformat()
+            created_at=db_resume.created_at
         )
         
+    except IntegrityError:
+        # A concurrent upload of the same file committed first; it may own
+        # this very path, so only a differently named copy is removed
+        await db.rollback()
+        existing_resume = await _find_resume_by_hash(db, current_user.id, file_hash)
+        if existing_resume is None:
+            raise
+        if Path(existing_resume.file_path) != file_path and file_path.exists():
+            file_path.unlink()
+        return ResumeResponse(
+            id=existing_resume.id,
+            filename=existing_resume.filename,
+            original_filename=existing_resume.original_filename,
+            file_type=existing_resume.file_type,
+            skills=existing_resume.skills or [],
+            created_at=existing_resume.created_at
+        )
     except Exception as e:
         # Clean up file on error
         if file_path.exists():
@@ -304,11 +440,13 @@ async def upload_resume(
 
 @app.get("/resumes/", response_model=List[ResumeResponse])
 async def get_resumes(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get all resumes for current user"""
-    resumes = db.query(Resume).filter(Resume.user_id == current_user.id).all()
+    resumes = (await db.execute(
+        select(Resume).where(Resume.user_id == current_user.id)
+    )).scalars().all()
     
     return [
         ResumeResponse(
@@ -317,7 +455,7 @@ async def get_resumes(
             original_filename=resume.original_filename,
             file_type=resume.file_type,
             skills=resume.skills or [],
-            created_at=resume.created_at.isoformat()
+            created_at=resume.created_at
         )
         for resume in resumes
     ]
@@ -327,20 +465,18 @@ async def get_resumes(
 async def evaluate_resume(
     resume_id: int,
     job_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Evaluate a resume against a job description"""
     # Get resume and job
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id
-    ).first()
+    resume = (await db.execute(
+        select(Resume).where(Resume.id == resume_id, Resume.user_id == current_user.id)
+    )).scalar_one_or_none()
     
-    job = db.query(Job).filter(
-        Job.id == job_id,
-        Job.user_id == current_user.id
-    ).first()
+    job = (await db.execute(
+        select(Job).where(Job.id == job_id, Job.user_id == current_user.id)
+    )).scalar_one_or_none()
     
     if not resume:
         raise HTTPException(
@@ -356,30 +492,32 @@ async def evaluate_resume(
     
     try:
         # Perform evaluation
-        result = evaluation_pipeline.evaluate_resume(
+        result = await get_pipeline().evaluate_resume_async(
             resume_file_path=resume.file_path,
             jd_text=job.description,
             jd_title=job.title,
             jd_company=job.company
         )
         
-        # Save evaluation to database
-        db_evaluation = Evaluation(
-            resume_id=resume_id,
-            job_id=job_id,
-            overall_score=result.final_score,
-            hard_match_score=result.hard_match_score,
-            soft_match_score=result.soft_match_score,
-            verdict=result.verdict,
-            matched_skills=result.matched_skills,
-            missing_skills=result.missing_skills,
-            skill_coverage=result.skill_coverage,
-            feedback=result.feedback
-        )
-        
-        db.add(db_evaluation)
-        db.commit()
-        db.refresh(db_evaluation)
+        # Save evaluation to database, replacing an earlier one for the same pair
+        db_evaluation = (await db.scalars(
+            evaluation_upsert_statement()
+            .returning(Evaluation)
+            .execution_options(populate_existing=True),
+            [{
+                'resume_id': resume_id,
+                'job_id': job_id,
+                'overall_score': result.final_score,
+                'hard_match_score': result.hard_match_score,
+                'soft_match_score': result.soft_match_score,
+                'verdict': result.verdict,
+                'matched_skills': result.matched_skills,
+                'missing_skills': result.missing_skills,
+                'skill_coverage': result.skill_coverage,
+                'feedback': result.feedback
+            }]
+        )).one()
+        await db.commit()
         
         return EvaluationResponse(
             id=db_evaluation.id,
@@ -393,7 +531,7 @@ async def evaluate_resume(
             missing_skills=db_evaluation.missing_skills or [],
             skill_coverage=db_evaluation.skill_coverage,
             feedback=db_evaluation.feedback or {},
-            created_at=db_evaluation.created_at.isoformat()
+            created_at=db_evaluation.created_at
         )
         
     except Exception as e:
@@ -406,16 +544,22 @@ async def evaluate_resume(
 @app.get("/evaluations/", response_model=List[EvaluationResponse])
 async def get_evaluations(
     job_id: Optional[int] = None,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get all evaluations for current user, optionally filtered by job"""
-    query = db.query(Evaluation).join(Resume).filter(Resume.user_id == current_user.id)
+    # Populate Evaluation.resume from the join itself so it never lazy-loads per row
+    query = (
+        select(Evaluation)
+        .join(Resume)
+        .options(contains_eager(Evaluation.resume))
+        .where(Resume.user_id == current_user.id)
+    )
     
     if job_id:
-        query = query.filter(Evaluation.job_id == job_id)
+        query = query.where(Evaluation.job_id == job_id)
     
-    evaluations = query.all()
+    evaluations = (await db.execute(query)).scalars().all()
     
     return [
         EvaluationResponse(
@@ -430,7 +574,7 @@ async def get_evaluations(
             missing_skills=eval.missing_skills or [],
             skill_coverage=eval.skill_coverage,
             feedback=eval.feedback or {},
-            created_at=eval.created_at.isoformat()
+            created_at=eval.created_at
         )
         for eval in evaluations
     ]
@@ -440,15 +584,14 @@ async def get_evaluations(
 async def batch_evaluate_resumes(
     job_id: int,
     resume_ids: List[int],
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Evaluate multiple resumes against a job description"""
     # Get job
-    job = db.query(Job).filter(
-        Job.id == job_id,
-        Job.user_id == current_user.id
-    ).first()
+    job = (await db.execute(
+        select(Job).where(Job.id == job_id, Job.user_id == current_user.id)
+    )).scalar_one_or_none()
     
     if not job:
         raise HTTPException(
@@ -457,10 +600,9 @@ async def batch_evaluate_resumes(
         )
     
     # Get resumes
-    resumes = db.query(Resume).filter(
-        Resume.id.in_(resume_ids),
-        Resume.user_id == current_user.id
-    ).all()
+    resumes = (await db.execute(
+        select(Resume).where(Resume.id.in_(resume_ids), Resume.user_id == current_user.id)
+    )).scalars().all()
     
     if not resumes:
         raise HTTPException(
@@ -469,34 +611,39 @@ async def batch_evaluate_resumes(
         )
     
     try:
-        # Perform batch evaluation
-        resume_paths = [resume.file_path for resume in resumes]
-        results = evaluation_pipeline.batch_evaluate_resumes(
-            resume_file_paths=resume_paths,
-            jd_text=job.description,
-            jd_title=job.title,
-            jd_company=job.company
+        # Start reading all resumes at once, then hand the whole batch to the
+        # pipeline so the JD is parsed once and the feedback calls are batched
+        prefetch_files([resume.file_path for resume in resumes])
+        results = await get_pipeline().abatch_evaluate_resumes(
+            [resume.file_path for resume in resumes], job.description, job.title, job.company
         )
         
-        # Save evaluations to database
-        db_evaluations = []
-        for i, result in enumerate(results):
-            db_evaluation = Evaluation(
-                resume_id=resumes[i].id,
-                job_id=job_id,
-                overall_score=result.final_score,
-                hard_match_score=result.hard_match_score,
-                soft_match_score=result.soft_match_score,
-                verdict=result.verdict,
-                matched_skills=result.matched_skills,
-                missing_skills=result.missing_skills,
-                skill_coverage=result.skill_coverage,
-                feedback=result.feedback
-            )
-            db_evaluations.append(db_evaluation)
+        # Upsert all evaluations in a single INSERT ... ON CONFLICT ... RETURNING round-trip
+        upserted = (await db.scalars(
+            evaluation_upsert_statement()
+            .returning(Evaluation)
+            .execution_options(populate_existing=True),
+            [
+                {
+                    'resume_id': resumes[i].id,
+                    'job_id': job_id,
+                    'overall_score': result.final_score,
+                    'hard_match_score': result.hard_match_score,
+                    'soft_match_score': result.soft_match_score,
+                    'verdict': result.verdict,
+                    'matched_skills': result.matched_skills,
+                    'missing_skills': result.missing_skills,
+                    'skill_coverage': result.skill_coverage,
+                    'feedback': result.feedback
+                }
+                for i, result in enumerate(results)
+            ]
+        )).all()
+        await db.commit()
         
-        db.add_all(db_evaluations)
-        db.commit()
+        # Updated rows keep their original ids, so restore request order by resume
+        by_resume_id = {evaluation.resume_id: evaluation for evaluation in upserted}
+        db_evaluations = [by_resume_id[resume.id] for resume in resumes]
         
         # Return evaluation responses
         return [
@@ -512,7 +659,7 @@ async def batch_evaluate_resumes(
                 missing_skills=eval.missing_skills or [],
                 skill_coverage=eval.skill_coverage,
                 feedback=eval.feedback or {},
-                created_at=eval.created_at.isoformat()
+                created_at=eval.created_at
             )
             for eval in db_evaluations
         ]
@@ -531,5 +678,15 @@ async def health_check():
     return {"status": "healthy", "message": "HireLens API is running"}
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(
+        "backend.api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop has no Windows build
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2)),
+        log_level="warning",
+        access_log=False
+    )
@@ -1,9 +1,15 @@
 """
 Authentication dependencies for FastAPI
 """
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Tuple
+import threading
+import time
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from backend.auth.security import verify_token
 from backend.db.database import get_db
 from backend.db.models import User
@@ -11,10 +17,52 @@ from backend.db.models import User
 # Security scheme
 security = HTTPBearer()
 
-def get_current_user(
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """The User columns authorization needs, detached from any session"""
+    id: int
+    role: str
+    is_active: bool
+
+# Authenticated users are cached briefly to skip a DB round-trip on every
+# request, least recently used evicted first
+USER_CACHE_TTL = 30  # seconds
+USER_CACHE_SIZE = 1024
+_user_cache: "OrderedDict[int, Tuple[float, AuthenticatedUser]]" = OrderedDict()
+_user_cache_lock = threading.Lock()
+
+def invalidate_cached_user(user_id: int):
+    """Drop a user from this process's cache so the next request re-reads it"""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+@event.listens_for(User, "after_update")
+def _evict_updated_user(mapper, connection, target: User):
+    """A deactivated or re-roled user must not keep its cached access"""
+    invalidate_cached_user(target.id)
+
+def _get_cached_user(user_id: int):
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            del _user_cache[user_id]
+            return None
+        _user_cache.move_to_end(user_id)
+        return cached[1]
+
+def _cache_user(user: AuthenticatedUser):
+    with _user_cache_lock:
+        _user_cache[user.id] = (time.monotonic() + USER_CACHE_TTL, user)
+        _user_cache.move_to_end(user.id)
+        while len(_user_cache) > USER_CACHE_SIZE:
+            _user_cache.popitem(last=False)
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_db)
+) -> AuthenticatedUser:
     """Get current authenticated user"""
     token = credentials.credentials
     payload = verify_token(token)
@@ -26,12 +74,18 @@ def get_current_user(
             detail="Could not validate credentials"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _get_cached_user(user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
+        row = (await db.execute(
+            select(User.id, User.role, User.is_active).where(User.id == user_id)
+        )).one_or_none()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        user = AuthenticatedUser(id=row.id, role=row.role, is_active=bool(row.is_active))
+        _cache_user(user)
     
     if not user.is_active:
         raise HTTPException(
@@ -41,18 +95,13 @@ def get_current_user(
     
     return user
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
-    """Get current active user"""
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
-        )
+def get_current_active_user(current_user: AuthenticatedUser = Depends(get_current_user)) -> AuthenticatedUser:
+    """Get current active user (get_current_user already rejects inactive users)"""
     return current_user
 
 def require_role(required_role: str):
     """Require specific role for access"""
-    def role_checker(current_user: User = Depends(get_current_active_user)) -> User:
+    def role_checker(current_user: AuthenticatedUser = Depends(get_current_active_user)) -> AuthenticatedUser:
         if current_user.role != required_role and current_user.role != "admin":
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
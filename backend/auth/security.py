@@ -3,6 +3,8 @@ Security utilities for HireLens
 """
 from datetime import datetime, timedelta
 from typing import Optional, Union
+import functools
+import time
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
@@ -19,8 +21,8 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
 if not SECRET_KEY:
     raise ValueError("SECRET_KEY environment variable is required")
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: argon2id for new hashes, bcrypt kept so existing hashes still verify
+pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
@@ -30,6 +32,10 @@ def get_password_hash(password: str) -> str:
     """Hash a password"""
     return pwd_context.hash(password)
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash uses a deprecated scheme (e.g. bcrypt)"""
+    return pwd_context.needs_update(hashed_password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token"""
     to_encode = data.copy()
@@ -42,10 +48,18 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+@functools.lru_cache(maxsize=4096)
+def _decode_token(token: str) -> dict:
+    """Decode a JWT once; failed decodes raise and are never cached"""
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
 def verify_token(token: str) -> dict:
     """Verify and decode a JWT token"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_token(token)
+        # Cache hits skip jwt.decode, so expiry has to be rechecked here
+        if payload.get("exp", 0) <= time.time():
+            raise JWTError("Signature has expired")
         username: str = payload.get("sub")
         if username is None:
             raise HTTPException(
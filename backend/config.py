@@ -3,11 +3,22 @@ Configuration management for HireLens
 Handles environment-specific settings and database configuration
 """
 import os
+import functools
 from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Environment markers are fixed for the life of the process, so resolve them once
+_IS_CLOUD = bool(
+    os.getenv("STREAMLIT_CLOUD")
+    or os.getenv("DYNO")  # Heroku
+    or os.getenv("RAILWAY_ENVIRONMENT")  # Railway
+    or os.getenv("VERCEL")  # Vercel
+    or os.getenv("AWS_LAMBDA_FUNCTION_NAME")  # AWS Lambda
+)
+_IS_DEVELOPMENT = os.getenv("DEVELOPMENT") == "true" or os.getenv("LOCAL_DEV") == "true"
+
 class Config:
     """Base configuration class"""
     
@@ -39,18 +50,12 @@ class Config:
     @classmethod
     def is_cloud_environment(cls) -> bool:
         """Check if running in cloud environment"""
-        return any([
-            os.getenv("STREAMLIT_CLOUD"),
-            os.getenv("DYNO"),  # Heroku
-            os.getenv("RAILWAY_ENVIRONMENT"),  # Railway
-            os.getenv("VERCEL"),  # Vercel
-            os.getenv("AWS_LAMBDA_FUNCTION_NAME"),  # AWS Lambda
-        ])
+        return _IS_CLOUD
     
     @classmethod
     def is_development(cls) -> bool:
         """Check if running in development mode"""
-        return os.getenv("DEVELOPMENT") == "true" or os.getenv("LOCAL_DEV") == "true"
+        return _IS_DEVELOPMENT
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -74,6 +79,7 @@ class StreamlitCloudConfig(Config):
     MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB limit for Streamlit Cloud
     UPLOAD_FOLDER = "/tmp/uploads"  # Use temp directory
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get configuration based on environment"""
     if Config.is_cloud_environment():
@@ -86,5 +92,5 @@ def get_config() -> Config:
     else:
         return ProductionConfig()
 
-# Global config instance
+# Global config instance (same object get_config() returns on every call)
 config = get_config()
@@ -2,19 +2,28 @@
 Database configuration and session management for HireLens
 Dual database strategy: PostgreSQL for development, SQLite for production/Streamlit Cloud
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
+import asyncio
+import functools
+import logging
 import os
 import platform
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+@functools.cache
 def detect_environment():
     """
     Detect the current environment and determine database strategy
+    (cached: the environment does not change after launch)
     """
     # Check for Streamlit Cloud environment
     if os.getenv("STREAMLIT_CLOUD"):
@@ -35,11 +44,13 @@ def detect_environment():
     # Default to production if no specific indicators
     return "production"
 
+@functools.cache
 def get_database_url():
     """
     Get the appropriate database URL based on environment
     """
     environment = detect_environment()
+    postgres_url = os.environ.get("DATABASE_URL")
     
     # For Streamlit Cloud and other cloud platforms, use SQLite
     if environment in ["streamlit_cloud", "heroku", "railway"]:
@@ -49,84 +60,163 @@ def get_database_url():
     
     # For development, check if PostgreSQL is available
     if environment == "development":
-        postgres_url = os.getenv("DATABASE_URL")
         if postgres_url and postgres_url.startswith("postgresql"):
-            print("🐘 Using PostgreSQL for development")
+            logger.debug("🐘 Using PostgreSQL for development")
             return postgres_url
         else:
-            print("📁 Using SQLite for development (PostgreSQL not configured)")
+            logger.debug("📁 Using SQLite for development (PostgreSQL not configured)")
             return "sqlite:///./hirelens.db"
     
     # For production, prefer PostgreSQL but fallback to SQLite
-    postgres_url = os.getenv("DATABASE_URL")
     if postgres_url and postgres_url.startswith("postgresql"):
-        print("🐘 Using PostgreSQL for production")
+        logger.debug("🐘 Using PostgreSQL for production")
         return postgres_url
     else:
-        print("📁 Using SQLite for production (PostgreSQL not available)")
+        logger.debug("📁 Using SQLite for production (PostgreSQL not available)")
         return "sqlite:///./hirelens_prod.db"
 
 # Get the appropriate database URL
 DATABASE_URL = get_database_url()
 environment = detect_environment()
 
-print(f"🌍 Environment: {environment}")
-print(f"🗄️  Database: {DATABASE_URL}")
+logger.info("🌍 Environment: %s", environment)
+logger.info("🗄️  Database: %s", DATABASE_URL)
+
+# PostgreSQL connection pool sizing
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
+# SQLite tuning applied to every new connection. WAL turns commits into appends
+# and lets readers run alongside a writer; note it keeps -wal and -shm sidecar
+# files next to hirelens_*.db while connections are open.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Apply SQLITE_PRAGMAS to a freshly opened SQLite connection
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
 
 # Create engine based on database type
 if DATABASE_URL.startswith("sqlite"):
-    # SQLite configuration - optimized for cloud deployment
+    # SQLite configuration - optimized for cloud deployment. No pool_pre_ping /
+    # pool_recycle: SQLite connections are in-process file handles that cannot
+    # go stale like TCP connections, so a checkout ping is pure overhead.
     engine = create_engine(
         DATABASE_URL,
         poolclass=StaticPool,
         connect_args={"check_same_thread": False},
-        echo=False,
-        # SQLite-specific optimizations
-        pool_pre_ping=True,
-        pool_recycle=3600
+        echo=False
     )
-    print("✅ SQLite engine configured")
+    logger.debug("✅ SQLite engine configured")
 else:
     # PostgreSQL configuration
     try:
+        # Default QueuePool: one connection per concurrent request instead of a
+        # single shared StaticPool connection that serializes every query.
+        # LIFO checkout keeps reusing the warmest connections.
         engine = create_engine(
             DATABASE_URL,
-            poolclass=StaticPool,
             connect_args={
                 "sslmode": "require" if environment == "production" else "prefer",
                 "options": "-c timezone=utc"
             },
             echo=False,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_timeout=30,
+            pool_use_lifo=True,
             pool_pre_ping=True,
-            pool_recycle=3600
+            pool_recycle=1800
         )
-        print("✅ PostgreSQL engine configured")
+        logger.debug("✅ PostgreSQL engine configured")
     except Exception as e:
-        print(f"❌ PostgreSQL connection failed: {e}")
-        print("🔄 Falling back to SQLite...")
+        logger.error("❌ PostgreSQL connection failed: %s", e)
+        logger.warning("🔄 Falling back to SQLite...")
         DATABASE_URL = "sqlite:///./hirelens_fallback.db"
         engine = create_engine(
             DATABASE_URL,
-            poolclass=StaticPool,
+            poolclass=NullPool,
             connect_args={"check_same_thread": False},
             echo=False
         )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if DATABASE_URL.startswith("sqlite"):
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Map a sync database URL onto its asyncio driver (asyncpg / aiosqlite)
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    # asyncpg takes SSL settings through connect_args, not the libpq query string
+    url = url.set(drivername="postgresql+asyncpg").difference_update_query(["sslmode"])
+    return url.render_as_string(hide_password=False)
+
+# Async engine used by the FastAPI request path
+ASYNC_DATABASE_URL = get_async_database_url(DATABASE_URL)
+
+if DATABASE_URL.startswith("sqlite"):
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        echo=False
+    )
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+else:
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        connect_args={
+            "ssl": "require" if environment == "production" else "prefer",
+            "server_settings": {"timezone": "utc"}
+        },
+        echo=False,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=30,
+        pool_use_lifo=True,
+        pool_pre_ping=True,
+        pool_recycle=1800
+    )
+
+# Create session factories
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 # Create base class for models
 Base = declarative_base()
 
-def get_db():
+async def get_db():
     """
-    Dependency to get database session
+    Dependency to get an async database session
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+async def warm_pool():
+    """
+    Open POOL_SIZE connections up front so early requests skip the connect handshake
+    """
+    if DATABASE_URL.startswith("sqlite"):
+        return
+    
+    async def ping():
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    
+    await asyncio.gather(*(ping() for _ in range(POOL_SIZE)))
 
 def create_tables():
     """
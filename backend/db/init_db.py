@@ -4,33 +4,125 @@ Enhanced for dual database strategy
 """
 from .database import create_tables, drop_tables, engine, DATABASE_URL, environment
 from .models import Base
+import csv
+import hashlib
+import io
 import logging
 import os
-from sqlalchemy import text
+from pathlib import Path
+from sqlalchemy import inspect, text
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+_LIST_TABLES_SQL = (
+    "SELECT name FROM sqlite_master WHERE type='table'"
+    if IS_SQLITE
+    else "SELECT tablename FROM pg_tables WHERE schemaname='public'"
+)
+
 def check_database_connection():
     """Check if database connection is working"""
     try:
         with engine.connect() as connection:
-            if DATABASE_URL.startswith("sqlite"):
-                # Test SQLite connection
-                result = connection.execute(text("SELECT 1"))
-                logger.info("✅ SQLite database connection successful")
-            else:
-                # Test PostgreSQL connection
-                result = connection.execute(text("SELECT 1"))
-                logger.info("✅ PostgreSQL database connection successful")
+            connection.execute(text("SELECT 1"))
+        logger.info(f"✅ {'SQLite' if IS_SQLITE else 'PostgreSQL'} database connection successful")
         return True
     except Exception as e:
         logger.error(f"❌ Database connection failed: {e}")
         return False
 
-def init_database():
+def _dedupe_evaluations(connection):
+    """
+    Older databases inserted a new evaluation on every run; keep only the newest
+    row per (resume_id, job_id) so the unique upsert index can be built
+    """
+    result = connection.execute(text(
+        "DELETE FROM evaluations WHERE id NOT IN "
+        "(SELECT MAX(id) FROM evaluations GROUP BY resume_id, job_id)"
+    ))
+    if result.rowcount:
+        logger.info(f"🧹 Removed {result.rowcount} duplicate evaluations")
+
+def upgrade_schema() -> bool:
+    """
+    Add nullable columns and indexes declared after a table was first created.
+    Returns False when any index could not be created.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            
+            existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing_columns and column.nullable:
+                    column_type = column.type.compile(dialect=engine.dialect)
+                    connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                    logger.info(f"➕ Added column {table.name}.{column.name}")
+        
+        if inspector.has_table("evaluations"):
+            _dedupe_evaluations(connection)
+    
+    # Indexes get their own transaction each: an older column type (e.g. json
+    # rather than jsonb under a GIN index) should not abort the whole upgrade
+    complete = True
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                with engine.begin() as connection:
+                    index.create(bind=connection, checkfirst=True)
+            except Exception as e:
+                logger.warning(f"⚠️  Could not create index {index.name}: {e}")
+                complete = False
+    return complete
+
+def _compute_schema_version() -> str:
+    """Fingerprint the declared tables, columns and indexes plus the target database"""
+    schema = [
+        (
+            table.name,
+            sorted((column.name, repr(column.type)) for column in table.columns),
+            sorted(index.name for index in table.indexes),
+        )
+        for table in Base.metadata.sorted_tables
+    ]
+    return hashlib.sha1(repr((DATABASE_URL, schema)).encode()).hexdigest()[:12]
+
+SCHEMA_VERSION = _compute_schema_version()
+SCHEMA_MARKER = Path(os.getcwd()) / f".hirelens_schema_{SCHEMA_VERSION}"
+
+def _schema_is_current() -> bool:
+    """Check the marker left by the last successful schema setup for this exact schema"""
+    if not SCHEMA_MARKER.exists():
+        return False
+    # A deleted SQLite file invalidates the marker
+    if IS_SQLITE:
+        return os.path.exists(DATABASE_URL.split("sqlite:///", 1)[-1])
+    return True
+
+def ensure_schema() -> bool:
+    """
+    Create tables and apply upgrades unless this schema version was already set up.
+    Returns True when the DDL actually ran.
+    """
+    if _schema_is_current():
+        return False
+    
+    create_tables()
+    # Leave the marker unwritten on a partial upgrade so the next start retries it
+    if upgrade_schema():
+        SCHEMA_MARKER.touch()
+    return True
+
+def init_database(verbose: bool = False):
     """Initialize the database with all tables"""
     try:
+        if _schema_is_current():
+            logger.info(f"✅ Database schema {SCHEMA_VERSION} already initialized")
+            return
+        
         logger.info(f"🌍 Environment: {environment}")
         logger.info(f"🗄️  Database URL: {DATABASE_URL}")
         
@@ -39,19 +131,14 @@ def init_database():
             raise Exception("Database connection failed")
         
         logger.info("Creating database tables...")
-        create_tables()
+        ensure_schema()
         logger.info("✅ Database tables created successfully!")
         
-        # Log table information
-        with engine.connect() as connection:
-            if DATABASE_URL.startswith("sqlite"):
-                result = connection.execute(text("SELECT name FROM sqlite_master WHERE type='table'"))
-                tables = [row[0] for row in result]
-            else:
-                result = connection.execute(text("SELECT tablename FROM pg_tables WHERE schemaname='public'"))
-                tables = [row[0] for row in result]
-            
-            logger.info(f"📋 Created tables: {', '.join(tables)}")
+        if verbose:
+            # Log table information
+            with engine.connect() as connection:
+                tables = connection.execute(text(_LIST_TABLES_SQL)).scalars().all()
+                logger.info(f"📋 Created tables: {', '.join(tables)}")
         
     except Exception as e:
         logger.error(f"❌ Error creating database tables: {e}")
@@ -69,9 +156,23 @@ def reset_database():
         logger.error(f"❌ Error resetting database: {e}")
         raise
 
+MIGRATION_READ_CHUNK_SIZE = 10000  # rows read from SQLite at a time
+MIGRATION_WRITE_CHUNK_SIZE = 1000  # rows per COPY batch
+
+def _pg_copy_insert(table, conn, keys, data_iter):
+    """pandas to_sql method that streams each batch through PostgreSQL COPY"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(data_iter)
+    buffer.seek(0)
+    
+    columns = ', '.join(f'"{key}"' for key in keys)
+    table_name = f'{table.schema}.{table.name}' if table.schema else table.name
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(f'COPY {table_name} ({columns}) FROM STDIN WITH CSV', buffer)
+
 def migrate_sqlite_to_postgresql():
     """Migrate data from SQLite to PostgreSQL (development helper)"""
-    if not DATABASE_URL.startswith("postgresql"):
+    if IS_SQLITE:
         logger.warning("⚠️  Not a PostgreSQL database, skipping migration")
         return
     
@@ -94,15 +195,21 @@ def migrate_sqlite_to_postgresql():
         
         logger.info(f"📋 Found tables to migrate: {', '.join(tables)}")
         
-        # Migrate each table
-        for table in tables:
-            if table == "sqlite_sequence":  # Skip SQLite system table
-                continue
-                
-            logger.info(f"🔄 Migrating table: {table}")
-            df = pd.read_sql_table(table, sqlite_engine)
-            df.to_sql(table, engine, if_exists='append', index=False)
-            logger.info(f"✅ Migrated {len(df)} rows from {table}")
+        # Migrate each table in bounded chunks, one COPY per batch of rows
+        with sqlite_engine.connect() as sqlite_connection:
+            for table in tables:
+                if table == "sqlite_sequence":  # Skip SQLite system table
+                    continue
+                    
+                logger.info(f"🔄 Migrating table: {table}")
+                row_count = 0
+                for df in pd.read_sql_table(table, sqlite_connection, chunksize=MIGRATION_READ_CHUNK_SIZE):
+                    df.to_sql(
+                        table, engine, if_exists='append', index=False,
+                        method=_pg_copy_insert, chunksize=MIGRATION_WRITE_CHUNK_SIZE
+                    )
+                    row_count += len(df)
+                logger.info(f"✅ Migrated {row_count} rows from {table}")
         
         logger.info("✅ Migration completed successfully!")
         
@@ -111,10 +218,13 @@ def migrate_sqlite_to_postgresql():
 
 if __name__ == "__main__":
     import sys
+    from backend.logging_config import setup_logging
+    
+    setup_logging()
     
     if len(sys.argv) > 1 and sys.argv[1] == "reset":
         reset_database()
     elif len(sys.argv) > 1 and sys.argv[1] == "migrate":
         migrate_sqlite_to_postgresql()
     else:
-        init_database()
+        init_database(verbose="--verbose" in sys.argv)
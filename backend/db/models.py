@@ -1,10 +1,16 @@
 """
 SQLAlchemy models for HireLens
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, JSON, Index
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from .database import Base
+from .database import Base, DATABASE_URL
+
+# JSON on SQLite, binary JSONB on PostgreSQL (stored pre-parsed, GIN-indexable)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+IS_POSTGRESQL = DATABASE_URL.startswith("postgresql")
 
 class User(Base):
     """User model for authentication"""
@@ -33,8 +39,8 @@ class Job(Base):
     location = Column(String(255))
     description = Column(Text, nullable=False)
     requirements = Column(Text)
-    skills_required = Column(JSON)  # List of required skills
-    skills_preferred = Column(JSON)  # List of preferred skills
+    skills_required = Column(JSONType)  # List of required skills
+    skills_preferred = Column(JSONType)  # List of preferred skills
     experience_level = Column(String(50))  # Entry, Mid, Senior
     employment_type = Column(String(50))  # Full-time, Part-time, Contract
     salary_range = Column(String(100))
@@ -45,6 +51,12 @@ class Job(Base):
     # Relationships
     user = relationship("User", back_populates="jobs")
     evaluations = relationship("Evaluation", back_populates="job")
+    
+    __table_args__ = (
+        Index("ix_jobs_user_created", "user_id", "created_at"),
+        # GIN only exists on PostgreSQL; skip it rather than build a useless SQLite index
+        *([Index("ix_jobs_skills_required_gin", "skills_required", postgresql_using="gin")] if IS_POSTGRESQL else []),
+    )
 
 class Resume(Base):
     """Resume model"""
@@ -56,15 +68,16 @@ class Resume(Base):
     file_path = Column(String(500), nullable=False)
     file_size = Column(Integer)
     file_type = Column(String(10), nullable=False)  # pdf, docx
+    content_hash = Column(String(32))  # blake2b digest of the file contents
     
     # Parsed content
     raw_text = Column(Text)
-    skills = Column(JSON)  # List of extracted skills
-    education = Column(JSON)  # Education details
-    experience = Column(JSON)  # Work experience
-    projects = Column(JSON)  # Projects
-    certifications = Column(JSON)  # Certifications
-    contact_info = Column(JSON)  # Contact information
+    skills = Column(JSONType)  # List of extracted skills
+    education = Column(JSONType)  # Education details
+    experience = Column(JSONType)  # Work experience
+    projects = Column(JSONType)  # Projects
+    certifications = Column(JSONType)  # Certifications
+    contact_info = Column(JSONType)  # Contact information
     
     # Metadata
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -74,6 +87,11 @@ class Resume(Base):
     # Relationships
     user = relationship("User", back_populates="resumes")
     evaluations = relationship("Evaluation", back_populates="resume")
+    
+    __table_args__ = (
+        Index("ix_resumes_user_created", "user_id", "created_at"),
+        Index("ix_resumes_user_content_hash", "user_id", "content_hash", unique=True),
+    )
 
 class Evaluation(Base):
     """Resume evaluation results"""
@@ -92,23 +110,33 @@ class Evaluation(Base):
     verdict = Column(String(20), nullable=False)  # High, Medium, Low
     
     # Detailed results
-    matched_skills = Column(JSON)  # List of matched skills
-    missing_skills = Column(JSON)  # List of missing skills
+    matched_skills = Column(JSONType)  # List of matched skills
+    missing_skills = Column(JSONType)  # List of missing skills
     skill_coverage = Column(Float)  # Percentage of skills covered
     
     # Feedback
-    feedback = Column(Text)  # LLM-generated feedback
-    improvement_suggestions = Column(JSON)  # List of suggestions
-    strengths = Column(JSON)  # List of strengths
-    weaknesses = Column(JSON)  # List of weaknesses
+    feedback = Column(JSONType)  # LLM-generated feedback
+    improvement_suggestions = Column(JSONType)  # List of suggestions
+    strengths = Column(JSONType)  # List of strengths
+    weaknesses = Column(JSONType)  # List of weaknesses
     
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
-    # Relationships
-    resume = relationship("Resume", back_populates="evaluations")
-    job = relationship("Job", back_populates="evaluations")
+    # Relationships: evaluations are listed in bulk, so their resume/job are
+    # fetched with one IN query each instead of a lazy SELECT per row. Call
+    # sites that only need scalar columns should select them with
+    # with_entities() to skip relationship loading entirely.
+    resume = relationship("Resume", back_populates="evaluations", lazy="selectin")
+    job = relationship("Job", back_populates="evaluations", lazy="selectin")
+    
+    __table_args__ = (
+        # One evaluation per (resume, job); re-scoring upserts in place
+        Index("uq_eval_r_j", "resume_id", "job_id", unique=True),
+        Index("ix_evaluations_job_score", "job_id", "overall_score"),
+        Index("ix_evaluations_created", "created_at"),
+    )
 
 class FeedbackHistory(Base):
     """Track feedback and improvements over time"""
@@ -116,7 +144,7 @@ class FeedbackHistory(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=False)
-    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
+    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False, index=True)
     
     # Version tracking
     version_number = Column(Integer, nullable=False)
@@ -126,11 +154,34 @@ class FeedbackHistory(Base):
     
     # Feedback details
     feedback_text = Column(Text, nullable=False)
-    improvements_made = Column(JSON)  # List of improvements
-    new_skills_added = Column(JSON)  # List of new skills
+    improvements_made = Column(JSONType)  # List of improvements
+    new_skills_added = Column(JSONType)  # List of new skills
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
-    resume = relationship("Resume")
-    job = relationship("Job")
+    resume = relationship("Resume", lazy="selectin")
+    job = relationship("Job", lazy="selectin")
+    
+    # One row per version of a (resume, job) pair; the unique index also serves
+    # "latest version" lookups (ORDER BY version_number DESC LIMIT 1) from its tail
+    __table_args__ = (
+        Index("uq_fh_r_j_v", "resume_id", "job_id", "version_number", unique=True),
+    )
+
+# Columns overwritten when a (resume, job) pair is evaluated again
+EVALUATION_UPSERT_COLUMNS = (
+    "overall_score", "hard_match_score", "soft_match_score", "verdict",
+    "matched_skills", "missing_skills", "skill_coverage", "feedback",
+)
+
+def evaluation_upsert_statement():
+    """
+    INSERT ... ON CONFLICT (resume_id, job_id) DO UPDATE for Evaluation rows,
+    in the dialect of the configured database. Execute it with a list of row
+    dicts to upsert a whole batch in one statement.
+    """
+    stmt = (pg_insert if IS_POSTGRESQL else sqlite_insert)(Evaluation)
+    set_ = {name: stmt.excluded[name] for name in EVALUATION_UPSERT_COLUMNS}
+    set_["updated_at"] = func.now()
+    return stmt.on_conflict_do_update(index_elements=["resume_id", "job_id"], set_=set_)
@@ -2,20 +2,133 @@
 LLM-based feedback generation for HireLens
 """
 import os
-from typing import Dict, List, Optional
+import functools
+import hashlib
+import sqlite3
+import threading
+import orjson
+from typing import Dict, List, Optional, Tuple
 import logging
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.schema import HumanMessage, SystemMessage
-from langchain.prompts import ChatPromptTemplate
-from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+_SYSTEM_PROMPT = """You are an expert career counselor and resume reviewer. Your task is to provide constructive, actionable feedback on resumes for job applications.
+
+Guidelines:
+1. Be constructive and encouraging, not critical
+2. Provide specific, actionable suggestions
+3. Focus on skills, experience, and qualifications relevant to the job
+4. Explain the reasoning behind the verdict
+5. Suggest concrete improvements the candidate can make
+6. Keep feedback professional and helpful
+7. Highlight both strengths and areas for improvement
+
+Format your response as structured feedback with:
+- Overall feedback (2-3 sentences)
+- List of strengths (3-5 items)
+- List of weaknesses (3-5 items)
+- Missing skills (specific skills needed)
+- Improvement suggestions (3-5 actionable items)
+- Verdict explanation (why this verdict was given)"""
+
+# The system message never changes, so one instance is shared by every request
+_SYSTEM_MSG = SystemMessage(content=_SYSTEM_PROMPT)
+
+# Fallback feedback per verdict: (overall feedback template, strengths, weaknesses)
+_FALLBACK_LISTS = {
+    "High": (
+        "Great match! Your resume scored {score}/100 and shows strong alignment with the job requirements.",
+        ("Strong skill match", "Relevant experience", "Good qualifications"),
+        ("Consider adding more specific examples", "Highlight achievements more prominently")
+    ),
+    "Medium": (
+        "Good potential match with a score of {score}/100. Some improvements could strengthen your application.",
+        ("Some relevant skills", "Basic qualifications met"),
+        ("Missing some key skills", "Could strengthen experience section")
+    ),
+    "Low": (
+        "Score of {score}/100 indicates significant gaps. Focus on developing required skills and experience.",
+        ("Some transferable skills",),
+        ("Missing most required skills", "Limited relevant experience")
+    ),
+}
+
+_FALLBACK_SUGGESTIONS = (
+    "Add more specific examples of your achievements",
+    "Tailor your resume to highlight relevant experience",
+    "Consider taking relevant courses or certifications",
+    "Quantify your achievements with numbers and metrics",
+)
+
+# Skill categories for generate_skill_suggestions
+_LANGS = frozenset({"python", "javascript", "java", "c++"})
+_FRAMEWORKS = frozenset({"react", "angular", "vue"})
+_CLOUDS = frozenset({"aws", "azure", "gcp"})
+_ML = frozenset({"machine learning", "data science"})
+
+# Upper bound on in-flight LLM requests for generate_feedback_batch
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
+
+# Content-addressed cache of LLM responses, so re-scoring an identical
+# (resume, JD, verdict) context skips the model round trip
+FEEDBACK_CACHE_PATH = os.getenv(
+    "FEEDBACK_CACHE_PATH", os.path.join(os.getcwd(), "hirelens_feedback_cache.db")
+)
+
+# One connection per process (reopened after a fork), shared by threads under the lock
+_feedback_cache_connection: Optional[sqlite3.Connection] = None
+_feedback_cache_owner: Optional[Tuple[int, str]] = None
+_feedback_cache_lock = threading.Lock()
+
+def _feedback_cache() -> sqlite3.Connection:
+    """
+    This process's feedback cache connection, opened and set up on first use.
+    Call with _feedback_cache_lock held.
+    """
+    global _feedback_cache_connection, _feedback_cache_owner
+    owner = (os.getpid(), FEEDBACK_CACHE_PATH)
+    if _feedback_cache_owner != owner:
+        # A connection inherited through fork is abandoned rather than closed,
+        # leaving the parent's handle alone
+        if _feedback_cache_owner is not None and _feedback_cache_owner[0] == owner[0]:
+            _feedback_cache_connection.close()
+        connection = sqlite3.connect(FEEDBACK_CACHE_PATH, timeout=5, check_same_thread=False)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS feedback_cache (key TEXT PRIMARY KEY, json_blob TEXT NOT NULL)"
+        )
+        _feedback_cache_connection, _feedback_cache_owner = connection, owner
+    return _feedback_cache_connection
+
+def _load_cached_feedback(key: str) -> Optional[Dict]:
+    """Return the cached feedback for key, or None on a miss"""
+    try:
+        with _feedback_cache_lock:
+            row = _feedback_cache().execute(
+                "SELECT json_blob FROM feedback_cache WHERE key = ?", (key,)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+    except Exception as e:
+        logger.warning(f"Feedback cache lookup failed: {e}")
+        return None
+
+def _store_cached_feedback(key: str, feedback: Dict):
+    """Persist LLM feedback under key"""
+    try:
+        with _feedback_cache_lock, _feedback_cache() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO feedback_cache (key, json_blob) VALUES (?, ?)",
+                (key, orjson.dumps(feedback))
+            )
+    except Exception as e:
+        logger.warning(f"Feedback cache write failed: {e}")
+
 class FeedbackResponse(BaseModel):
     """Structured feedback response"""
     overall_feedback: str = Field(description="Overall feedback about the resume")
@@ -25,6 +138,9 @@ class FeedbackResponse(BaseModel):
     improvement_suggestions: List[str] = Field(description="List of improvement suggestions")
     verdict_explanation: str = Field(description="Explanation of why the verdict was given")
 
+_FEEDBACK_SCHEMA = FeedbackResponse.model_json_schema()
+_FEEDBACK_FIELDS = frozenset(FeedbackResponse.model_fields)
+
 class LLMFeedbackGenerator:
     """Generate feedback using LLM"""
     
@@ -37,7 +153,9 @@ class LLMFeedbackGenerator:
         """
         self.model_provider = model_provider
         self.llm = self._initialize_llm()
-        self.parser = PydanticOutputParser(pydantic_object=FeedbackResponse)
+        # Provider-side tool calling / JSON mode; binding the JSON schema rather than
+        # the model class returns plain dicts, validated only when a field is missing
+        self.structured_llm = self.llm.with_structured_output(_FEEDBACK_SCHEMA)
     
     def _initialize_llm(self):
         """Initialize the LLM based on provider"""
@@ -89,8 +207,44 @@ class LLMFeedbackGenerator:
             # Prepare context for LLM
             context = self._prepare_context(resume_data, jd_data, evaluation_results, verdict)
             
+            # Identical contexts get identical feedback; serve repeats from the cache
+            cache_key = self._cache_key(context)
+            cached = _load_cached_feedback(cache_key)
+            if cached is not None:
+                return cached
+            
             # Generate feedback using LLM
             feedback = self._generate_llm_feedback(context)
+            _store_cached_feedback(cache_key, feedback)
+            
+            return feedback
+            
+        except Exception as e:
+            logger.error(f"Error generating feedback: {e}")
+            return self._generate_fallback_feedback(evaluation_results, verdict)
+    
+    async def generate_feedback_async(
+        self,
+        resume_data: Dict,
+        jd_data: Dict,
+        evaluation_results: Dict,
+        verdict: str
+    ) -> Dict[str, any]:
+        """
+        Async variant of generate_feedback: awaits the model with ainvoke so
+        the event loop can serve other requests during the round trip
+        """
+        try:
+            context = self._prepare_context(resume_data, jd_data, evaluation_results, verdict)
+            
+            cache_key = self._cache_key(context)
+            cached = _load_cached_feedback(cache_key)
+            if cached is not None:
+                return cached
+            
+            parsed_response = await self.structured_llm.ainvoke(self._build_messages(context))
+            feedback = self._feedback_to_dict(parsed_response)
+            _store_cached_feedback(cache_key, feedback)
             
             return feedback
             
@@ -98,6 +252,70 @@ class LLMFeedbackGenerator:
             logger.error(f"Error generating feedback: {e}")
             return self._generate_fallback_feedback(evaluation_results, verdict)
     
+    async def generate_feedback_batch(
+        self,
+        items: List[Tuple[Dict, Dict, Dict, str]]
+    ) -> List[Dict[str, any]]:
+        """
+        Generate feedback for many resumes with one concurrent LLM batch
+        
+        Args:
+            items: (resume_data, jd_data, evaluation_results, verdict) tuples
+            
+        Returns:
+            Feedback dictionaries in the same order as items
+        """
+        contexts, cache_keys, feedbacks, pending = self._start_batch(items)
+        if pending:
+            # Responses are matched back by the index abatch_as_completed
+            # reports, never by arrival order, and each is cached as it lands
+            async for prompt_index, response in self.structured_llm.abatch_as_completed(
+                [self._build_messages(contexts[i]) for i in pending],
+                config={"max_concurrency": LLM_CONCURRENCY},
+                return_exceptions=True
+            ):
+                self._finish_batch_item(items, cache_keys, feedbacks, pending[prompt_index], response)
+        return feedbacks
+    
+    def generate_feedback_batch_sync(
+        self,
+        items: List[Tuple[Dict, Dict, Dict, str]]
+    ) -> List[Dict[str, any]]:
+        """
+        Blocking variant of generate_feedback_batch for callers without an
+        event loop. The requests run on a thread pool through the sync client,
+        so no event loop is created that the shared async client could outlive.
+        """
+        contexts, cache_keys, feedbacks, pending = self._start_batch(items)
+        if pending:
+            for prompt_index, response in self.structured_llm.batch_as_completed(
+                [self._build_messages(contexts[i]) for i in pending],
+                config={"max_concurrency": LLM_CONCURRENCY},
+                return_exceptions=True
+            ):
+                self._finish_batch_item(items, cache_keys, feedbacks, pending[prompt_index], response)
+        return feedbacks
+    
+    def _start_batch(self, items: List[Tuple[Dict, Dict, Dict, str]]) -> tuple:
+        """Contexts, cache keys and cached feedback for a batch, plus the indexes still to request"""
+        contexts = [self._prepare_context(*item) for item in items]
+        cache_keys = [self._cache_key(context) for context in contexts]
+        feedbacks: List[Optional[Dict]] = [_load_cached_feedback(key) for key in cache_keys]
+        pending = [i for i, feedback in enumerate(feedbacks) if feedback is None]
+        return contexts, cache_keys, feedbacks, pending
+    
+    def _finish_batch_item(self, items, cache_keys, feedbacks, i: int, response):
+        """Store the model's response for batch item i, or its fallback feedback on error"""
+        _, _, evaluation_results, verdict = items[i]
+        try:
+            if isinstance(response, Exception):
+                raise response
+            feedbacks[i] = self._feedback_to_dict(response)
+            _store_cached_feedback(cache_keys[i], feedbacks[i])
+        except Exception as e:
+            logger.error(f"Error generating feedback: {e}")
+            feedbacks[i] = self._generate_fallback_feedback(evaluation_results, verdict)
+    
     def _prepare_context(
         self, 
         resume_data: Dict, 
@@ -105,102 +323,112 @@ class LLMFeedbackGenerator:
         evaluation_results: Dict,
         verdict: str
     ) -> Dict:
-        """Prepare context for LLM feedback generation"""
+        """
+        Prepare context for LLM feedback generation
+        
+        The joined skill strings and section counts used by the prompt are
+        computed here once, so _get_human_prompt is a plain substitution
+        """
+        resume_skills = resume_data.get('skills') or []
+        resume_experience = resume_data.get('experience') or []
+        resume_education = resume_data.get('education') or []
+        resume_projects = resume_data.get('projects') or []
+        jd_required_skills = jd_data.get('skills_required') or []
+        jd_preferred_skills = jd_data.get('skills_preferred') or []
+        matched_skills = evaluation_results.get('matched_skills') or []
+        missing_skills = evaluation_results.get('missing_skills') or []
+        
         return {
-            'resume_skills': resume_data.get('skills', []),
-            'resume_experience': resume_data.get('experience', []),
-            'resume_education': resume_data.get('education', []),
-            'resume_projects': resume_data.get('projects', []),
+            'resume_skills': resume_skills,
+            'resume_experience': resume_experience,
+            'resume_education': resume_education,
+            'resume_projects': resume_projects,
             'jd_title': jd_data.get('title', ''),
-            'jd_required_skills': jd_data.get('skills_required', []),
-            'jd_preferred_skills': jd_data.get('skills_preferred', []),
+            'jd_required_skills': jd_required_skills,
+            'jd_preferred_skills': jd_preferred_skills,
             'jd_requirements': jd_data.get('requirements', []),
             'overall_score': evaluation_results.get('final_score', 0),
             'hard_match_score': evaluation_results.get('hard_match_score', 0),
             'soft_match_score': evaluation_results.get('soft_match_score', 0),
-            'matched_skills': evaluation_results.get('matched_skills', []),
-            'missing_skills': evaluation_results.get('missing_skills', []),
+            'matched_skills': matched_skills,
+            'missing_skills': missing_skills,
             'skill_coverage': evaluation_results.get('skill_coverage', 0),
-            'verdict': verdict
+            'verdict': verdict,
+            # Prompt-ready values
+            'resume_skills_str': ', '.join(resume_skills),
+            'jd_required_skills_str': ', '.join(jd_required_skills),
+            'jd_preferred_skills_str': ', '.join(jd_preferred_skills),
+            'matched_skills_str': ', '.join(matched_skills),
+            'missing_skills_str': ', '.join(missing_skills),
+            'n_experience': len(resume_experience),
+            'n_education': len(resume_education),
+            'n_projects': len(resume_projects)
         }
     
+    def _cache_key(self, context: Dict) -> str:
+        """Content hash of the provider and prompt context"""
+        payload = orjson.dumps([self.model_provider, context], option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.sha1(payload).hexdigest()
+    
     def _generate_llm_feedback(self, context: Dict) -> Dict:
-        """Generate feedback using LLM"""
-        try:
-            # Create prompt template
-            prompt = ChatPromptTemplate.from_messages([
-                SystemMessage(content=self._get_system_prompt()),
-                HumanMessage(content=self._get_human_prompt(context))
-            ])
-            
-            # Format prompt
-            formatted_prompt = prompt.format_messages()
-            
-            # Generate response
-            response = self.llm.invoke(formatted_prompt)
-            
-            # Parse response
-            parsed_response = self.parser.parse(response.content)
-            
-            return {
-                'overall_feedback': parsed_response.overall_feedback,
-                'strengths': parsed_response.strengths,
-                'weaknesses': parsed_response.weaknesses,
-                'missing_skills': parsed_response.missing_skills,
-                'improvement_suggestions': parsed_response.improvement_suggestions,
-                'verdict_explanation': parsed_response.verdict_explanation
-            }
-            
-        except Exception as e:
-            logger.error(f"Error generating LLM feedback: {e}")
-            return self._generate_fallback_feedback(context, context.get('verdict', 'Low'))
+        """
+        Generate feedback using LLM
+        
+        Errors propagate so that generate_feedback falls back without caching
+        """
+        parsed_response = self.structured_llm.invoke(self._build_messages(context))
+        return self._feedback_to_dict(parsed_response)
+    
+    def _build_messages(self, context: Dict) -> List:
+        """Chat messages for one feedback request (chat models take the list directly)"""
+        return [_SYSTEM_MSG, HumanMessage(content=self._get_human_prompt(context))]
+    
+    def _feedback_to_dict(self, data: Dict) -> Dict:
+        """Convert structured LLM output into the feedback dictionary"""
+        if _FEEDBACK_FIELDS.issubset(data):
+            # Shaped by the provider against the schema: skip re-validation
+            parsed_response = FeedbackResponse.model_construct(**data)
+        else:
+            parsed_response = FeedbackResponse.model_validate(data)
+        
+        return {
+            'overall_feedback': parsed_response.overall_feedback,
+            'strengths': parsed_response.strengths,
+            'weaknesses': parsed_response.weaknesses,
+            'missing_skills': parsed_response.missing_skills,
+            'improvement_suggestions': parsed_response.improvement_suggestions,
+            'verdict_explanation': parsed_response.verdict_explanation
+        }
     
     def _get_system_prompt(self) -> str:
         """Get system prompt for feedback generation"""
-        return """You are an expert career counselor and resume reviewer. Your task is to provide constructive, actionable feedback on resumes for job applications.
-
-Guidelines:
-1. Be constructive and encouraging, not critical
-2. Provide specific, actionable suggestions
-3. Focus on skills, experience, and qualifications relevant to the job
-4. Explain the reasoning behind the verdict
-5. Suggest concrete improvements the candidate can make
-6. Keep feedback professional and helpful
-7. Highlight both strengths and areas for improvement
-
-Format your response as structured feedback with:
-- Overall feedback (2-3 sentences)
-- List of strengths (3-5 items)
-- List of weaknesses (3-5 items)
-- Missing skills (specific skills needed)
-- Improvement suggestions (3-5 actionable items)
-- Verdict explanation (why this verdict was given)"""
+        return _SYSTEM_PROMPT
     
     def _get_human_prompt(self, context: Dict) -> str:
-        """Get human prompt with context"""
+        """Get human prompt from a context built by _prepare_context"""
         return f"""
 Please provide feedback for this resume evaluation:
 
-JOB POSITION: {context.get('jd_title', 'Not specified')}
+JOB POSITION: {context['jd_title'] or 'Not specified'}
 
-RESUME SKILLS: {', '.join(context.get('resume_skills', []))}
-RESUME EXPERIENCE: {len(context.get('resume_experience', []))} positions
-RESUME EDUCATION: {len(context.get('resume_education', []))} entries
-RESUME PROJECTS: {len(context.get('resume_projects', []))} projects
+RESUME SKILLS: {context['resume_skills_str']}
+RESUME EXPERIENCE: {context['n_experience']} positions
+RESUME EDUCATION: {context['n_education']} entries
+RESUME PROJECTS: {context['n_projects']} projects
 
 JOB REQUIREMENTS:
-- Required Skills: {', '.join(context.get('jd_required_skills', []))}
-- Preferred Skills: {', '.join(context.get('jd_preferred_skills', []))}
+- Required Skills: {context['jd_required_skills_str']}
+- Preferred Skills: {context['jd_preferred_skills_str']}
 
 EVALUATION RESULTS:
-- Overall Score: {context.get('overall_score', 0)}/100
-- Hard Match Score: {context.get('hard_match_score', 0)}/100
-- Soft Match Score: {context.get('soft_match_score', 0)}/100
-- Skill Coverage: {context.get('skill_coverage', 0)}%
-- Matched Skills: {', '.join(context.get('matched_skills', []))}
-- Missing Skills: {', '.join(context.get('missing_skills', []))}
+- Overall Score: {context['overall_score']}/100
+- Hard Match Score: {context['hard_match_score']}/100
+- Soft Match Score: {context['soft_match_score']}/100
+- Skill Coverage: {context['skill_coverage']}%
+- Matched Skills: {context['matched_skills_str']}
+- Missing Skills: {context['missing_skills_str']}
 
-VERDICT: {context.get('verdict', 'Low')}
+VERDICT: {context['verdict']}
 
 Please provide structured feedback following the format specified in the system prompt.
 """
@@ -211,30 +439,16 @@ Please provide structured feedback following the format specified in the system
         matched_skills = evaluation_results.get('matched_skills', [])
         missing_skills = evaluation_results.get('missing_skills', [])
         
-        if verdict == "High":
-            overall_feedback = f"Great match! Your resume scored {score}/100 and shows strong alignment with the job requirements."
-            strengths = ["Strong skill match", "Relevant experience", "Good qualifications"]
-            weaknesses = ["Consider adding more specific examples", "Highlight achievements more prominently"]
-        elif verdict == "Medium":
-            overall_feedback = f"Good potential match with a score of {score}/100. Some improvements could strengthen your application."
-            strengths = ["Some relevant skills", "Basic qualifications met"]
-            weaknesses = ["Missing some key skills", "Could strengthen experience section"]
-        else:
-            overall_feedback = f"Score of {score}/100 indicates significant gaps. Focus on developing required skills and experience."
-            strengths = ["Some transferable skills"]
-            weaknesses = ["Missing most required skills", "Limited relevant experience"]
+        overall_template, strengths, weaknesses = _FALLBACK_LISTS.get(verdict, _FALLBACK_LISTS["Low"])
         
         return {
-            'overall_feedback': overall_feedback,
-            'strengths': strengths,
-            'weaknesses': weaknesses,
+            'overall_feedback': overall_template.format(score=score),
+            'strengths': list(strengths),
+            'weaknesses': list(weaknesses),
             'missing_skills': missing_skills[:5],  # Top 5 missing skills
             'improvement_suggestions': [
                 f"Develop skills in: {', '.join(missing_skills[:3])}",
-                "Add more specific examples of your achievements",
-                "Tailor your resume to highlight relevant experience",
-                "Consider taking relevant courses or certifications",
-                "Quantify your achievements with numbers and metrics"
+                *_FALLBACK_SUGGESTIONS
             ],
             'verdict_explanation': f"The {verdict} verdict is based on a {score}/100 score, with {len(matched_skills)} matched skills and {len(missing_skills)} missing skills."
         }
@@ -242,17 +456,24 @@ Please provide structured feedback following the format specified in the system
     def generate_skill_suggestions(self, missing_skills: List[str], job_title: str) -> List[str]:
         """Generate specific skill development suggestions"""
         suggestions = []
+        top_missing = missing_skills[:5]  # Top 5 missing skills
         
-        for skill in missing_skills[:5]:  # Top 5 missing skills
-            if skill.lower() in ['python', 'javascript', 'java', 'c++']:
+        for skill in top_missing:
+            skill_lower = skill.lower()
+            if skill_lower in _LANGS:
                 suggestions.append(f"Learn {skill} through online courses like Codecademy, Coursera, or freeCodeCamp")
-            elif skill.lower() in ['react', 'angular', 'vue']:
+            elif skill_lower in _FRAMEWORKS:
                 suggestions.append(f"Build projects with {skill} to gain hands-on experience")
-            elif skill.lower() in ['aws', 'azure', 'gcp']:
+            elif skill_lower in _CLOUDS:
                 suggestions.append(f"Get certified in {skill} through official certification programs")
-            elif skill.lower() in ['machine learning', 'data science']:
+            elif skill_lower in _ML:
                 suggestions.append(f"Take ML courses on Coursera or edX and work on Kaggle projects")
             else:
                 suggestions.append(f"Research and practice {skill} through tutorials and projects")
         
         return suggestions
+
+@functools.lru_cache(maxsize=4)
+def get_generator(model_provider: str = "openai") -> LLMFeedbackGenerator:
+    """Shared LLMFeedbackGenerator per provider, so the client and parser are built once"""
+    return LLMFeedbackGenerator(model_provider)
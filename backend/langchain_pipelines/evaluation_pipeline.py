@@ -1,7 +1,7 @@
 """
 LangChain pipeline for resume evaluation
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 import logging
 from langchain.schema import BaseMessage, HumanMessage, SystemMessage
 from langchain.prompts import ChatPromptTemplate
@@ -10,17 +10,98 @@ from langchain.schema.runnable import RunnablePassthrough
 from langchain.schema.output_parser import StrOutputParser
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+import asyncio
+import functools
+import hashlib
 import json
+import multiprocessing
+import os
+import threading
+import numpy as np
+
+try:
+    import diskcache
+except ImportError:  # the disk level of the evaluation cache is optional
+    diskcache = None
 
 from backend.parsers.resume_parser import ResumeParser
 from backend.parsers.jd_parser import JDParser
-from backend.matchers.hard_matcher import HardMatcher
-from backend.matchers.soft_matcher import SoftMatcher
+from backend.matchers.hard_matcher import HardMatcher, JDContext
+from backend.matchers.soft_matcher import SoftMatcher, JDEmbeddings
 from backend.utils.scoring import ScoringEngine
-from backend.feedback.llm_feedback import LLMFeedbackGenerator
+from backend.feedback.llm_feedback import get_generator
+from backend.logging_config import setup_worker_logging
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever parsing, matching or scoring changes so cached evaluations go stale
+PIPELINE_VERSION = "1"
+
+# Evaluation cache: per-process LRU in front of a shared on-disk cache
+EVALUATION_MEMORY_CACHE_SIZE = 256
+EVALUATION_CACHE_DIR = os.getenv("EVALUATION_CACHE_DIR", os.path.expanduser("~/.hirelens-cache"))
+EVALUATION_CACHE_SIZE_LIMIT = 2 * 1024 ** 3  # 2 GiB, least-recently-used eviction
+
+# Batch scoring processes per pipeline. Kept small by default: every API
+# worker process owns its own pool, and each scoring process loads the models
+SCORING_WORKERS = int(os.getenv("HIRELENS_SCORING_WORKERS", "0")) or min(4, os.cpu_count() or 1)
+
+@functools.lru_cache(maxsize=1)
+def _shared_components() -> tuple:
+    """
+    Parsers, matchers and scoring engine shared by every pipeline in the
+    process, so the embedding model and vectorizers load once
+    
+    The lock serializes scoring across all pipelines that share the matchers.
+    """
+    return (
+        ResumeParser(),
+        JDParser(),
+        HardMatcher(),
+        SoftMatcher(),
+        ScoringEngine(),
+        threading.Lock()
+    )
+
+# Scorer owned by a batch scoring worker process, built once by _init_worker
+_SCORER = None
+
+def _init_worker():
+    """
+    ProcessPoolExecutor initializer: build the parsers and matchers once per
+    worker. Workers only score, so no LLM client is created (and a missing
+    API key cannot fail the pool).
+    """
+    global _SCORER
+    setup_worker_logging()
+    _SCORER = _BatchScorer()
+    # The pool already runs one process per core; FAISS and torch each
+    # default to a thread per core too, which would oversubscribe the CPU.
+    # Pinned after the scorer is built so HIRELENS_ENCODER_THREADS, applied
+    # when the encoder loads, does not undo it
+    import faiss
+    import torch
+    faiss.omp_set_num_threads(1)
+    torch.set_num_threads(1)
+
+def _score_one(args):
+    """
+    Score one resume inside a worker process
+    
+    Returns:
+        (scored, None) on success or (None, error message) on failure
+    """
+    resume_path, jd_text, jd_data, jd_context, jd_embeddings = args
+    try:
+        return _SCORER._score_resume(resume_path, jd_text, jd_data, jd_context, jd_embeddings=jd_embeddings), None
+    except Exception as e:
+        logger.error(f"Error evaluating resume {resume_path}: {e}")
+        return None, str(e)
+
 class EvaluationResult(BaseModel):
     """Structured evaluation result"""
     final_score: float = Field(description="Final score (0-100)")
@@ -32,6 +113,38 @@ class EvaluationResult(BaseModel):
     skill_coverage: float = Field(description="Skill coverage percentage")
     feedback: Dict[str, Any] = Field(description="Generated feedback")
 
+# Verdict strings <-> small integer codes for EvaluationBatch
+VERDICTS = ("Low", "Medium", "High", "Error")
+VERDICT_CODES = {verdict: code for code, verdict in enumerate(VERDICTS)}
+
+@dataclass
+class EvaluationBatch:
+    """Column-wise (structure of arrays) view of a batch of evaluation results"""
+    scores: np.ndarray  # float32 final scores
+    hard_scores: np.ndarray  # float32
+    soft_scores: np.ndarray  # float32
+    verdict_codes: np.ndarray  # int8 indexes into VERDICTS
+    
+    @classmethod
+    def from_results(cls, results: List[EvaluationResult]) -> "EvaluationBatch":
+        """Fill preallocated arrays from a list of results in one pass"""
+        n = len(results)
+        batch = cls(
+            scores=np.empty(n, dtype=np.float32),
+            hard_scores=np.empty(n, dtype=np.float32),
+            soft_scores=np.empty(n, dtype=np.float32),
+            verdict_codes=np.empty(n, dtype=np.int8)
+        )
+        for i, r in enumerate(results):
+            batch.scores[i] = r.final_score
+            batch.hard_scores[i] = r.hard_match_score
+            batch.soft_scores[i] = r.soft_match_score
+            batch.verdict_codes[i] = VERDICT_CODES[r.verdict]
+        return batch
+    
+    def __len__(self) -> int:
+        return len(self.scores)
+
 class ResumeEvaluationPipeline:
     """Main pipeline for resume evaluation using LangChain"""
     
@@ -42,12 +155,26 @@ class ResumeEvaluationPipeline:
         Args:
             model_provider: "openai" or "google" for LLM selection
         """
-        self.resume_parser = ResumeParser()
-        self.jd_parser = JDParser()
-        self.hard_matcher = HardMatcher()
-        self.soft_matcher = SoftMatcher()
-        self.scoring_engine = ScoringEngine()
-        self.feedback_generator = LLMFeedbackGenerator(model_provider)
+        self.model_provider = model_provider
+        # The matchers keep a fitted vectorizer between calls, so scoring from
+        # executor threads is serialized by the lock shared with them
+        (
+            self.resume_parser,
+            self.jd_parser,
+            self.hard_matcher,
+            self.soft_matcher,
+            self.scoring_engine,
+            self._score_lock
+        ) = _shared_components()
+        self.feedback_generator = get_generator(model_provider)
+        
+        # Cache of finished evaluations keyed by resume bytes + JD (see _cache_key)
+        self._memory_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._disk_cache = None
+        
+        # Batch scoring processes, started on the first batch that needs them
+        self._scoring_pool = None
+        self._scoring_pool_lock = threading.Lock()
         
         # Initialize LangChain components
         self._setup_langchain_components()
@@ -74,6 +201,33 @@ JOB DESCRIPTION: {jd_text}
 Provide a comprehensive evaluation including scores, verdict, and feedback.""")
         ])
     
+    def warm_up(self):
+        """
+        Run the parsers and matchers once on a tiny fixed input so that model
+        weights and vectorizers are loaded before the first real request
+        """
+        jd_text = "Python developer\nRequired: python, sql, docker"
+        resume_text = "Experience with Python, SQL and Docker"
+        jd_data = self.jd_parser.parse_jd(jd_text)
+        resume_skills = ['Python', 'Sql', 'Docker']
+        
+        with self._score_lock:
+            self.hard_matcher.calculate_hard_match_score(
+                resume_text=resume_text,
+                jd_text=jd_text,
+                resume_skills=resume_skills,
+                jd_required_skills=jd_data['skills_required'],
+                jd_preferred_skills=jd_data['skills_preferred']
+            )
+            self.soft_matcher.calculate_soft_match_score(
+                resume_text=resume_text,
+                jd_text=jd_text,
+                resume_skills=resume_skills,
+                jd_required_skills=jd_data['skills_required'],
+                jd_preferred_skills=jd_data['skills_preferred']
+            )
+        logger.info("Evaluation pipeline warmed up")
+    
     def evaluate_resume(
         self, 
         resume_file_path: str, 
@@ -94,94 +248,74 @@ Provide a comprehensive evaluation including scores, verdict, and feedback.""")
             EvaluationResult with comprehensive evaluation
         """
         try:
-            logger.info(f"Starting evaluation for resume: {resume_file_path}")
-            
-            # Step 1: Parse resume
-            resume_data = self.resume_parser.parse_file(resume_file_path)
-            logger.info("Resume parsed successfully")
-            
-            # Step 2: Parse job description
-            jd_data = self.jd_parser.parse_jd(jd_text)
-            if jd_title:
-                jd_data['title'] = jd_title
-            if jd_company:
-                jd_data['company'] = jd_company
-            logger.info("Job description parsed successfully")
+            # Read the resume once; the same bytes feed the cache key and the parser
+            resume_bytes = Path(resume_file_path).read_bytes()
+            cache_key = self._cache_key(resume_bytes, jd_text, jd_title, jd_company)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info(f"Evaluation cache hit for {resume_file_path}")
+                return cached
             
-            # Step 3: Perform hard matching
-            hard_match_results = self.hard_matcher.calculate_hard_match_score(
-                resume_text=resume_data['raw_text'],
-                jd_text=jd_text,
-                resume_skills=resume_data['skills'],
-                jd_required_skills=jd_data['skills_required'],
-                jd_preferred_skills=jd_data['skills_preferred']
-            )
-            logger.info(f"Hard matching completed: {hard_match_results['overall_score']}")
-            
-            # Step 4: Perform soft matching
-            soft_match_results = self.soft_matcher.calculate_soft_match_score(
-                resume_text=resume_data['raw_text'],
-                jd_text=jd_text,
-                resume_skills=resume_data['skills'],
-                jd_required_skills=jd_data['skills_required'],
-                jd_preferred_skills=jd_data['skills_preferred']
+            jd_data, scored = self._parse_and_score_locked(
+                resume_file_path, jd_text, jd_title, jd_company, resume_bytes
             )
-            logger.info(f"Soft matching completed: {soft_match_results['overall_score']}")
             
-            # Step 5: Calculate final score
-            final_score_results = self.scoring_engine.calculate_final_score(
-                hard_match_score=hard_match_results['overall_score'],
-                soft_match_score=soft_match_results['overall_score']
+            # Step 8: Generate feedback
+            feedback = self.feedback_generator.generate_feedback(
+                resume_data=scored['resume_data'],
+                jd_data=jd_data,
+                evaluation_results=scored['evaluation_context'],
+                verdict=scored['verdict']
             )
-            logger.info(f"Final score calculated: {final_score_results['final_score']}")
+            logger.info("Feedback generated successfully")
             
-            # Step 6: Determine verdict
-            verdict = self.scoring_engine.determine_verdict(final_score_results['final_score'])
-            logger.info(f"Verdict determined: {verdict}")
+            result = self._build_result(scored, feedback)
+            self._cache_put(cache_key, result)
+            logger.info(f"Evaluation completed successfully for {resume_file_path}")
+            return result
             
-            # Step 7: Calculate skill coverage and matches
-            skill_coverage = self.scoring_engine.calculate_skill_coverage(
-                resume_skills=resume_data['skills'],
-                jd_required_skills=jd_data['skills_required'],
-                jd_preferred_skills=jd_data['skills_preferred']
-            )
+        except Exception as e:
+            logger.error(f"Error in resume evaluation: {e}")
+            raise
+    
+    async def evaluate_resume_async(
+        self, 
+        resume_file_path: str, 
+        jd_text: str,
+        jd_title: str = "",
+        jd_company: str = ""
+    ) -> EvaluationResult:
+        """
+        Async variant of evaluate_resume for event-loop callers
+        
+        Parsing and matching run in the default executor and the LLM feedback
+        is awaited, so one request's model round trip overlaps other requests'
+        CPU work instead of blocking the loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            resume_bytes = await loop.run_in_executor(None, Path(resume_file_path).read_bytes)
+            cache_key = self._cache_key(resume_bytes, jd_text, jd_title, jd_company)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info(f"Evaluation cache hit for {resume_file_path}")
+                return cached
             
-            skill_matches = self.scoring_engine.get_matched_skills(
-                resume_skills=resume_data['skills'],
-                jd_required_skills=jd_data['skills_required'],
-                jd_preferred_skills=jd_data['skills_preferred']
+            jd_data, scored = await loop.run_in_executor(
+                None, self._parse_and_score_locked, resume_file_path, jd_text, jd_title, jd_company, resume_bytes
             )
             
             # Step 8: Generate feedback
-            evaluation_context = {
-                'final_score': final_score_results['final_score'],
-                'hard_match_score': hard_match_results['overall_score'],
-                'soft_match_score': soft_match_results['overall_score'],
-                'matched_skills': skill_matches['all_matched'],
-                'missing_skills': skill_matches['all_missing'],
-                'skill_coverage': skill_coverage['overall_coverage']
-            }
-            
-            feedback = self.feedback_generator.generate_feedback(
-                resume_data=resume_data,
+            feedback = await self.feedback_generator.generate_feedback_async(
+                resume_data=scored['resume_data'],
                 jd_data=jd_data,
-                evaluation_results=evaluation_context,
-                verdict=verdict
+                evaluation_results=scored['evaluation_context'],
+                verdict=scored['verdict']
             )
             logger.info("Feedback generated successfully")
             
-            # Step 9: Create final result
-            result = EvaluationResult(
-                final_score=final_score_results['final_score'],
-                verdict=verdict,
-                hard_match_score=hard_match_results['overall_score'],
-                soft_match_score=soft_match_results['overall_score'],
-                matched_skills=skill_matches['all_matched'],
-                missing_skills=skill_matches['all_missing'],
-                skill_coverage=skill_coverage['overall_coverage'],
-                feedback=feedback
-            )
-            
+            result = self._build_result(scored, feedback)
+            self._cache_put(cache_key, result)
             logger.info(f"Evaluation completed successfully for {resume_file_path}")
             return result
             
@@ -189,84 +323,462 @@ Provide a comprehensive evaluation including scores, verdict, and feedback.""")
             logger.error(f"Error in resume evaluation: {e}")
             raise
     
+    def _cache_key(self, resume_bytes: bytes, jd_text: str, jd_title: str = "", jd_company: str = "") -> str:
+        """blake2b of the resume bytes, the JD inputs and PIPELINE_VERSION"""
+        resume_hash = hashlib.blake2b(resume_bytes, digest_size=16).hexdigest()
+        jd_hash = hashlib.blake2b(
+            json.dumps([jd_text, jd_title, jd_company, self.model_provider, PIPELINE_VERSION]).encode(),
+            digest_size=16
+        ).hexdigest()
+        return resume_hash + jd_hash
+    
+    def _get_disk_cache(self):
+        """Open the on-disk evaluation cache on first use (None without diskcache)"""
+        if self._disk_cache is None and diskcache is not None:
+            try:
+                self._disk_cache = diskcache.Cache(
+                    EVALUATION_CACHE_DIR,
+                    size_limit=EVALUATION_CACHE_SIZE_LIMIT,
+                    eviction_policy='least-recently-used'
+                )
+            except Exception as e:
+                logger.warning(f"Evaluation disk cache unavailable: {e}")
+        return self._disk_cache
+    
+    def _cache_get(self, key: str) -> Optional[EvaluationResult]:
+        """Look an evaluation up in memory, then on disk"""
+        payload = self._memory_cache.get(key)
+        if payload is not None:
+            self._memory_cache.move_to_end(key)
+        else:
+            disk_cache = self._get_disk_cache()
+            if disk_cache is None:
+                return None
+            try:
+                payload = disk_cache.get(key)
+            except Exception as e:
+                logger.warning(f"Evaluation cache lookup failed: {e}")
+                return None
+            if payload is None:
+                return None
+            self._remember(key, payload)
+        return EvaluationResult.model_validate_json(payload)
+    
+    def _cache_put(self, key: str, result: EvaluationResult):
+        """Store a finished evaluation in both cache levels"""
+        payload = result.model_dump_json()
+        self._remember(key, payload)
+        disk_cache = self._get_disk_cache()
+        if disk_cache is not None:
+            try:
+                disk_cache.set(key, payload)
+            except Exception as e:
+                logger.warning(f"Evaluation cache write failed: {e}")
+    
+    def _remember(self, key: str, payload: str):
+        """Insert into the in-memory LRU, evicting the oldest entry when full"""
+        self._memory_cache[key] = payload
+        self._memory_cache.move_to_end(key)
+        if len(self._memory_cache) > EVALUATION_MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Drop every cached evaluation, in memory and on disk"""
+        self._memory_cache.clear()
+        disk_cache = self._get_disk_cache()
+        if disk_cache is not None:
+            disk_cache.clear()
+    
+    def _parse_and_score_locked(
+        self,
+        resume_file_path: str,
+        jd_text: str,
+        jd_title: str,
+        jd_company: str,
+        resume_bytes: Optional[bytes] = None
+    ) -> tuple:
+        """Steps 1-7 under the scoring lock, which the shared matchers need across threads"""
+        with self._score_lock:
+            jd_data = self._parse_jd(jd_text, jd_title, jd_company)
+            return jd_data, self._score_resume(resume_file_path, jd_text, jd_data, resume_bytes=resume_bytes)
+    
+    def _parse_jd(self, jd_text: str, jd_title: str = "", jd_company: str = "") -> Dict[str, Any]:
+        """Parse the job description and apply the optional title/company overrides"""
+        jd_data = self.jd_parser.parse_jd(jd_text)
+        if jd_title:
+            jd_data['title'] = jd_title
+        if jd_company:
+            jd_data['company'] = jd_company
+        logger.info("Job description parsed successfully")
+        return jd_data
+    
+    def _score_resume(
+        self,
+        resume_file_path: str,
+        jd_text: str,
+        jd_data: Dict[str, Any],
+        jd_context: Optional[JDContext] = None,
+        resume_bytes: Optional[bytes] = None,
+        jd_embeddings: Optional[JDEmbeddings] = None
+    ) -> Dict[str, Any]:
+        """
+        Parse, match and score one resume (everything short of LLM feedback)
+        
+        Batch callers pass the JD's precomputed hard-matching context and
+        soft-matching embeddings; callers that already read the file pass its
+        bytes so it is not opened again
+        
+        Returns:
+            Dictionary with resume_data, verdict and the evaluation_context used for feedback
+        """
+        logger.info(f"Starting evaluation for resume: {resume_file_path}")
+        
+        # Step 1: Parse resume
+        resume_data = self.resume_parser.parse_file(resume_file_path, data=resume_bytes)
+        if not resume_data['raw_text'].strip():
+            # Nothing to match or give feedback on; fail before the matchers and the LLM
+            raise ValueError(f"No text could be extracted from resume: {resume_file_path}")
+        logger.info("Resume parsed successfully")
+        
+        # Step 3: Perform hard matching
+        hard_match_results = self.hard_matcher.calculate_hard_match_score(
+            resume_text=resume_data['raw_text'],
+            jd_text=jd_text,
+            resume_skills=resume_data['skills'],
+            jd_required_skills=jd_data['skills_required'],
+            jd_preferred_skills=jd_data['skills_preferred'],
+            jd_context=jd_context
+        )
+        logger.info(f"Hard matching completed: {hard_match_results['overall_score']}")
+        
+        # Step 4: Perform soft matching
+        soft_match_results = self.soft_matcher.calculate_soft_match_score(
+            resume_text=resume_data['raw_text'],
+            jd_text=jd_text,
+            resume_skills=resume_data['skills'],
+            jd_required_skills=jd_data['skills_required'],
+            jd_preferred_skills=jd_data['skills_preferred'],
+            jd_embeddings=jd_embeddings
+        )
+        logger.info(f"Soft matching completed: {soft_match_results['overall_score']}")
+        
+        # Step 5: Calculate final score
+        final_score_results = self.scoring_engine.calculate_final_score(
+            hard_match_score=hard_match_results['overall_score'],
+            soft_match_score=soft_match_results['overall_score']
+        )
+        logger.info(f"Final score calculated: {final_score_results['final_score']}")
+        
+        # Step 6: Determine verdict
+        verdict = self.scoring_engine.determine_verdict(final_score_results['final_score'])
+        logger.info(f"Verdict determined: {verdict}")
+        
+        # Step 7: Calculate skill coverage and matches
+        skill_coverage = self.scoring_engine.calculate_skill_coverage(
+            resume_skills=resume_data['skills'],
+            jd_required_skills=jd_data['skills_required'],
+            jd_preferred_skills=jd_data['skills_preferred']
+        )
+        
+        skill_matches = self.scoring_engine.get_matched_skills(
+            resume_skills=resume_data['skills'],
+            jd_required_skills=jd_data['skills_required'],
+            jd_preferred_skills=jd_data['skills_preferred']
+        )
+        
+        evaluation_context = {
+            'final_score': final_score_results['final_score'],
+            'hard_match_score': hard_match_results['overall_score'],
+            'soft_match_score': soft_match_results['overall_score'],
+            'matched_skills': skill_matches['all_matched'],
+            'missing_skills': skill_matches['all_missing'],
+            'skill_coverage': skill_coverage['overall_coverage']
+        }
+        
+        return {
+            'resume_data': resume_data,
+            'verdict': verdict,
+            'evaluation_context': evaluation_context
+        }
+    
+    def _build_result(self, scored: Dict[str, Any], feedback: Dict[str, Any]) -> EvaluationResult:
+        """
+        Step 9: Create final result
+        
+        Every field was computed here, so validation is skipped; the scores
+        are cast explicitly since matchers may hand back NumPy scalars.
+        """
+        evaluation_context = scored['evaluation_context']
+        return EvaluationResult.model_construct(
+            final_score=float(evaluation_context['final_score']),
+            verdict=scored['verdict'],
+            hard_match_score=float(evaluation_context['hard_match_score']),
+            soft_match_score=float(evaluation_context['soft_match_score']),
+            matched_skills=evaluation_context['matched_skills'],
+            missing_skills=evaluation_context['missing_skills'],
+            skill_coverage=float(evaluation_context['skill_coverage']),
+            feedback=feedback
+        )
+    
+    def _error_result(self, error: Exception) -> EvaluationResult:
+        """Placeholder result for a resume that could not be evaluated"""
+        return EvaluationResult.model_construct(
+            final_score=0.0,
+            verdict="Error",
+            hard_match_score=0.0,
+            soft_match_score=0.0,
+            matched_skills=[],
+            missing_skills=[],
+            skill_coverage=0.0,
+            feedback={
+                'overall_feedback': f"Error evaluating resume: {str(error)}",
+                'strengths': [],
+                'weaknesses': ["Error in processing"],
+                'missing_skills': [],
+                'improvement_suggestions': ["Please check file format and try again"],
+                'verdict_explanation': "Error occurred during evaluation"
+            }
+        )
+    
     def batch_evaluate_resumes(
         self, 
         resume_file_paths: List[str], 
         jd_text: str,
         jd_title: str = "",
-        jd_company: str = ""
-    ) -> List[EvaluationResult]:
+        jd_company: str = "",
+        return_batch: bool = False
+    ) -> Union[List[EvaluationResult], Tuple[List[EvaluationResult], EvaluationBatch]]:
         """
         Evaluate multiple resumes against a job description
         
+        The job description is parsed once, resumes are scored in parallel
+        across a process pool, and the LLM feedback for all of them is then
+        requested as one concurrent batch.
+        
         Args:
             resume_file_paths: List of resume file paths
             jd_text: Job description text
             jd_title: Job title (optional)
             jd_company: Company name (optional)
+            return_batch: Also return the results as an EvaluationBatch
             
         Returns:
-            List of EvaluationResult objects
+            List of EvaluationResult objects, plus their EvaluationBatch if requested
+        """
+        results, cache_keys, jd_data, scored_items = self._batch_score(
+            resume_file_paths, jd_text, jd_title, jd_company
+        )
+        if scored_items:
+            feedbacks = self.feedback_generator.generate_feedback_batch_sync(
+                self._feedback_items(jd_data, scored_items)
+            )
+            self._finish_batch(results, cache_keys, scored_items, feedbacks)
+        if return_batch:
+            return results, EvaluationBatch.from_results(results)
+        return results
+    
+    async def abatch_evaluate_resumes(
+        self,
+        resume_file_paths: List[str],
+        jd_text: str,
+        jd_title: str = "",
+        jd_company: str = ""
+    ) -> List[EvaluationResult]:
         """
-        results = []
+        Async variant of batch_evaluate_resumes for event-loop callers
         
+        Scoring runs in the default executor and the feedback batch is awaited
+        on the caller's loop, the one the shared LLM client's async transport
+        belongs to.
+        """
+        loop = asyncio.get_running_loop()
+        results, cache_keys, jd_data, scored_items = await loop.run_in_executor(
+            None, self._batch_score, resume_file_paths, jd_text, jd_title, jd_company
+        )
+        if scored_items:
+            feedbacks = await self.feedback_generator.generate_feedback_batch(
+                self._feedback_items(jd_data, scored_items)
+            )
+            self._finish_batch(results, cache_keys, scored_items, feedbacks)
+        return results
+    
+    def _batch_score(
+        self,
+        resume_file_paths: List[str],
+        jd_text: str,
+        jd_title: str,
+        jd_company: str
+    ) -> tuple:
+        """
+        Everything in a batch evaluation short of LLM feedback
+        
+        Returns:
+            (results, cache_keys, jd_data, scored_items): results holds cache
+            hits and error results, with None where scored_items, a list of
+            (index, scored) pairs, still needs feedback
+        """
+        results: List[Optional[EvaluationResult]] = [None] * len(resume_file_paths)
+        cache_keys: List[Optional[str]] = [None] * len(resume_file_paths)
+        
+        # Serve repeats from the cache; only misses are parsed and scored
         for i, resume_path in enumerate(resume_file_paths):
             try:
-                logger.info(f"Evaluating resume {i+1}/{len(resume_file_paths)}: {resume_path}")
-                result = self.evaluate_resume(resume_path, jd_text, jd_title, jd_company)
-                results.append(result)
+                cache_keys[i] = self._cache_key(Path(resume_path).read_bytes(), jd_text, jd_title, jd_company)
+                results[i] = self._cache_get(cache_keys[i])
             except Exception as e:
                 logger.error(f"Error evaluating resume {resume_path}: {e}")
-                # Create error result
-                error_result = EvaluationResult(
-                    final_score=0.0,
-                    verdict="Error",
-                    hard_match_score=0.0,
-                    soft_match_score=0.0,
-                    matched_skills=[],
-                    missing_skills=[],
-                    skill_coverage=0.0,
-                    feedback={
-                        'overall_feedback': f"Error evaluating resume: {str(e)}",
-                        'strengths': [],
-                        'weaknesses': ["Error in processing"],
-                        'missing_skills': [],
-                        'improvement_suggestions': ["Please check file format and try again"],
-                        'verdict_explanation': "Error occurred during evaluation"
-                    }
+                results[i] = self._error_result(e)
+        
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results, cache_keys, None, []
+        
+        try:
+            with self._score_lock:
+                jd_data = self._parse_jd(jd_text, jd_title, jd_company)
+                jd_context = self.hard_matcher.prepare_jd(
+                    jd_text, jd_data['skills_required'], jd_data['skills_preferred']
                 )
-                results.append(error_result)
+                jd_embeddings = self.soft_matcher.prepare_jd(
+                    jd_text, jd_data['skills_required'], jd_data['skills_preferred']
+                )
+        except Exception as e:
+            logger.error(f"Error parsing job description: {e}")
+            for i in misses:
+                results[i] = self._error_result(e)
+            return results, cache_keys, None, []
         
-        return results
+        scored_items = []
+        miss_paths = [resume_file_paths[i] for i in misses]
+        scored_results = self._score_resumes(miss_paths, jd_text, jd_data, jd_context, jd_embeddings)
+        for i, (scored, error) in zip(misses, scored_results):
+            if error is None:
+                scored_items.append((i, scored))
+            else:
+                results[i] = self._error_result(Exception(error))
+        
+        return results, cache_keys, jd_data, scored_items
+    
+    def _feedback_items(self, jd_data: Dict[str, Any], scored_items: List[tuple]) -> List[tuple]:
+        """Step 8 inputs for generate_feedback_batch, one per scored resume"""
+        return [
+            (scored['resume_data'], jd_data, scored['evaluation_context'], scored['verdict'])
+            for _, scored in scored_items
+        ]
     
-    def get_evaluation_summary(self, results: List[EvaluationResult]) -> Dict[str, Any]:
+    def _finish_batch(self, results, cache_keys, scored_items, feedbacks):
+        """Step 9 for a batch: fill in and cache the results of the scored resumes"""
+        for (i, scored), feedback in zip(scored_items, feedbacks):
+            results[i] = self._build_result(scored, feedback)
+            self._cache_put(cache_keys[i], results[i])
+    
+    def _score_resumes(
+        self,
+        resume_file_paths: List[str],
+        jd_text: str,
+        jd_data: Dict[str, Any],
+        jd_context: Optional[JDContext] = None,
+        jd_embeddings: Optional[JDEmbeddings] = None
+    ) -> List[tuple]:
+        """
+        Score resumes in input order, fanning out across the scoring pool
+        
+        Returns:
+            (scored, error message) pairs, one per resume
+        """
+        # A single resume is not worth a round trip through the pool
+        if len(resume_file_paths) <= 1:
+            scored_results = []
+            for resume_path in resume_file_paths:
+                try:
+                    with self._score_lock:
+                        scored = self._score_resume(
+                            resume_path, jd_text, jd_data, jd_context, jd_embeddings=jd_embeddings
+                        )
+                    scored_results.append((scored, None))
+                except Exception as e:
+                    logger.error(f"Error evaluating resume {resume_path}: {e}")
+                    scored_results.append((None, str(e)))
+            return scored_results
+        
+        n_workers = min(SCORING_WORKERS, len(resume_file_paths))
+        chunksize = max(1, len(resume_file_paths) // (4 * n_workers))
+        logger.info(f"Scoring {len(resume_file_paths)} resumes across {n_workers} processes")
+        
+        scored_results = []
+        try:
+            for scored_result in self._get_scoring_pool().map(
+                _score_one,
+                [
+                    (resume_path, jd_text, jd_data, jd_context, jd_embeddings)
+                    for resume_path in resume_file_paths
+                ],
+                chunksize=chunksize
+            ):
+                scored_results.append(scored_result)
+        except Exception as e:
+            # Typically BrokenProcessPool (a worker failed to start or died):
+            # drop the pool so the next batch starts a fresh one, and report
+            # the resumes without a result as errors rather than failing the batch
+            logger.error(f"Batch scoring pool failed: {e}")
+            self.shutdown()
+            scored_results.extend((None, str(e)) for _ in resume_file_paths[len(scored_results):])
+        return scored_results
+    
+    def _get_scoring_pool(self) -> ProcessPoolExecutor:
+        """
+        Start the batch scoring pool on first use. Workers come from a
+        forkserver (spawn where unavailable) rather than a fork of this
+        process, which may already be running torch and FAISS threads.
+        """
+        with self._scoring_pool_lock:
+            if self._scoring_pool is None:
+                start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._scoring_pool = ProcessPoolExecutor(
+                    max_workers=SCORING_WORKERS,
+                    mp_context=multiprocessing.get_context(start_method),
+                    initializer=_init_worker
+                )
+            return self._scoring_pool
+    
+    def shutdown(self):
+        """Stop the batch scoring pool, if one was started"""
+        with self._scoring_pool_lock:
+            if self._scoring_pool is not None:
+                self._scoring_pool.shutdown(wait=False, cancel_futures=True)
+                self._scoring_pool = None
+    
+    def get_evaluation_summary(
+        self,
+        results: Union[List[EvaluationResult], EvaluationBatch]
+    ) -> Dict[str, Any]:
         """
         Get summary statistics for batch evaluation results
         
         Args:
-            results: List of evaluation results
+            results: List of evaluation results, or their EvaluationBatch
             
         Returns:
             Dictionary with summary statistics
         """
-        if not results:
+        if not len(results):
             return {}
         
-        scores = [r.final_score for r in results]
-        verdicts = [r.verdict for r in results]
-        
-        # Calculate statistics
-        avg_score = sum(scores) / len(scores)
-        max_score = max(scores)
-        min_score = min(scores)
+        batch = results if isinstance(results, EvaluationBatch) else EvaluationBatch.from_results(results)
         
-        # Count verdicts
-        verdict_counts = {}
-        for verdict in verdicts:
-            verdict_counts[verdict] = verdict_counts.get(verdict, 0) + 1
+        # Vectorized score statistics and verdict counts over the columns
+        total = len(batch)
+        avg_score = float(batch.scores.mean(dtype=np.float64))
+        max_score = float(batch.scores.max())
+        min_score = float(batch.scores.min())
+        counts = np.bincount(batch.verdict_codes, minlength=len(VERDICTS))
+        verdict_counts = {
+            VERDICTS[code]: int(count)
+            for code, count in enumerate(counts)
+            if count
+        }
         
         # Calculate percentages
-        total = len(results)
         verdict_percentages = {
             verdict: (count / total) * 100 
             for verdict, count in verdict_counts.items()
@@ -283,3 +795,21 @@ Provide a comprehensive evaluation including scores, verdict, and feedback.""")
             'medium_fit_count': verdict_counts.get('Medium', 0),
             'low_fit_count': verdict_counts.get('Low', 0)
         }
+
+class _BatchScorer:
+    """
+    The parsing and scoring half of ResumeEvaluationPipeline, for batch
+    scoring workers that never request LLM feedback
+    """
+    
+    def __init__(self):
+        (
+            self.resume_parser,
+            self.jd_parser,
+            self.hard_matcher,
+            self.soft_matcher,
+            self.scoring_engine,
+            self._score_lock
+        ) = _shared_components()
+    
+    _score_resume = ResumeEvaluationPipeline._score_resume
@@ -0,0 +1,51 @@
+"""
+Logging setup for HireLens
+Records are queued and written by a background thread, so request handlers never block on stderr
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+_listener = None
+
+def _stream_handler() -> logging.Handler:
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    return handler
+
+def setup_worker_logging():
+    """
+    Write a child process's records straight to stderr. A forked worker
+    inherits the QueueHandler but not the listener thread draining it, so
+    anything it logged through the queue would never be written; a spawned
+    worker starts with no handlers at all.
+    """
+    root = logging.getLogger()
+    if not root.handlers or any(isinstance(handler, logging.handlers.QueueHandler) for handler in root.handlers):
+        root.handlers = [_stream_handler()]
+
+def setup_logging(level: int = logging.INFO):
+    """Route the root logger through a QueueHandler drained by a QueueListener thread"""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(log_queue, _stream_handler(), respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    if hasattr(os, "register_at_fork"):  # not available on Windows, which never forks
+        os.register_at_fork(after_in_child=setup_worker_logging)
+
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+    # Let server loggers flow through the same queue instead of their own stream handlers
+    for name in ("uvicorn", "uvicorn.error", "fastapi"):
+        server_logger = logging.getLogger(name)
+        server_logger.handlers = []
+        server_logger.propagate = True
@@ -2,15 +2,36 @@
 Hard matching algorithms for resume-JD comparison
 """
 import re
-from typing import List, Dict, Tuple
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
 from sklearn.feature_extraction.text import TfidfVectorizer
-from rank_bm25 import BM25Okapi
-from rapidfuzz import fuzz, process
+from rapidfuzz import fuzz
+from rapidfuzz.process import cdist
 import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Any run of characters that are not letters/digits/underscore: punctuation
+# and whitespace collapse to a single space in one substitution
+_NON_WORD_RUN = re.compile(r'[^\w]+')
+_SENT_SPLIT = re.compile(r'[.!?]+')
+
+def _pre_analyzed(terms: List[str]) -> List[str]:
+    """Identity analyzer for documents that were already run through the TF-IDF analyzer"""
+    return terms
+
+@dataclass
+class JDContext:
+    """Job-description side of hard matching, computed once and reused across resumes"""
+    jd_clean: str
+    jd_tfidf_terms: List[str]
+    jd_term_counts: Counter
+    jd_phrases: List[str]
+    jd_required_lower: List[str]
+    jd_preferred_lower: List[str]
+
 class HardMatcher:
     """Hard matching using TF-IDF, BM25, and Fuzzy matching"""
     
@@ -18,7 +39,16 @@ class HardMatcher:
         self.tfidf_vectorizer = TfidfVectorizer(
             stop_words='english',
             ngram_range=(1, 2),
-            max_features=1000
+            max_features=1000,
+            dtype=np.float32
+        )
+        # Stop-word removal and 1-2 gram generation of the vectorizer above,
+        # applied ahead of time so the JD is analyzed once per JD, not per resume
+        self.tfidf_analyzer = self.tfidf_vectorizer.build_analyzer()
+        self.pre_analyzed_vectorizer = TfidfVectorizer(
+            analyzer=_pre_analyzed,
+            max_features=1000,
+            dtype=np.float32
         )
     
     def calculate_hard_match_score(
@@ -27,7 +57,8 @@ class HardMatcher:
         jd_text: str,
         resume_skills: List[str],
         jd_required_skills: List[str],
-        jd_preferred_skills: List[str] = None
+        jd_preferred_skills: List[str] = None,
+        jd_context: Optional[JDContext] = None
     ) -> Dict[str, float]:
         """
         Calculate hard match score using multiple algorithms
@@ -38,6 +69,7 @@ class HardMatcher:
             resume_skills: List of skills from resume
             jd_required_skills: List of required skills from JD
             jd_preferred_skills: List of preferred skills from JD
+            jd_context: Result of prepare_jd() for this JD, to skip re-deriving it
             
         Returns:
             Dictionary with scores and details
@@ -45,14 +77,6 @@ class HardMatcher:
         if jd_preferred_skills is None:
             jd_preferred_skills = []
         
-        # Calculate different types of scores
-        tfidf_score = self._calculate_tfidf_score(resume_text, jd_text)
-        bm25_score = self._calculate_bm25_score(resume_text, jd_text)
-        skill_match_score = self._calculate_skill_match_score(
-            resume_skills, jd_required_skills, jd_preferred_skills
-        )
-        fuzzy_score = self._calculate_fuzzy_score(resume_text, jd_text)
-        
         # Weighted combination of scores
         weights = {
             'tfidf': 0.25,
@@ -61,6 +85,32 @@ class HardMatcher:
             'fuzzy': 0.15
         }
         
+        # Nothing to compare against (e.g. a resume that failed to parse):
+        # skip the TF-IDF fit, BM25 and phrase extraction entirely
+        if not (resume_text and resume_text.strip()) or not (jd_text and jd_text.strip()):
+            return {
+                'overall_score': 0.0,
+                'tfidf_score': 0.0,
+                'bm25_score': 0.0,
+                'skill_match_score': 0.0,
+                'fuzzy_score': 0.0,
+                'weights': weights
+            }
+        
+        if jd_context is None:
+            jd_context = self.prepare_jd(jd_text, jd_required_skills, jd_preferred_skills)
+        
+        # Clean the resume once; its tokens are the words of the cleaned text
+        resume_clean = self._preprocess_text(resume_text)
+        
+        # Calculate different types of scores
+        tfidf_score = self._calculate_tfidf_score(resume_clean, jd_context)
+        bm25_score = self._calculate_bm25_score(resume_clean.split(), jd_context.jd_term_counts)
+        skill_match_score = self._calculate_skill_match_score(
+            resume_skills, jd_context.jd_required_lower, jd_context.jd_preferred_lower
+        )
+        fuzzy_score = self._calculate_fuzzy_score(resume_text, jd_context.jd_phrases)
+        
         overall_score = (
             tfidf_score * weights['tfidf'] +
             bm25_score * weights['bm25'] +
@@ -77,25 +127,43 @@ class HardMatcher:
             'weights': weights
         }
     
-    def _calculate_tfidf_score(self, resume_text: str, jd_text: str) -> float:
-        """Calculate TF-IDF similarity score"""
+    def prepare_jd(
+        self,
+        jd_text: str,
+        jd_required_skills: List[str],
+        jd_preferred_skills: List[str] = None
+    ) -> JDContext:
+        """
+        Preprocess the JD once so a batch of resumes can share it
+        
+        The JD's TF-IDF terms are analyzed here, but the model is still fit
+        per resume: vocabulary, max_features and IDF all come from the
+        (resume, JD) pair, so a JD-only fit would change scores.
+        """
+        jd_clean = self._preprocess_text(jd_text)
+        return JDContext(
+            jd_clean=jd_clean,
+            jd_tfidf_terms=self.tfidf_analyzer(jd_clean),
+            jd_term_counts=Counter(jd_clean.split()),
+            jd_phrases=self._extract_key_phrases(jd_text),
+            jd_required_lower=[skill.lower().strip() for skill in jd_required_skills],
+            jd_preferred_lower=[skill.lower().strip() for skill in jd_preferred_skills or []]
+        )
+    
+    def _calculate_tfidf_score(self, resume_clean: str, jd_context: JDContext) -> float:
+        """Calculate TF-IDF similarity score between a preprocessed resume and JD"""
         try:
-            # Clean and preprocess texts
-            resume_clean = self._preprocess_text(resume_text)
-            jd_clean = self._preprocess_text(jd_text)
-            
-            if not resume_clean or not jd_clean:
+            if not resume_clean or not jd_context.jd_clean:
                 return 0.0
             
-            # Create TF-IDF vectors
-            corpus = [resume_clean, jd_clean]
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform(corpus)
+            # Create TF-IDF vectors from analyzed terms; identical to fitting
+            # tfidf_vectorizer on the two texts, minus re-analyzing the JD
+            corpus = [self.tfidf_analyzer(resume_clean), jd_context.jd_tfidf_terms]
+            tfidf_matrix = self.pre_analyzed_vectorizer.fit_transform(corpus)
             
-            # Calculate cosine similarity
-            similarity = self._cosine_similarity(
-                tfidf_matrix[0].toarray().flatten(),
-                tfidf_matrix[1].toarray().flatten()
-            )
+            # Rows are L2-normalized by the vectorizer, so the sparse dot
+            # product is the cosine similarity
+            similarity = float((tfidf_matrix[0] @ tfidf_matrix[1].T).toarray()[0, 0])
             
             return similarity * 100  # Convert to 0-100 scale
             
@@ -103,60 +171,58 @@ class HardMatcher:
             logger.error(f"Error calculating TF-IDF score: {e}")
             return 0.0
     
-    def _calculate_bm25_score(self, resume_text: str, jd_text: str) -> float:
-        """Calculate BM25 similarity score"""
+    def _calculate_bm25_score(self, resume_tokens: List[str], jd_term_counts: Counter) -> float:
+        """Calculate BM25 similarity score of the resume's terms against the JD"""
         try:
-            # Tokenize texts
-            resume_tokens = self._tokenize_text(resume_text)
-            jd_tokens = self._tokenize_text(jd_text)
+            query_terms = set(resume_tokens)
             
-            if not resume_tokens or not jd_tokens:
+            if not query_terms or not jd_term_counts:
                 return 0.0
             
-            # Create BM25 index
-            corpus = [resume_tokens, jd_tokens]
-            bm25 = BM25Okapi(corpus)
-            
-            # Calculate BM25 score for resume against JD
-            scores = bm25.get_scores(resume_tokens)
-            jd_score = scores[1]  # Score against JD (index 1)
-            
-            # Normalize to 0-100 scale
-            max_score = max(scores) if len(scores) > 0 else 1
-            normalized_score = (jd_score / max_score) * 100 if max_score > 0 else 0
-            
-            return min(normalized_score, 100)
+            return min(self._bm25_score_vec(query_terms, jd_term_counts), 100)
             
         except Exception as e:
             logger.error(f"Error calculating BM25 score: {e}")
             return 0.0
     
+    def _bm25_score_vec(self, query_terms: set, doc_term_counts: Counter, k1: float = 1.5) -> float:
+        """
+        BM25 of a single document, normalized to 0-100
+        
+        With one document dl == avgdl, so the length term reduces to k1, and
+        the IDF is the same constant for every term and cancels against the
+        normalization by the best possible score, len(query_terms) * (k1 + 1).
+        """
+        # Set intersection and map() keep the per-term work in C
+        common_terms = doc_term_counts.keys() & query_terms
+        tf = np.fromiter(
+            map(doc_term_counts.__getitem__, common_terms),
+            dtype=np.float32,
+            count=len(common_terms)
+        )
+        if tf.size == 0:
+            return 0.0
+        
+        saturated = tf * (k1 + 1) / (tf + k1)
+        return float(saturated.sum()) / (len(query_terms) * (k1 + 1)) * 100
+    
     def _calculate_skill_match_score(
         self, 
         resume_skills: List[str], 
-        jd_required_skills: List[str],
-        jd_preferred_skills: List[str]
+        jd_required_lower: List[str],
+        jd_preferred_lower: List[str]
     ) -> float:
-        """Calculate skill matching score"""
-        if not jd_required_skills and not jd_preferred_skills:
+        """Calculate skill matching score (JD skills already lower-cased)"""
+        if not jd_required_lower and not jd_preferred_lower:
             return 0.0
         
         # Normalize skills to lowercase for comparison
         resume_skills_lower = [skill.lower().strip() for skill in resume_skills]
-        jd_required_lower = [skill.lower().strip() for skill in jd_required_skills]
-        jd_preferred_lower = [skill.lower().strip() for skill in jd_preferred_skills]
         
-        # Calculate required skills match
-        required_matches = 0
-        for skill in jd_required_lower:
-            if any(self._skill_fuzzy_match(skill, resume_skill) for resume_skill in resume_skills_lower):
-                required_matches += 1
-        
-        # Calculate preferred skills match
-        preferred_matches = 0
-        for skill in jd_preferred_lower:
-            if any(self._skill_fuzzy_match(skill, resume_skill) for resume_skill in resume_skills_lower):
-                preferred_matches += 1
+        # Match every JD skill against every resume skill in one pass per scorer
+        matched = self._skill_match_mask(jd_required_lower + jd_preferred_lower, resume_skills_lower)
+        required_matches = int(matched[:len(jd_required_lower)].sum())
+        preferred_matches = int(matched[len(jd_required_lower):].sum())
         
         # Calculate weighted score
         total_required = len(jd_required_lower)
@@ -179,35 +245,26 @@ class HardMatcher:
         
         return min(final_score, 100)
     
-    def _calculate_fuzzy_score(self, resume_text: str, jd_text: str) -> float:
-        """Calculate fuzzy matching score"""
+    def _calculate_fuzzy_score(self, resume_text: str, jd_phrases: List[str]) -> float:
+        """Calculate fuzzy matching score against the JD's key phrases"""
         try:
-            # Extract key phrases from both texts
+            # Extract key phrases from resume
             resume_phrases = self._extract_key_phrases(resume_text)
-            jd_phrases = self._extract_key_phrases(jd_text)
             
             if not resume_phrases or not jd_phrases:
                 return 0.0
             
-            # Calculate fuzzy matching scores
-            total_score = 0
-            match_count = 0
-            
-            for jd_phrase in jd_phrases:
-                best_match = process.extractOne(
-                    jd_phrase, 
-                    resume_phrases, 
-                    scorer=fuzz.token_sort_ratio
-                )
-                
-                if best_match and best_match[1] > 60:  # Threshold for good match
-                    total_score += best_match[1]
-                    match_count += 1
+            # Best resume match for every JD phrase, from one score matrix; pairs
+            # scoring under the cutoff come back as 0 without a full comparison
+            best_scores = cdist(
+                jd_phrases, resume_phrases, scorer=fuzz.token_sort_ratio, score_cutoff=60
+            ).max(axis=1)
+            good_matches = best_scores[best_scores > 60]  # Threshold for good match
             
-            if match_count == 0:
+            if good_matches.size == 0:
                 return 0.0
             
-            average_score = total_score / match_count
+            average_score = float(good_matches.mean())
             return min(average_score, 100)
             
         except Exception as e:
@@ -219,62 +276,52 @@ class HardMatcher:
         if not text:
             return ""
         
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters but keep spaces
-        text = re.sub(r'[^\w\s]', ' ', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        # Lowercase, then replace special characters and whitespace runs with one space
+        return _NON_WORD_RUN.sub(' ', text.lower()).strip()
     
-    def _tokenize_text(self, text: str) -> List[str]:
-        """Tokenize text for BM25"""
-        if not text:
-            return []
+    def _skill_match_mask(self, jd_skills: List[str], resume_skills: List[str], threshold: int = 80) -> np.ndarray:
+        """
+        For each JD skill, whether any resume skill matches it under ratio,
+        partial_ratio or token_sort_ratio
+        """
+        if not jd_skills or not resume_skills:
+            return np.zeros(len(jd_skills), dtype=bool)
         
-        # Simple tokenization
-        tokens = re.findall(r'\b\w+\b', text.lower())
-        return tokens
-    
-    def _skill_fuzzy_match(self, skill1: str, skill2: str, threshold: int = 80) -> bool:
-        """Check if two skills match using fuzzy matching"""
-        return fuzz.ratio(skill1, skill2) >= threshold or \
-               fuzz.partial_ratio(skill1, skill2) >= threshold or \
-               fuzz.token_sort_ratio(skill1, skill2) >= threshold
+        # Exact matches score 100 under every scorer; only the rest need fuzzing
+        resume_set = set(resume_skills)
+        matched = np.fromiter((skill in resume_set for skill in jd_skills), dtype=bool, count=len(jd_skills))
+        residual = np.flatnonzero(~matched)
+        if residual.size == 0:
+            return matched
+        
+        residual_skills = [jd_skills[i] for i in residual]
+        resume_unique = list(resume_set)
+        best = np.zeros(len(residual_skills), dtype=np.float32)
+        # score_cutoff lets rapidfuzz abandon pairs that cannot reach the threshold
+        for scorer in (fuzz.ratio, fuzz.partial_ratio, fuzz.token_sort_ratio):
+            scores = cdist(residual_skills, resume_unique, scorer=scorer, score_cutoff=threshold)
+            best = np.maximum(best, scores.max(axis=1))
+        matched[residual] = best >= threshold
+        return matched
     
     def _extract_key_phrases(self, text: str) -> List[str]:
         """Extract key phrases from text"""
         if not text:
             return []
         
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        
-        # Extract phrases (2-4 words)
+        # Extract phrases (2-4 word windows per sentence), stopping at the
+        # first 50 instead of building every window and truncating
         phrases = []
-        for sentence in sentences:
-            words = sentence.strip().split()
+        for sentence in _SENT_SPLIT.split(text):
+            words = sentence.split()
             for i in range(len(words) - 1):
-                for j in range(i + 2, min(i + 5, len(words) + 1)):
-                    phrase = ' '.join(words[i:j])
+                for n in (2, 3, 4):
+                    if i + n > len(words):
+                        break
+                    phrase = ' '.join(words[i:i + n])
                     if len(phrase) > 5:  # Filter out very short phrases
-                        phrases.append(phrase.strip())
+                        phrases.append(phrase)
+                        if len(phrases) == 50:  # Limit to top 50 phrases
+                            return phrases
         
-        return phrases[:50]  # Limit to top 50 phrases
-    
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors"""
-        try:
-            dot_product = np.dot(vec1, vec2)
-            norm1 = np.linalg.norm(vec1)
-            norm2 = np.linalg.norm(vec2)
-            
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            
-            return dot_product / (norm1 * norm2)
-        except:
-            return 0.0
+        return phrases
@@ -2,8 +2,16 @@
 Soft matching using semantic similarity and embeddings
 """
 import os
+import re
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import islice
 from typing import List, Dict, Tuple, Optional
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 import faiss
 import logging
@@ -13,6 +21,127 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Embeddings kept per matcher, least recently used evicted first
+EMBEDDING_CACHE_SIZE = 10000
+
+# Encoder device; the FAISS indexes follow it onto the GPU when the installed
+# faiss build has GPU support (faiss-gpu rather than faiss-cpu)
+DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+
+# Encoder weights: fp32 (default), fp16 (GPU only) or int8 (dynamic quantization, CPU only)
+ENCODER_PRECISION = os.getenv("HIRELENS_ENCODER_PRECISION", "fp32").lower()
+
+def embedding_cache_dtype(precision: str) -> np.dtype:
+    """
+    Storage dtype for embeddings from an encoder running at precision: half
+    precision once reduced precision is in use, float32 otherwise. Results
+    are always handed out as float32 for BLAS.
+    """
+    return np.dtype(np.float32 if precision == "fp32" else np.float16)
+
+# Intra-op threads for CPU encoding; 0 keeps torch's own default, which some
+# container runtimes leave at a single thread
+ENCODER_THREADS = int(os.getenv("HIRELENS_ENCODER_THREADS", "0"))
+
+# Embeddings persisted across processes, keyed by (model, text hash), so a
+# restarted server or a new batch run does not re-encode known texts
+EMBEDDING_CACHE_PATH = os.getenv(
+    "EMBEDDING_CACHE_PATH", os.path.join(os.getcwd(), "hirelens_embedding_cache.db")
+)
+_EMBEDDING_CACHE_BATCH = 500  # hashes per SELECT ... IN (...), under SQLite's variable limit
+
+# One connection per process (reopened after a fork), shared by threads under the lock
+_embedding_cache_connection: Optional[sqlite3.Connection] = None
+_embedding_cache_owner: Optional[Tuple[int, str]] = None
+_embedding_cache_lock = threading.Lock()
+
+def _embedding_cache() -> sqlite3.Connection:
+    """
+    This process's embedding cache connection, opened and set up on first use.
+    Call with _embedding_cache_lock held.
+    """
+    global _embedding_cache_connection, _embedding_cache_owner
+    owner = (os.getpid(), EMBEDDING_CACHE_PATH)
+    if _embedding_cache_owner != owner:
+        # A connection inherited through fork is abandoned rather than closed,
+        # leaving the parent's handle alone
+        if _embedding_cache_owner is not None and _embedding_cache_owner[0] == owner[0]:
+            _embedding_cache_connection.close()
+        connection = sqlite3.connect(EMBEDDING_CACHE_PATH, timeout=5, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS emb (model TEXT, hash TEXT, vec BLOB NOT NULL, PRIMARY KEY (model, hash))"
+        )
+        _embedding_cache_connection, _embedding_cache_owner = connection, owner
+    return _embedding_cache_connection
+
+def _load_cached_embeddings(model_key: str, keys: List[str], dtype: np.dtype) -> Dict[str, np.ndarray]:
+    """Return the persisted embeddings among keys (misses are simply absent)"""
+    found = {}
+    try:
+        with _embedding_cache_lock:
+            connection = _embedding_cache()
+            for start in range(0, len(keys), _EMBEDDING_CACHE_BATCH):
+                batch = keys[start:start + _EMBEDDING_CACHE_BATCH]
+                rows = connection.execute(
+                    f"SELECT hash, vec FROM emb WHERE model = ? AND hash IN ({','.join('?' * len(batch))})",
+                    (model_key, *batch)
+                )
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=dtype)
+    except Exception as e:
+        logger.warning(f"Embedding cache lookup failed: {e}")
+    return found
+
+def _store_cached_embeddings(model_key: str, embeddings: Dict[str, np.ndarray]):
+    """Persist freshly encoded embeddings"""
+    try:
+        with _embedding_cache_lock, _embedding_cache() as connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO emb (model, hash, vec) VALUES (?, ?, ?)",
+                [(model_key, key, embedding.tobytes()) for key, embedding in embeddings.items()]
+            )
+    except Exception as e:
+        logger.warning(f"Embedding cache write failed: {e}")
+
+# A paragraph counts as a key section if it mentions any of these (case-insensitive)
+_SECTION_KEYWORDS = re.compile(
+    r'experience|skills|education|project|responsibility|requirement|qualification|achievement|certification',
+    re.IGNORECASE
+)
+
+def _iter_paragraphs(text: str):
+    """Lazily yield the same pieces as text.split('\\n\\n')"""
+    start = 0
+    while True:
+        end = text.find('\n\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 2
+
+def _ensure_unit_length(embeddings: np.ndarray) -> np.ndarray:
+    """
+    The cosine helpers treat dot products as cosines, so rows the encoder did
+    not return at unit length (e.g. a model without a Normalize layer) are
+    renormalized here; all-zero rows are left as they are
+    """
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    if np.allclose(norms, 1.0, atol=1e-3):
+        return embeddings
+    logger.warning("Encoder returned embeddings that are not unit length, normalizing them")
+    return embeddings / np.where(norms > 0, norms, 1.0)
+
+@dataclass
+class JDEmbeddings:
+    """Job-description side of soft matching, encoded once and reused across resumes"""
+    text_embedding: Optional[np.ndarray]  # None for an empty JD
+    skill_embeddings: np.ndarray  # required skills first, then preferred
+    required_count: int
+    preferred_count: int
+    section_embeddings: np.ndarray
+
 class SoftMatcher:
     """Soft matching using semantic similarity and embeddings"""
     
@@ -26,30 +155,86 @@ class SoftMatcher:
         self.model_name = model_name
         self.model = None
         self.index = None
+        # Name and precision of the encoder actually loaded plus the storage
+        # dtype (see _load_model), which keys the persistent embedding cache
+        self._model_key = None
+        self._cache_dtype = embedding_cache_dtype("fp32")
+        # Unit-length embeddings keyed by blake2b of the text (see _encode_cached)
+        self._emb_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._gpu_resources = None
+        if DEVICE == "cuda" and hasattr(faiss, "StandardGpuResources") and faiss.get_num_gpus() > 0:
+            self._gpu_resources = faiss.StandardGpuResources()
         self._load_model()
     
     def _load_model(self):
         """Load the sentence transformer model"""
         try:
-            self.model = SentenceTransformer(self.model_name)
-            logger.info(f"Loaded model: {self.model_name}")
+            self.model = SentenceTransformer(self.model_name, device=DEVICE)
+            logger.info(f"Loaded model: {self.model_name} on {DEVICE}")
+            self._set_model_key(self.model_name)
+            self._configure_inference()
         except Exception as e:
             logger.error(f"Error loading model {self.model_name}: {e}")
             # Fallback to a smaller model
             try:
-                self.model = SentenceTransformer("paraphrase-MiniLM-L6-v2")
+                self.model = SentenceTransformer("paraphrase-MiniLM-L6-v2", device=DEVICE)
                 logger.info("Loaded fallback model: paraphrase-MiniLM-L6-v2")
+                self._set_model_key("paraphrase-MiniLM-L6-v2")
+                self._configure_inference()
             except Exception as e2:
                 logger.error(f"Error loading fallback model: {e2}")
                 raise
     
+    def _set_model_key(self, model_name: str):
+        """
+        Apply the encoder precision and key the persistent cache on what was
+        actually applied, so a fallback to fp32 never shares rows with fp16 blobs
+        """
+        precision = self._apply_precision()
+        self._cache_dtype = embedding_cache_dtype(precision)
+        self._model_key = f"{model_name}:{precision}:{self._cache_dtype.name}"
+    
+    def _configure_inference(self):
+        """Put the encoder in eval mode and size torch's CPU thread pool"""
+        self.model.eval()
+        if DEVICE == "cpu" and ENCODER_THREADS > 0:
+            torch.set_num_threads(ENCODER_THREADS)
+            logger.info(f"Encoder using {ENCODER_THREADS} CPU threads")
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Unit-length embeddings for texts, without autograd bookkeeping"""
+        with torch.inference_mode():
+            return self.model.encode(
+                texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+            )
+    
+    def _apply_precision(self) -> str:
+        """
+        Convert the loaded encoder to ENCODER_PRECISION where the device
+        supports it, returning the precision actually in use
+        """
+        if ENCODER_PRECISION == "fp32":
+            return "fp32"
+        if ENCODER_PRECISION == "fp16" and DEVICE == "cuda":
+            self.model.half()
+        elif ENCODER_PRECISION == "int8" and DEVICE == "cpu":
+            torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+        else:
+            logger.warning(f"Encoder precision {ENCODER_PRECISION} not supported on {DEVICE}, using fp32")
+            return "fp32"
+        logger.info(f"Encoder running in {ENCODER_PRECISION}")
+        return ENCODER_PRECISION
+    
     def calculate_soft_match_score(
         self, 
         resume_text: str, 
         jd_text: str,
         resume_skills: List[str],
         jd_required_skills: List[str],
-        jd_preferred_skills: List[str] = None
+        jd_preferred_skills: List[str] = None,
+        jd_embeddings: Optional[JDEmbeddings] = None
     ) -> Dict[str, float]:
         """
         Calculate soft match score using semantic similarity
@@ -60,6 +245,7 @@ class SoftMatcher:
             resume_skills: List of skills from resume
             jd_required_skills: List of required skills from JD
             jd_preferred_skills: List of preferred skills from JD
+            jd_embeddings: Result of prepare_jd() for this JD, to skip re-encoding it
             
         Returns:
             Dictionary with scores and details
@@ -67,20 +253,21 @@ class SoftMatcher:
         if jd_preferred_skills is None:
             jd_preferred_skills = []
         
+        # Weighted combination of scores
+        weights = {
+            'text_similarity': 0.4,
+            'skill_similarity': 0.4,
+            'context_similarity': 0.2
+        }
+        
         try:
-            # Calculate different types of semantic scores
-            text_similarity = self._calculate_text_similarity(resume_text, jd_text)
-            skill_similarity = self._calculate_skill_similarity(
-                resume_skills, jd_required_skills, jd_preferred_skills
-            )
-            context_similarity = self._calculate_context_similarity(resume_text, jd_text)
+            if jd_embeddings is None:
+                jd_embeddings = self.prepare_jd(jd_text, jd_required_skills, jd_preferred_skills)
             
-            # Weighted combination of scores
-            weights = {
-                'text_similarity': 0.4,
-                'skill_similarity': 0.4,
-                'context_similarity': 0.2
-            }
+            # Calculate different types of semantic scores
+            text_similarity = self._calculate_text_similarity(resume_text, jd_embeddings.text_embedding)
+            skill_similarity = self._calculate_skill_similarity(resume_skills, jd_embeddings)
+            context_similarity = self._calculate_context_similarity(resume_text, jd_embeddings.section_embeddings)
             
             overall_score = (
                 text_similarity * weights['text_similarity'] +
@@ -106,21 +293,93 @@ class SoftMatcher:
                 'weights': weights
             }
     
-    def _calculate_text_similarity(self, resume_text: str, jd_text: str) -> float:
-        """Calculate semantic similarity between resume and JD text"""
+    def batch_calculate_soft_match_score(
+        self,
+        resumes: List[Dict],
+        jds: List[Dict]
+    ) -> np.ndarray:
+        """
+        Soft match scores of every resume against every JD
+        
+        Args:
+            resumes: Dicts with resume_text and resume_skills
+            jds: Dicts with jd_text, jd_required_skills and jd_preferred_skills
+            
+        Returns:
+            (len(resumes), len(jds)) array of overall scores, each equal to
+            calculate_soft_match_score()['overall_score'] for that pair
+        """
+        # Encode every distinct text on both sides in one batched pass; the
+        # per-pair scoring below then only reads the embedding cache
+        texts = []
+        for resume in resumes:
+            resume_text = resume.get('resume_text') or ''
+            if resume_text:
+                texts.append(resume_text)
+                texts.extend(self._extract_key_sections(resume_text))
+            texts.extend(resume.get('resume_skills') or [])
+        for jd in jds:
+            jd_text = jd.get('jd_text') or ''
+            if jd_text:
+                texts.append(jd_text)
+                texts.extend(self._extract_key_sections(jd_text))
+            texts.extend(jd.get('jd_required_skills') or [])
+            texts.extend(jd.get('jd_preferred_skills') or [])
         try:
-            if not resume_text or not jd_text:
+            self._encode_cached(list(dict.fromkeys(texts)))
+        except Exception as e:
+            logger.error(f"Error encoding soft match batch: {e}")
+        
+        scores = np.zeros((len(resumes), len(jds)), dtype=np.float32)
+        for j, jd in enumerate(jds):
+            jd_required_skills = jd.get('jd_required_skills') or []
+            jd_preferred_skills = jd.get('jd_preferred_skills') or []
+            try:
+                jd_embeddings = self.prepare_jd(jd.get('jd_text') or '', jd_required_skills, jd_preferred_skills)
+            except Exception as e:
+                logger.error(f"Error encoding job description: {e}")
+                continue
+            for i, resume in enumerate(resumes):
+                scores[i, j] = self.calculate_soft_match_score(
+                    resume_text=resume.get('resume_text') or '',
+                    jd_text=jd.get('jd_text') or '',
+                    resume_skills=resume.get('resume_skills') or [],
+                    jd_required_skills=jd_required_skills,
+                    jd_preferred_skills=jd_preferred_skills,
+                    jd_embeddings=jd_embeddings
+                )['overall_score']
+        
+        return scores
+    
+    def prepare_jd(
+        self,
+        jd_text: str,
+        jd_required_skills: List[str],
+        jd_preferred_skills: List[str] = None
+    ) -> JDEmbeddings:
+        """Encode the JD text, skills and key sections once so a batch of resumes can share them"""
+        jd_required_skills = jd_required_skills or []
+        jd_preferred_skills = jd_preferred_skills or []
+        jd_sections = self._extract_key_sections(jd_text) if jd_text else []
+        return JDEmbeddings(
+            text_embedding=self._encode_cached([jd_text])[0] if jd_text else None,
+            skill_embeddings=self._encode_cached(jd_required_skills + jd_preferred_skills),
+            required_count=len(jd_required_skills),
+            preferred_count=len(jd_preferred_skills),
+            section_embeddings=self._encode_cached(jd_sections)
+        )
+    
+    def _calculate_text_similarity(self, resume_text: str, jd_embedding: Optional[np.ndarray]) -> float:
+        """Calculate semantic similarity between resume text and the encoded JD text"""
+        try:
+            if not resume_text or jd_embedding is None:
                 return 0.0
             
             # Generate embeddings
-            resume_embedding = self.model.encode([resume_text])
-            jd_embedding = self.model.encode([jd_text])
+            resume_embedding = self._encode_cached([resume_text])[0]
             
             # Calculate cosine similarity
-            similarity = self._cosine_similarity(
-                resume_embedding[0], 
-                jd_embedding[0]
-            )
+            similarity = self._cosine_similarity(resume_embedding, jd_embedding)
             
             return similarity * 100  # Convert to 0-100 scale
             
@@ -128,36 +387,27 @@ class SoftMatcher:
             logger.error(f"Error calculating text similarity: {e}")
             return 0.0
     
-    def _calculate_skill_similarity(
-        self, 
-        resume_skills: List[str], 
-        jd_required_skills: List[str],
-        jd_preferred_skills: List[str]
-    ) -> float:
-        """Calculate semantic similarity between skills"""
+    def _calculate_skill_similarity(self, resume_skills: List[str], jd_embeddings: JDEmbeddings) -> float:
+        """Calculate semantic similarity between resume skills and the encoded JD skills"""
         try:
-            if not resume_skills or (not jd_required_skills and not jd_preferred_skills):
+            if not resume_skills or len(jd_embeddings.skill_embeddings) == 0:
                 return 0.0
             
-            # Combine required and preferred skills
-            all_jd_skills = jd_required_skills + jd_preferred_skills
-            
             # Generate embeddings for skills
-            resume_skill_embeddings = self.model.encode(resume_skills)
-            jd_skill_embeddings = self.model.encode(all_jd_skills)
-            
-            # Calculate similarity matrix
-            similarity_matrix = self._cosine_similarity_matrix(
-                resume_skill_embeddings, 
-                jd_skill_embeddings
+            resume_skill_embeddings = self._encode_cached(resume_skills)
+            jd_skill_embeddings = jd_embeddings.skill_embeddings
+            
+            # Find best matches for each JD skill: one k=1 inner-product
+            # search of the JD skills against an index of the resume skills
+            index = self.build_index(resume_skill_embeddings)
+            max_similarities, _ = index.search(
+                np.ascontiguousarray(jd_skill_embeddings, dtype=np.float32), 1
             )
-            
-            # Find best matches for each JD skill
-            max_similarities = np.max(similarity_matrix, axis=0)
+            max_similarities = max_similarities[:, 0]
             
             # Weight required skills more heavily
-            required_count = len(jd_required_skills)
-            preferred_count = len(jd_preferred_skills)
+            required_count = jd_embeddings.required_count
+            preferred_count = jd_embeddings.preferred_count
             
             if required_count > 0 and preferred_count > 0:
                 required_similarities = max_similarities[:required_count]
@@ -176,87 +426,101 @@ class SoftMatcher:
             logger.error(f"Error calculating skill similarity: {e}")
             return 0.0
     
-    def _calculate_context_similarity(self, resume_text: str, jd_text: str) -> float:
-        """Calculate context similarity by comparing key sections"""
+    def _calculate_context_similarity(self, resume_text: str, jd_section_embeddings: np.ndarray) -> float:
+        """Calculate context similarity by comparing key sections with the encoded JD sections"""
         try:
-            # Extract key sections from both texts
+            # Extract key sections from the resume
             resume_sections = self._extract_key_sections(resume_text)
-            jd_sections = self._extract_key_sections(jd_text)
             
-            if not resume_sections or not jd_sections:
+            if not resume_sections or len(jd_section_embeddings) == 0:
                 return 0.0
             
-            # Calculate similarity for each section
-            section_similarities = []
+            # Encode the resume sections as one batch (sentence-transformers
+            # already length-sorts inside encode); unit-length rows make the
+            # dot product matrix the cosine matrix
+            resume_embeddings = self._encode_cached(resume_sections)
+            similarity_matrix = jd_section_embeddings @ resume_embeddings.T
             
-            for jd_section in jd_sections:
-                best_similarity = 0.0
-                for resume_section in resume_sections:
-                    # Generate embeddings for sections
-                    jd_embedding = self.model.encode([jd_section])
-                    resume_embedding = self.model.encode([resume_section])
-                    
-                    # Calculate similarity
-                    similarity = self._cosine_similarity(
-                        jd_embedding[0], 
-                        resume_embedding[0]
-                    )
-                    
-                    best_similarity = max(best_similarity, similarity)
-                
-                section_similarities.append(best_similarity)
+            # Best resume section for each JD section, floored at 0
+            section_similarities = np.maximum(similarity_matrix.max(axis=1), 0.0)
             
             # Return average similarity
-            return np.mean(section_similarities) * 100
+            return float(np.mean(section_similarities)) * 100
             
         except Exception as e:
             logger.error(f"Error calculating context similarity: {e}")
             return 0.0
     
-    def _extract_key_sections(self, text: str) -> List[str]:
-        """Extract key sections from text for context matching"""
-        sections = []
+    def _encode_cached(self, texts: List[str]) -> np.ndarray:
+        """
+        Unit-length embeddings for texts, in order, encoding only the texts
+        found neither in memory nor in the persistent cache (as one batch)
+        """
+        keys = [hashlib.blake2b(text.encode(), digest_size=16).hexdigest() for text in texts]
+        
+        misses = {}
+        for key, text in zip(keys, texts):
+            if key in self._emb_cache:
+                self._emb_cache.move_to_end(key)
+            elif key not in misses:
+                misses[key] = text
+        
+        if misses:
+            for key, embedding in _load_cached_embeddings(self._model_key, list(misses), self._cache_dtype).items():
+                self._emb_cache[key] = embedding
+                del misses[key]
         
-        # Split text into paragraphs
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+        if misses:
+            embeddings = _ensure_unit_length(self._encode(list(misses.values())))
+            encoded = dict(zip(misses, embeddings.astype(self._cache_dtype, copy=False)))
+            self._emb_cache.update(encoded)
+            _store_cached_embeddings(self._model_key, encoded)
         
-        # Filter paragraphs by length and content
-        for paragraph in paragraphs:
-            if len(paragraph) > 50:  # Minimum length
-                # Check if paragraph contains relevant content
-                if any(keyword in paragraph.lower() for keyword in [
-                    'experience', 'skills', 'education', 'project', 'responsibility',
-                    'requirement', 'qualification', 'achievement', 'certification'
-                ]):
-                    sections.append(paragraph)
+        if not keys:
+            return np.zeros((0, self.model.get_sentence_embedding_dimension()), dtype=np.float32)
+        # One contiguous float32 matrix, whatever the cache stores
+        result = np.stack([self._emb_cache[key] for key in keys]).astype(np.float32, copy=False)
         
-        return sections[:10]  # Limit to top 10 sections
+        # Evict only after stitching, so a call larger than the cache still works
+        while len(self._emb_cache) > EMBEDDING_CACHE_SIZE:
+            self._emb_cache.popitem(last=False)
+        
+        return result
+    
+    def build_index(self, embeddings: np.ndarray) -> "faiss.Index":
+        """
+        Exact inner-product (cosine, for unit-length rows) FAISS index over
+        embeddings, on the GPU when one is available
+        """
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if self._gpu_resources is not None:
+            index = faiss.GpuIndexFlatIP(self._gpu_resources, embeddings.shape[1])
+        else:
+            index = faiss.IndexFlatIP(embeddings.shape[1])
+        index.add(embeddings)
+        return index
+    
+    def _extract_key_sections(self, text: str) -> List[str]:
+        """Extract key sections from text for context matching"""
+        # Filter paragraphs by length (minimum 50) and relevant content,
+        # stopping at the top 10 sections instead of splitting the whole text
+        paragraphs = (paragraph.strip() for paragraph in _iter_paragraphs(text))
+        return list(islice(
+            (p for p in paragraphs if len(p) > 50 and _SECTION_KEYWORDS.search(p)),
+            10
+        ))
     
     def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors"""
+        """Cosine similarity of two unit-length vectors (from _encode_cached)"""
         try:
-            dot_product = np.dot(vec1, vec2)
-            norm1 = np.linalg.norm(vec1)
-            norm2 = np.linalg.norm(vec2)
-            
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            
-            return dot_product / (norm1 * norm2)
+            return float(vec1 @ vec2)
         except:
             return 0.0
     
     def _cosine_similarity_matrix(self, embeddings1: np.ndarray, embeddings2: np.ndarray) -> np.ndarray:
-        """Calculate cosine similarity matrix between two sets of embeddings"""
+        """Cosine similarity matrix of two sets of unit-length embeddings: one GEMM"""
         try:
-            # Normalize embeddings
-            embeddings1_norm = embeddings1 / np.linalg.norm(embeddings1, axis=1, keepdims=True)
-            embeddings2_norm = embeddings2 / np.linalg.norm(embeddings2, axis=1, keepdims=True)
-            
-            # Calculate similarity matrix
-            similarity_matrix = np.dot(embeddings1_norm, embeddings2_norm.T)
-            
-            return similarity_matrix
+            return embeddings1 @ embeddings2.T
         except:
             return np.zeros((len(embeddings1), len(embeddings2)))
     
@@ -264,7 +528,8 @@ class SoftMatcher:
         self, 
         resume_skills: List[str], 
         jd_skills: List[str], 
-        threshold: float = 0.7
+        threshold: float = 0.7,
+        top_k: Optional[int] = None
     ) -> List[Tuple[str, str, float]]:
         """
         Find similar skills between resume and JD
@@ -273,6 +538,7 @@ class SoftMatcher:
             resume_skills: List of skills from resume
             jd_skills: List of skills from JD
             threshold: Similarity threshold for matching
+            top_k: Only return the top_k most similar pairs (default: all)
             
         Returns:
             List of tuples (resume_skill, jd_skill, similarity_score)
@@ -282,8 +548,8 @@ class SoftMatcher:
                 return []
             
             # Generate embeddings
-            resume_embeddings = self.model.encode(resume_skills)
-            jd_embeddings = self.model.encode(jd_skills)
+            resume_embeddings = self._encode_cached(resume_skills)
+            jd_embeddings = self._encode_cached(jd_skills)
             
             # Calculate similarity matrix
             similarity_matrix = self._cosine_similarity_matrix(
@@ -291,18 +557,23 @@ class SoftMatcher:
                 jd_embeddings
             )
             
-            # Find matches above threshold
-            matches = []
-            for i, resume_skill in enumerate(resume_skills):
-                for j, jd_skill in enumerate(jd_skills):
-                    similarity = similarity_matrix[i, j]
-                    if similarity >= threshold:
-                        matches.append((resume_skill, jd_skill, similarity))
+            # Find matches above threshold, in row-major (resume, JD) order
+            pairs = np.argwhere(similarity_matrix >= threshold)
+            scores = similarity_matrix[pairs[:, 0], pairs[:, 1]]
+            
+            # Partition out the top_k before sorting, so only they get sorted
+            if top_k is not None and len(scores) > top_k:
+                top = np.argpartition(-scores, top_k)[:top_k]
+                top.sort()  # back to row-major order for a stable tie-break
+                pairs, scores = pairs[top], scores[top]
             
-            # Sort by similarity score
-            matches.sort(key=lambda x: x[2], reverse=True)
+            # Sort by similarity score (stable, like list.sort)
+            order = np.argsort(-scores, kind='stable')
             
-            return matches
+            return [
+                (resume_skills[i], jd_skills[j], float(score))
+                for (i, j), score in zip(pairs[order], scores[order])
+            ]
             
         except Exception as e:
             logger.error(f"Error finding similar skills: {e}")
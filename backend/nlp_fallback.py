@@ -7,8 +7,40 @@ import nltk
 from typing import List, Dict, Any
 import logging
 
+try:
+    from nltk.tokenize import word_tokenize as _word_tokenize
+    from nltk.tag import pos_tag as _pos_tag
+except ImportError:
+    _word_tokenize = _pos_tag = None
+
 logger = logging.getLogger(__name__)
 
+# Common technical skills patterns, as one alternation
+_SKILL_PATTERN = re.compile(
+    r'\b(?:'
+    r'Python|Java|JavaScript|C\+\+|C#|PHP|Ruby|Go|Rust|Swift|Kotlin|'
+    r'React|Angular|Vue|Node\.js|Django|Flask|Spring|Laravel|Express|'
+    r'SQL|MySQL|PostgreSQL|MongoDB|Redis|Elasticsearch|'
+    r'AWS|Azure|GCP|Docker|Kubernetes|Jenkins|Git|'
+    r'Machine Learning|AI|Data Science|Analytics|Statistics|'
+    r'Project Management|Agile|Scrum|Leadership|Communication'
+    r')\b',
+    re.IGNORECASE
+)
+
+# Word runs or punctuation runs; the same split as the tokenizers library's
+# Whitespace pre-tokenizer
+_TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]+')
+
+# Entity patterns for extract_entities, as one alternation so the text is
+# scanned once; the matching group's name says which entity was found
+_ENTITY_PATTERN = re.compile(
+    r'(?P<emails>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<phones>\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b)'
+    r'|(?P<dates>\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b)',
+    re.IGNORECASE
+)
+
 class FallbackNLP:
     """Fallback NLP processor when SpaCy is not available"""
     
@@ -37,22 +69,7 @@ class FallbackNLP:
     
     def extract_skills(self, text: str) -> List[str]:
         """Extract skills using regex patterns when SpaCy is not available"""
-        # Common technical skills patterns
-        skill_patterns = [
-            r'\b(?:Python|Java|JavaScript|C\+\+|C#|PHP|Ruby|Go|Rust|Swift|Kotlin)\b',
-            r'\b(?:React|Angular|Vue|Node\.js|Django|Flask|Spring|Laravel|Express)\b',
-            r'\b(?:SQL|MySQL|PostgreSQL|MongoDB|Redis|Elasticsearch)\b',
-            r'\b(?:AWS|Azure|GCP|Docker|Kubernetes|Jenkins|Git)\b',
-            r'\b(?:Machine Learning|AI|Data Science|Analytics|Statistics)\b',
-            r'\b(?:Project Management|Agile|Scrum|Leadership|Communication)\b'
-        ]
-        
-        skills = set()
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            skills.update(matches)
-        
-        return list(skills)
+        return list(set(_SKILL_PATTERN.findall(text)))
     
     def extract_entities(self, text: str) -> Dict[str, List[str]]:
         """Extract entities using regex patterns"""
@@ -64,36 +81,21 @@ class FallbackNLP:
             'phones': []
         }
         
-        # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        entities['emails'] = re.findall(email_pattern, text)
-        
-        # Phone pattern
-        phone_pattern = r'\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b'
-        entities['phones'] = re.findall(phone_pattern, text)
-        
-        # Date pattern
-        date_pattern = r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b'
-        entities['dates'] = re.findall(date_pattern, text, re.IGNORECASE)
+        for match in _ENTITY_PATTERN.finditer(text):
+            entities[match.lastgroup].append(match.group())
         
         return entities
     
     def tokenize(self, text: str) -> List[str]:
-        """Tokenize text using NLTK"""
-        try:
-            from nltk.tokenize import word_tokenize
-            return word_tokenize(text)
-        except Exception:
-            # Fallback to simple whitespace tokenization
-            return text.split()
+        """Tokenize text into word and punctuation runs with one compiled regex"""
+        return _TOKEN_PATTERN.findall(text)
     
     def get_pos_tags(self, text: str) -> List[tuple]:
         """Get part-of-speech tags using NLTK"""
+        if _word_tokenize is None or _pos_tag is None:
+            return []
         try:
-            from nltk.tokenize import word_tokenize
-            from nltk.tag import pos_tag
-            tokens = word_tokenize(text)
-            return pos_tag(tokens)
+            return _pos_tag(_word_tokenize(text))
         except Exception:
             return []
 
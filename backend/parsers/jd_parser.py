@@ -8,6 +8,45 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by every parse_jd call, compiled once at import
+_TITLE_PATTERNS = [re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r'job title[:\s]*([^\n]+)',
+    r'position[:\s]*([^\n]+)',
+    r'role[:\s]*([^\n]+)',
+    r'^([A-Z][^,\n]*?(?:developer|engineer|analyst|manager|specialist|coordinator|director|lead|architect)[^,\n]*?)(?:\n|$)',
+)]
+_COMPANY_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'company[:\s]*([^\n]+)',
+    r'organization[:\s]*([^\n]+)',
+    r'about\s+([A-Z][^,\n]+)',
+    r'at\s+([A-Z][^,\n]+)',
+)]
+_LOCATION_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'location[:\s]*([^\n]+)',
+    r'based\s+in\s+([^\n]+)',
+    r'office\s+location[:\s]*([^\n]+)',
+)]
+_SALARY_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)\s*[-–]\s*\$(\d+(?:,\d{3})*(?:\.\d{2})?)',
+    r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*[-–]\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s*)?(?:year|annually|month|monthly)',
+    r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:to\s*)?(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s*)?(?:year|annually|month|monthly)',
+)]
+_REQUIRED_SECTION = re.compile(r'(?:required|must have|essential|mandatory)[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)', re.IGNORECASE | re.DOTALL)
+_REQUIRED_MENTION = re.compile(r'([a-z\s]+?)\s+(?:required|must|essential|mandatory)')
+_PREFERRED_SECTION = re.compile(r'(?:preferred|nice to have|good to have|plus|bonus)[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)', re.IGNORECASE | re.DOTALL)
+_PREFERRED_MENTION = re.compile(r'([a-z\s]+?)\s+(?:preferred|nice to have|good to have|plus|bonus)')
+_BULLET_ITEM = re.compile(r'[•\-\*]\s*([^,\n]+?)(?:\s*[,;]|\s*$)')
+_YEARS_OF_EXPERIENCE = re.compile(r'(\d+)[\s\-]*(?:to\s*)?(\d+)?\s*years?\s*(?:of\s*)?experience')
+# Requirements, responsibilities and benefits sections in one scan: the
+# lookahead makes every match zero-width, so sections may overlap exactly
+# as they did with one search per section
+_LIST_SECTIONS = re.compile(
+    r'(?=(requirements?|responsibilities?|benefits?)[:\s]*(.*?)(?=\n\n|\n[A-Z]|$))',
+    re.IGNORECASE | re.DOTALL
+)
+_LIST_SECTION_NAMES = {'req': 'requirements', 'res': 'responsibilities', 'ben': 'benefits'}
+_LIST_ITEM_SPLIT = re.compile(r'[•\-\*]\s*|\n\s*\d+\.\s*')
+
 class JDParser:
     """Parse job descriptions and extract requirements"""
     
@@ -50,6 +89,19 @@ class JDParser:
             'full-time', 'part-time', 'contract', 'freelance', 'internship',
             'temporary', 'permanent', 'remote', 'hybrid', 'onsite'
         ]
+        
+        # Membership tests on candidate skills (keywords are already lower-case)
+        self._skill_set = frozenset(self.skill_keywords)
+        
+        # All skill keywords as one alternation, longest first so e.g.
+        # "javascript" wins over "java"; the lookarounds act as word
+        # boundaries that also work after "c++" and "c#"
+        self._skill_regex = re.compile(
+            r'(?<!\w)(' +
+            '|'.join(re.escape(skill) for skill in sorted(self.skill_keywords, key=len, reverse=True)) +
+            r')(?!\w)',
+            re.IGNORECASE
+        )
 
     def parse_jd(self, jd_text: str) -> Dict[str, Any]:
         """Parse job description and extract structured data"""
@@ -64,23 +116,14 @@ class JDParser:
             'experience_level': self._extract_experience_level(jd_lower),
             'employment_type': self._extract_employment_type(jd_lower),
             'salary_range': self._extract_salary_range(jd_text),
-            'requirements': self._extract_requirements(jd_text),
-            'responsibilities': self._extract_responsibilities(jd_text),
-            'benefits': self._extract_benefits(jd_text)
+            **self._extract_list_sections(jd_text)
         }
 
     def _extract_job_title(self, text: str) -> str:
         """Extract job title from JD"""
         # Look for common job title patterns
-        title_patterns = [
-            r'job title[:\s]*([^\n]+)',
-            r'position[:\s]*([^\n]+)',
-            r'role[:\s]*([^\n]+)',
-            r'^([A-Z][^,\n]*?(?:developer|engineer|analyst|manager|specialist|coordinator|director|lead|architect)[^,\n]*?)(?:\n|$)',
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _TITLE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
@@ -95,15 +138,8 @@ class JDParser:
 
     def _extract_company(self, text: str) -> str:
         """Extract company name from JD"""
-        company_patterns = [
-            r'company[:\s]*([^\n]+)',
-            r'organization[:\s]*([^\n]+)',
-            r'about\s+([A-Z][^,\n]+)',
-            r'at\s+([A-Z][^,\n]+)',
-        ]
-        
-        for pattern in company_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _COMPANY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
@@ -111,14 +147,8 @@ class JDParser:
 
     def _extract_location(self, text: str) -> str:
         """Extract job location from JD"""
-        location_patterns = [
-            r'location[:\s]*([^\n]+)',
-            r'based\s+in\s+([^\n]+)',
-            r'office\s+location[:\s]*([^\n]+)',
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _LOCATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
@@ -129,17 +159,16 @@ class JDParser:
         required_skills = []
         
         # Look for required skills section
-        required_section = re.search(r'(?:required|must have|essential|mandatory)[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
+        required_section = _REQUIRED_SECTION.search(text)
         if required_section:
             skills_text = required_section.group(1)
             required_skills.extend(self._extract_skills_from_text(skills_text))
         
         # Also look for skills mentioned with "required" or "must"
-        required_pattern = r'([a-z\s]+?)\s+(?:required|must|essential|mandatory)'
-        matches = re.findall(required_pattern, text)
+        matches = _REQUIRED_MENTION.findall(text)
         for match in matches:
             skill = match.strip()
-            if skill in self.skill_keywords:
+            if skill in self._skill_set:
                 required_skills.append(skill.title())
         
         return list(set(required_skills))
@@ -149,34 +178,30 @@ class JDParser:
         preferred_skills = []
         
         # Look for preferred skills section
-        preferred_section = re.search(r'(?:preferred|nice to have|good to have|plus|bonus)[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
+        preferred_section = _PREFERRED_SECTION.search(text)
         if preferred_section:
             skills_text = preferred_section.group(1)
             preferred_skills.extend(self._extract_skills_from_text(skills_text))
         
         # Also look for skills mentioned with "preferred" or "nice to have"
-        preferred_pattern = r'([a-z\s]+?)\s+(?:preferred|nice to have|good to have|plus|bonus)'
-        matches = re.findall(preferred_pattern, text)
+        matches = _PREFERRED_MENTION.findall(text)
         for match in matches:
             skill = match.strip()
-            if skill in self.skill_keywords:
+            if skill in self._skill_set:
                 preferred_skills.append(skill.title())
         
         return list(set(preferred_skills))
 
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract skills from a given text"""
-        found_skills = []
-        
-        for skill in self.skill_keywords:
-            if skill in text:
-                found_skills.append(skill.title())
+        # One pass over the text for every keyword
+        found_skills = list({match.group(1).lower().title() for match in self._skill_regex.finditer(text)})
         
         # Also look for skills mentioned in bullet points or lists
-        skill_list = re.findall(r'[•\-\*]\s*([^,\n]+?)(?:\s*[,;]|\s*$)', text)
+        skill_list = _BULLET_ITEM.findall(text)
         for skill in skill_list:
             skill = skill.strip()
-            if len(skill) > 2 and skill.lower() in self.skill_keywords:
+            if len(skill) > 2 and skill.lower() in self._skill_set:
                 found_skills.append(skill.title())
         
         return found_skills
@@ -188,8 +213,7 @@ class JDParser:
                 return level.title()
         
         # Look for years of experience
-        years_pattern = r'(\d+)[\s\-]*(?:to\s*)?(\d+)?\s*years?\s*(?:of\s*)?experience'
-        match = re.search(years_pattern, text)
+        match = _YEARS_OF_EXPERIENCE.search(text)
         if match:
             min_years = int(match.group(1))
             max_years = int(match.group(2)) if match.group(2) else min_years
@@ -213,69 +237,37 @@ class JDParser:
 
     def _extract_salary_range(self, text: str) -> str:
         """Extract salary range from JD"""
-        salary_patterns = [
-            r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)\s*[-–]\s*\$(\d+(?:,\d{3})*(?:\.\d{2})?)',
-            r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*[-–]\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s*)?(?:year|annually|month|monthly)',
-            r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:to\s*)?(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s*)?(?:year|annually|month|monthly)'
-        ]
-        
-        for pattern in salary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SALARY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return f"${match.group(1)} - ${match.group(2)}"
         
         return "Not specified"
 
-    def _extract_requirements(self, text: str) -> List[str]:
-        """Extract job requirements"""
-        requirements = []
-        
-        # Look for requirements section
-        req_section = re.search(r'requirements?[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
-        if req_section:
-            req_text = req_section.group(1)
-            
-            # Split by bullet points or new lines
-            req_list = re.split(r'[•\-\*]\s*|\n\s*\d+\.\s*', req_text)
-            for req in req_list:
-                req = req.strip()
-                if len(req) > 10:  # Filter out very short requirements
-                    requirements.append(req)
-        
-        return requirements
-
-    def _extract_responsibilities(self, text: str) -> List[str]:
-        """Extract job responsibilities"""
-        responsibilities = []
+    def _extract_list_sections(self, text: str) -> Dict[str, List[str]]:
+        """Extract job requirements, responsibilities and benefits in one pass"""
+        # First occurrence of each section, as a search per section would find
+        sections = {}
+        for match in _LIST_SECTIONS.finditer(text):
+            sections.setdefault(_LIST_SECTION_NAMES[match.group(1)[:3].lower()], match.group(2))
+            if len(sections) == len(_LIST_SECTION_NAMES):
+                break
         
-        # Look for responsibilities section
-        resp_section = re.search(r'responsibilities?[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
-        if resp_section:
-            resp_text = resp_section.group(1)
-            
-            # Split by bullet points or new lines
-            resp_list = re.split(r'[•\-\*]\s*|\n\s*\d+\.\s*', resp_text)
-            for resp in resp_list:
-                resp = resp.strip()
-                if len(resp) > 10:  # Filter out very short responsibilities
-                    responsibilities.append(resp)
-        
-        return responsibilities
+        return {
+            'requirements': self._split_list_items(sections.get('requirements'), 10),
+            'responsibilities': self._split_list_items(sections.get('responsibilities'), 10),
+            'benefits': self._split_list_items(sections.get('benefits'), 5)
+        }
 
-    def _extract_benefits(self, text: str) -> List[str]:
-        """Extract job benefits"""
-        benefits = []
+    def _split_list_items(self, section_text: Optional[str], min_length: int) -> List[str]:
+        """Split a section by bullet points or numbered lines, dropping very short items"""
+        if section_text is None:
+            return []
         
-        # Look for benefits section
-        benefits_section = re.search(r'benefits?[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
-        if benefits_section:
-            benefits_text = benefits_section.group(1)
-            
-            # Split by bullet points or new lines
-            benefits_list = re.split(r'[•\-\*]\s*|\n\s*\d+\.\s*', benefits_text)
-            for benefit in benefits_list:
-                benefit = benefit.strip()
-                if len(benefit) > 5:  # Filter out very short benefits
-                    benefits.append(benefit)
+        items = []
+        for item in _LIST_ITEM_SPLIT.split(section_text):
+            item = item.strip()
+            if len(item) > min_length:
+                items.append(item)
         
-        return benefits
+        return items
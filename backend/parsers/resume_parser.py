@@ -4,68 +4,152 @@ Resume parsing utilities for HireLens
 import pdfplumber
 import docx2txt
 import re
+import io
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, BinaryIO, Union
 from pathlib import Path
 import logging
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 logger = logging.getLogger(__name__)
 
+# Body of a section: everything up to a blank line, a line starting with a
+# letter, or the end of the text. Equivalent to the lazy
+# (.*?)(?=\n\n|\n[A-Z]|$) under DOTALL, but [^\n]* and \n cannot overlap,
+# so the scan is a single linear pass with no backtracking
+_SECTION_BODY = r'([^\n]*(?:\n(?![\nA-Z]|\Z)[^\n]*)*)'
+
+# Explicit "Skills:" heading at the start of a line, and the section after it,
+# whether the items follow on the same line or start on the next one
+_SKILLS_SECTION = re.compile(r'(?:\A|\n)[ \t]*skills?[ \t]*:[:\s]*' + _SECTION_BODY, re.IGNORECASE)
+_SKILL_PHRASE = re.compile(r'\b\w+(?:\s+\w+)*\b')
+
+# Section and entry patterns used by every parse, compiled once at import
+# Education, experience, projects and certifications headings, found in one
+# scan; each section body starts after its heading's first occurrence
+_SECTION_HEADERS = re.compile(
+    r'(?P<education>education)|(?P<experience>experience)|'
+    r'(?P<projects>projects?)|(?P<certifications>certifications?)',
+    re.IGNORECASE
+)
+_SECTION_NAMES = ('education', 'experience', 'projects', 'certifications')
+_SECTION_REST = re.compile(r'[:\s]*' + _SECTION_BODY, re.IGNORECASE)
+_DEGREE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(bachelor[^,\n]*)',
+    r'(master[^,\n]*)',
+    r'(phd[^,\n]*)',
+    r'(diploma[^,\n]*)',
+    r'(certificate[^,\n]*)',
+))
+_JOB_ENTRY = re.compile(r'([A-Z][^,\n]*?)\s*at\s*([A-Z][^,\n]*?)(?:\s*\([^)]*\))?')
+_PROJECT_ENTRY = re.compile(r'([A-Z][^,\n]*?)[:\s]*(.*?)(?=\n[A-Z]|\n\n|$)')
+_CERTIFICATION_ENTRY = re.compile(r'([A-Z][^,\n]*?)(?:\s*\([^)]*\))?')
+_EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_EMAIL_LOCAL_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._%+-')
+_PHONE = re.compile(r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})')
+_PROFILE_HANDLE_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-')
+
+def _find_profile_url(text: str, prefix: str) -> Optional[str]:
+    """First occurrence of prefix followed by a non-empty [A-Za-z0-9-]+ handle"""
+    start = text.find(prefix)
+    while start != -1:
+        end = start + len(prefix)
+        while end < len(text) and text[end] in _PROFILE_HANDLE_CHARS:
+            end += 1
+        if end > start + len(prefix):
+            return text[start:end]
+        start = text.find(prefix, start + 1)
+    return None
+
+# Keyword lists shared by every ResumeParser, built once at import
+_SKILL_KEYWORDS = (
+    # Programming Languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
+    'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'bash', 'powershell',
+
+    # Web Technologies
+    'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
+    'spring', 'laravel', 'asp.net', 'jquery', 'bootstrap', 'tailwind', 'sass', 'less',
+
+    # Databases
+    'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'sql server',
+    'cassandra', 'elasticsearch', 'dynamodb', 'neo4j',
+
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab',
+    'terraform', 'ansible', 'chef', 'puppet', 'ci/cd', 'devops',
+
+    # Data Science & ML
+    'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras', 'opencv',
+    'matplotlib', 'seaborn', 'plotly', 'jupyter', 'spark', 'hadoop',
+
+    # Mobile Development
+    'android', 'ios', 'react native', 'flutter', 'xamarin', 'ionic',
+
+    # Other Technologies
+    'linux', 'windows', 'macos', 'api', 'rest', 'graphql', 'microservices',
+    'agile', 'scrum', 'jira', 'confluence', 'slack', 'figma', 'photoshop'
+)
+
+_EDUCATION_KEYWORDS = (
+    'education', 'degree', 'bachelor', 'master', 'phd', 'diploma', 'certificate',
+    'university', 'college', 'institute', 'school', 'graduation', 'gpa', 'cgpa'
+)
+
+_EXPERIENCE_KEYWORDS = (
+    'experience', 'work', 'employment', 'career', 'professional', 'internship',
+    'freelance', 'consultant', 'contract', 'volunteer', 'projects'
+)
+
+# All skill keywords as one alternation, longest first so e.g.
+# "javascript" wins over "java"; the lookarounds act as word
+# boundaries that also work after "c++" and "c#"
+_SKILL_REGEX = re.compile(
+    r'(?<!\w)(' +
+    '|'.join(re.escape(skill) for skill in sorted(_SKILL_KEYWORDS, key=len, reverse=True)) +
+    r')(?!\w)',
+    re.IGNORECASE
+)
+
 class ResumeParser:
     """Parse resumes from PDF and DOCX files"""
     
     def __init__(self):
-        self.skill_keywords = [
-            # Programming Languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-            'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'bash', 'powershell',
-            
-            # Web Technologies
-            'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
-            'spring', 'laravel', 'asp.net', 'jquery', 'bootstrap', 'tailwind', 'sass', 'less',
-            
-            # Databases
-            'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'sql server',
-            'cassandra', 'elasticsearch', 'dynamodb', 'neo4j',
-            
-            # Cloud & DevOps
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab',
-            'terraform', 'ansible', 'chef', 'puppet', 'ci/cd', 'devops',
-            
-            # Data Science & ML
-            'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras', 'opencv',
-            'matplotlib', 'seaborn', 'plotly', 'jupyter', 'spark', 'hadoop',
-            
-            # Mobile Development
-            'android', 'ios', 'react native', 'flutter', 'xamarin', 'ionic',
-            
-            # Other Technologies
-            'linux', 'windows', 'macos', 'api', 'rest', 'graphql', 'microservices',
-            'agile', 'scrum', 'jira', 'confluence', 'slack', 'figma', 'photoshop'
-        ]
-        
-        self.education_keywords = [
-            'education', 'degree', 'bachelor', 'master', 'phd', 'diploma', 'certificate',
-            'university', 'college', 'institute', 'school', 'graduation', 'gpa', 'cgpa'
-        ]
-        
-        self.experience_keywords = [
-            'experience', 'work', 'employment', 'career', 'professional', 'internship',
-            'freelance', 'consultant', 'contract', 'volunteer', 'projects'
-        ]
+        # Read-only structures shared across instances (and, after a fork,
+        # across worker processes)
+        self.skill_keywords = _SKILL_KEYWORDS
+        self.education_keywords = _EDUCATION_KEYWORDS
+        self.experience_keywords = _EXPERIENCE_KEYWORDS
 
-    def parse_file(self, file_path: str) -> Dict[str, Any]:
-        """Parse resume file and extract structured data"""
+    def parse_file(self, file_path: str, data: Union[bytes, BinaryIO, None] = None) -> Dict[str, Any]:
+        """
+        Parse resume file and extract structured data
+        
+        Args:
+            file_path: Path to the resume; its suffix selects the parser
+            data: File contents (bytes or a binary file object) the caller
+                already read, so the file is not opened again
+        """
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        if data is None:
+            if not file_path.exists():
+                raise FileNotFoundError(f"File not found: {file_path}")
+            source = file_path
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(data)
+        else:
+            source = data
         
         # Extract text based on file type
         if file_path.suffix.lower() == '.pdf':
-            text = self._extract_pdf_text(file_path)
+            text = self._extract_pdf_text(source)
         elif file_path.suffix.lower() in ['.docx', '.doc']:
-            text = self._extract_docx_text(file_path)
+            text = self._extract_docx_text(source)
         else:
             raise ValueError(f"Unsupported file type: {file_path.suffix}")
         
@@ -76,24 +160,54 @@ class ResumeParser:
         
         return parsed_data
 
-    def _extract_pdf_text(self, file_path: Path) -> str:
-        """Extract text from PDF file"""
+    def _extract_pdf_text(self, source: Union[Path, BinaryIO]) -> str:
+        """Extract text from a PDF path or binary file object"""
+        # PDFium's native text extraction skips pdfplumber's per-character
+        # layout model; pdfplumber remains the fallback for files it rejects
+        if pdfium is not None:
+            try:
+                return self._extract_pdf_text_pdfium(source)
+            except Exception as e:
+                logger.warning(f"PDFium could not extract text, falling back to pdfplumber: {e}")
+                if hasattr(source, 'seek'):
+                    source.seek(0)
+        
         try:
-            with pdfplumber.open(file_path) as pdf:
-                text = ""
+            with pdfplumber.open(source) as pdf:
+                # Collect pages and join once rather than growing one string
+                pages = []
                 for page in pdf.pages:
                     page_text = page.extract_text()
                     if page_text:
-                        text += page_text + "\n"
-                return text.strip()
+                        pages.append(page_text)
+                return "\n".join(pages).strip()
         except Exception as e:
             logger.error(f"Error extracting PDF text: {e}")
             raise
 
-    def _extract_docx_text(self, file_path: Path) -> str:
-        """Extract text from DOCX file"""
+    def _extract_pdf_text_pdfium(self, source: Union[Path, BinaryIO]) -> str:
+        """Extract text from a PDF path or binary file object with PDFium"""
+        pdf = pdfium.PdfDocument(source)
+        try:
+            pages = []
+            for index in range(len(pdf)):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                # PDFium ends lines with CRLF; the rest of the parser expects \n
+                page_text = textpage.get_text_range().replace('\r\n', '\n')
+                textpage.close()
+                page.close()
+                if page_text:
+                    pages.append(page_text)
+            return "\n".join(pages).strip()
+        finally:
+            pdf.close()
+
+    def _extract_docx_text(self, source: Union[Path, BinaryIO]) -> str:
+        """Extract text from a DOCX path or binary file object"""
         try:
-            return docx2txt.process(str(file_path))
+            # docx2txt opens its argument with zipfile, which takes either
+            return docx2txt.process(str(source) if isinstance(source, Path) else source)
         except Exception as e:
             logger.error(f"Error extracting DOCX text: {e}")
             raise
@@ -101,56 +215,53 @@ class ResumeParser:
     def _parse_text(self, text: str) -> Dict[str, Any]:
         """Parse extracted text and extract structured information"""
         text_lower = text.lower()
+        sections = self._extract_sections(text)
         
         return {
             'skills': self._extract_skills(text_lower),
-            'education': self._extract_education(text),
-            'experience': self._extract_experience(text),
-            'projects': self._extract_projects(text),
-            'certifications': self._extract_certifications(text),
+            'education': self._extract_education(sections.get('education')),
+            'experience': self._extract_experience(sections.get('experience')),
+            'projects': self._extract_projects(sections.get('projects')),
+            'certifications': self._extract_certifications(sections.get('certifications')),
             'contact_info': self._extract_contact_info(text)
         }
 
+    def _extract_sections(self, text: str) -> Dict[str, str]:
+        """Body of each section after its heading's first occurrence, in one pass"""
+        sections = {}
+        for match in _SECTION_HEADERS.finditer(text):
+            if match.lastgroup not in sections:
+                sections[match.lastgroup] = _SECTION_REST.match(text, match.end()).group(1)
+                if len(sections) == len(_SECTION_NAMES):
+                    break
+        
+        return sections
+
     def _extract_skills(self, text: str) -> List[str]:
         """Extract skills from resume text"""
-        found_skills = []
+        # One pass over the text for every keyword, whole words only so
+        # e.g. "r" no longer matches inside "architect"
+        found_skills = {match.group(1).lower().title() for match in _SKILL_REGEX.finditer(text)}
         
-        for skill in self.skill_keywords:
-            if skill in text:
-                found_skills.append(skill.title())
-        
-        # Also look for skills mentioned in specific sections
-        skills_section = re.search(r'skills?[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
+        # Also take free-form entries from an explicit "Skills:" section
+        skills_section = _SKILLS_SECTION.search(text)
         if skills_section:
             skills_text = skills_section.group(1)
             # Extract individual skills from the skills section
-            skill_list = re.findall(r'\b\w+(?:\s+\w+)*\b', skills_text)
-            for skill in skill_list:
-                if len(skill) > 2 and skill.lower() not in [s.lower() for s in found_skills]:
-                    found_skills.append(skill.title())
+            for skill in _SKILL_PHRASE.findall(skills_text):
+                if len(skill) > 2:
+                    found_skills.add(skill.title())
         
-        return list(set(found_skills))
+        return list(found_skills)
 
-    def _extract_education(self, text: str) -> List[Dict[str, str]]:
-        """Extract education information"""
+    def _extract_education(self, edu_text: Optional[str]) -> List[Dict[str, str]]:
+        """Extract education information from the education section"""
         education = []
         
-        # Look for education section
-        education_section = re.search(r'education[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
-        if education_section:
-            edu_text = education_section.group(1)
-            
+        if edu_text is not None:
             # Extract degree information
-            degree_patterns = [
-                r'(bachelor[^,\n]*)',
-                r'(master[^,\n]*)',
-                r'(phd[^,\n]*)',
-                r'(diploma[^,\n]*)',
-                r'(certificate[^,\n]*)'
-            ]
-            
-            for pattern in degree_patterns:
-                matches = re.findall(pattern, edu_text, re.IGNORECASE)
+            for pattern in _DEGREE_PATTERNS:
+                matches = pattern.findall(edu_text)
                 for match in matches:
                     education.append({
                         'degree': match.strip(),
@@ -160,18 +271,13 @@ class ResumeParser:
         
         return education
 
-    def _extract_experience(self, text: str) -> List[Dict[str, str]]:
-        """Extract work experience information"""
+    def _extract_experience(self, exp_text: Optional[str]) -> List[Dict[str, str]]:
+        """Extract work experience information from the experience section"""
         experience = []
         
-        # Look for experience section
-        exp_section = re.search(r'experience[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
-        if exp_section:
-            exp_text = exp_section.group(1)
-            
+        if exp_text is not None:
             # Extract job titles and companies
-            job_pattern = r'([A-Z][^,\n]*?)\s*at\s*([A-Z][^,\n]*?)(?:\s*\([^)]*\))?'
-            matches = re.findall(job_pattern, exp_text)
+            matches = _JOB_ENTRY.findall(exp_text)
             
             for title, company in matches:
                 experience.append({
@@ -183,18 +289,13 @@ class ResumeParser:
         
         return experience
 
-    def _extract_projects(self, text: str) -> List[Dict[str, str]]:
-        """Extract project information"""
+    def _extract_projects(self, projects_text: Optional[str]) -> List[Dict[str, str]]:
+        """Extract project information from the projects section"""
         projects = []
         
-        # Look for projects section
-        projects_section = re.search(r'projects?[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
-        if projects_section:
-            projects_text = projects_section.group(1)
-            
+        if projects_text is not None:
             # Extract project names and descriptions
-            project_pattern = r'([A-Z][^,\n]*?)[:\s]*(.*?)(?=\n[A-Z]|\n\n|$)'
-            matches = re.findall(project_pattern, projects_text)
+            matches = _PROJECT_ENTRY.findall(projects_text)
             
             for name, description in matches:
                 projects.append({
@@ -205,17 +306,13 @@ class ResumeParser:
         
         return projects
 
-    def _extract_certifications(self, text: str) -> List[Dict[str, str]]:
-        """Extract certification information"""
+    def _extract_certifications(self, cert_text: Optional[str]) -> List[Dict[str, str]]:
+        """Extract certification information from the certifications section"""
         certifications = []
         
-        # Look for certifications section
-        cert_section = re.search(r'certifications?[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)', text, re.IGNORECASE | re.DOTALL)
-        if cert_section:
-            cert_text = cert_section.group(1)
-            
+        if cert_text is not None:
             # Extract certification names
-            cert_list = re.findall(r'([A-Z][^,\n]*?)(?:\s*\([^)]*\))?', cert_text)
+            cert_list = _CERTIFICATION_ENTRY.findall(cert_text)
             for cert in cert_list:
                 if len(cert.strip()) > 3:
                     certifications.append({
@@ -230,28 +327,31 @@ class ResumeParser:
         """Extract contact information"""
         contact = {}
         
-        # Email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
-        if email_match:
-            contact['email'] = email_match.group()
+        # Email: no match can start before the local part of the first "@",
+        # so the regex only runs from there (one character early, so \b
+        # still sees the preceding character)
+        at = text.find('@')
+        if at != -1:
+            start = at
+            while start > 0 and text[start - 1] in _EMAIL_LOCAL_CHARS:
+                start -= 1
+            email_match = _EMAIL.search(text, max(start - 1, 0))
+            if email_match:
+                contact['email'] = email_match.group()
         
         # Phone
-        phone_pattern = r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'
-        phone_match = re.search(phone_pattern, text)
+        phone_match = _PHONE.search(text)
         if phone_match:
             contact['phone'] = phone_match.group()
         
         # LinkedIn
-        linkedin_pattern = r'linkedin\.com/in/[A-Za-z0-9-]+'
-        linkedin_match = re.search(linkedin_pattern, text)
-        if linkedin_match:
-            contact['linkedin'] = linkedin_match.group()
+        linkedin = _find_profile_url(text, 'linkedin.com/in/')
+        if linkedin:
+            contact['linkedin'] = linkedin
         
         # GitHub
-        github_pattern = r'github\.com/[A-Za-z0-9-]+'
-        github_match = re.search(github_pattern, text)
-        if github_match:
-            contact['github'] = github_match.group()
+        github = _find_profile_url(text, 'github.com/')
+        if github:
+            contact['github'] = github
         
         return contact
@@ -1,11 +1,41 @@
 """
 Scoring utilities for HireLens
 """
+import re
 from typing import Dict, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Duration patterns, tried in order by _extract_years_from_duration
+_YEARS_DURATION = re.compile(r'(\d+(?:\.\d+)?)\s*years?')
+_MONTHS_DURATION = re.compile(r'(\d+(?:\.\d+)?)\s*months?')
+_YEAR_RANGE = re.compile(r'(\d{4})\s*[-–]\s*(\d{4})')
+
+# Common spellings of the same skill, by canonical name
+_SKILL_VARIATIONS = {
+    'javascript': ['js', 'ecmascript'],
+    'python': ['py'],
+    'c++': ['cpp', 'c plus plus'],
+    'c#': ['csharp', 'c sharp'],
+    'html': ['html5'],
+    'css': ['css3'],
+    'react': ['reactjs', 'react.js'],
+    'node.js': ['nodejs', 'node'],
+    'machine learning': ['ml', 'machinelearning'],
+    'artificial intelligence': ['ai', 'artificialintelligence'],
+    'data science': ['datascience'],
+    'web development': ['webdev', 'web development'],
+    'mobile development': ['mobiledev', 'mobile development']
+}
+
+# Every known spelling (lower-case) mapped to its canonical name
+_SKILL_CANON = {}
+for _canonical, _aliases in _SKILL_VARIATIONS.items():
+    _SKILL_CANON[_canonical] = _canonical
+    for _alias in _aliases:
+        _SKILL_CANON[_alias] = _canonical
+
 class ScoringEngine:
     """Calculate final scores and verdicts for resume-JD matching"""
     
@@ -97,18 +127,12 @@ class ScoringEngine:
         jd_preferred_lower = [skill.lower().strip() for skill in jd_preferred_skills]
         
         # Calculate required skills coverage
-        required_matches = 0
-        for skill in jd_required_lower:
-            if any(self._skill_match(skill, resume_skill) for resume_skill in resume_skills_lower):
-                required_matches += 1
+        required_matches = sum(self._skill_match_mask(jd_required_lower, resume_skills_lower))
         
         required_coverage = (required_matches / len(jd_required_lower) * 100) if jd_required_lower else 0
         
         # Calculate preferred skills coverage
-        preferred_matches = 0
-        for skill in jd_preferred_lower:
-            if any(self._skill_match(skill, resume_skill) for resume_skill in resume_skills_lower):
-                preferred_matches += 1
+        preferred_matches = sum(self._skill_match_mask(jd_preferred_lower, resume_skills_lower))
         
         preferred_coverage = (preferred_matches / len(jd_preferred_lower) * 100) if jd_preferred_lower else 0
         
@@ -151,25 +175,14 @@ class ScoringEngine:
         jd_required_lower = [skill.lower().strip() for skill in jd_required_skills]
         jd_preferred_lower = [skill.lower().strip() for skill in jd_preferred_skills]
         
-        # Find matched skills
-        matched_required = []
-        matched_preferred = []
+        # Split each JD list into matched and missing skills
+        required_mask = self._skill_match_mask(jd_required_lower, resume_skills_lower)
+        preferred_mask = self._skill_match_mask(jd_preferred_lower, resume_skills_lower)
         
-        for skill in jd_required_lower:
-            for resume_skill in resume_skills_lower:
-                if self._skill_match(skill, resume_skill):
-                    matched_required.append(skill.title())
-                    break
-        
-        for skill in jd_preferred_lower:
-            for resume_skill in resume_skills_lower:
-                if self._skill_match(skill, resume_skill):
-                    matched_preferred.append(skill.title())
-                    break
-        
-        # Find missing skills
-        missing_required = [skill.title() for skill in jd_required_lower if skill not in matched_required]
-        missing_preferred = [skill.title() for skill in jd_preferred_lower if skill not in matched_preferred]
+        matched_required = [skill.title() for skill, hit in zip(jd_required_lower, required_mask) if hit]
+        matched_preferred = [skill.title() for skill, hit in zip(jd_preferred_lower, preferred_mask) if hit]
+        missing_required = [skill.title() for skill, hit in zip(jd_required_lower, required_mask) if not hit]
+        missing_preferred = [skill.title() for skill, hit in zip(jd_preferred_lower, preferred_mask) if not hit]
         
         return {
             'matched_required': matched_required,
@@ -180,6 +193,20 @@ class ScoringEngine:
             'all_missing': missing_required + missing_preferred
         }
     
+    def _skill_match_mask(self, jd_skills: List[str], resume_skills: List[str]) -> List[bool]:
+        """
+        For each (lower-cased) JD skill, whether any resume skill matches it
+        under _skill_match
+        """
+        # Exact and variation matches are one set lookup on canonical names;
+        # only the remaining skills need the substring scan
+        resume_canonical = {_SKILL_CANON.get(skill, skill) for skill in resume_skills}
+        return [
+            _SKILL_CANON.get(skill, skill) in resume_canonical or
+            any(skill in resume_skill or resume_skill in skill for resume_skill in resume_skills)
+            for skill in jd_skills
+        ]
+    
     def _skill_match(self, skill1: str, skill2: str) -> bool:
         """Check if two skills match (exact or partial)"""
         skill1 = skill1.lower().strip()
@@ -194,27 +221,7 @@ class ScoringEngine:
             return True
         
         # Check for common variations
-        variations = {
-            'javascript': ['js', 'ecmascript'],
-            'python': ['py'],
-            'c++': ['cpp', 'c plus plus'],
-            'c#': ['csharp', 'c sharp'],
-            'html': ['html5'],
-            'css': ['css3'],
-            'react': ['reactjs', 'react.js'],
-            'node.js': ['nodejs', 'node'],
-            'machine learning': ['ml', 'machinelearning'],
-            'artificial intelligence': ['ai', 'artificialintelligence'],
-            'data science': ['datascience'],
-            'web development': ['webdev', 'web development'],
-            'mobile development': ['mobiledev', 'mobile development']
-        }
-        
-        for key, variants in variations.items():
-            if (skill1 == key and skill2 in variants) or (skill2 == key and skill1 in variants):
-                return True
-        
-        return False
+        return _SKILL_CANON.get(skill1, skill1) == _SKILL_CANON.get(skill2, skill2)
     
     def calculate_experience_score(
         self, 
@@ -269,21 +276,18 @@ class ScoringEngine:
         
         duration = duration.lower()
         
-        # Look for year patterns
-        import re
-        
         # Pattern for "X years" or "X year"
-        year_match = re.search(r'(\d+(?:\.\d+)?)\s*years?', duration)
+        year_match = _YEARS_DURATION.search(duration)
         if year_match:
             return float(year_match.group(1))
         
         # Pattern for "X months" - convert to years
-        month_match = re.search(r'(\d+(?:\.\d+)?)\s*months?', duration)
+        month_match = _MONTHS_DURATION.search(duration)
         if month_match:
             return float(month_match.group(1)) / 12
         
         # Pattern for date ranges (simplified)
-        date_range_match = re.search(r'(\d{4})\s*[-–]\s*(\d{4})', duration)
+        date_range_match = _YEAR_RANGE.search(duration)
         if date_range_match:
             start_year = int(date_range_match.group(1))
             end_year = int(date_range_match.group(2))
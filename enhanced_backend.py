@@ -54,7 +54,7 @@ security = HTTPBearer()
 # Database setup
 DATABASE_URL = "sqlite:///./hirelens_enhanced.db"
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
 # Password hashing - suppress bcrypt version warnings
@@ -0,0 +1,11 @@
+#!/usr/bin/env bash
+# Build-time setup for HireLens
+# Bakes the NLTK corpora into the image so nothing is downloaded on the request path
+set -euo pipefail
+
+NLTK_DATA="${NLTK_DATA:-/opt/nltk_data}"
+
+echo "📦 Installing NLTK data into ${NLTK_DATA}..."
+mkdir -p "${NLTK_DATA}"
+python -m nltk.downloader -d "${NLTK_DATA}" punkt averaged_perceptron_tagger stopwords
+echo "✅ NLTK data installed"
@@ -0,0 +1,37 @@
+"""
+Tests for the authenticated-user cache
+"""
+import pytest
+
+pytest.importorskip("fastapi")
+from backend.auth import dependencies
+from backend.auth.dependencies import AuthenticatedUser
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    dependencies._user_cache.clear()
+    yield
+    dependencies._user_cache.clear()
+
+def test_cache_is_bounded_and_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(dependencies, "USER_CACHE_SIZE", 2)
+    for user_id in (1, 2):
+        dependencies._cache_user(AuthenticatedUser(id=user_id, role="recruiter", is_active=True))
+    dependencies._get_cached_user(1)
+    dependencies._cache_user(AuthenticatedUser(id=3, role="recruiter", is_active=True))
+    
+    assert list(dependencies._user_cache) == [1, 3]
+
+def test_expired_entries_are_dropped(monkeypatch):
+    monkeypatch.setattr(dependencies, "USER_CACHE_TTL", -1)
+    dependencies._cache_user(AuthenticatedUser(id=1, role="recruiter", is_active=True))
+    
+    assert dependencies._get_cached_user(1) is None
+    assert 1 not in dependencies._user_cache
+
+def test_updating_a_user_evicts_it():
+    dependencies._cache_user(AuthenticatedUser(id=7, role="admin", is_active=True))
+    
+    dependencies._evict_updated_user(None, None, AuthenticatedUser(id=7, role="student", is_active=False))
+    
+    assert dependencies._get_cached_user(7) is None
@@ -37,7 +37,8 @@ def test_environment_detection():
             original_value = os.environ.get(var)
             os.environ[var] = value
             
-            # Test detection
+            # Test detection (the result is cached per process)
+            detect_environment.cache_clear()
             detected = detect_environment()
             print(f"   {var}={value} → {detected} {'✅' if detected == expected else '❌'}")
             
@@ -47,6 +48,7 @@ def test_environment_detection():
             else:
                 os.environ[var] = original_value
         
+        detect_environment.cache_clear()
         return True
         
     except Exception as e:
@@ -0,0 +1,35 @@
+"""
+Tests for batch scoring in ResumeEvaluationPipeline
+"""
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+evaluation_pipeline = pytest.importorskip("backend.langchain_pipelines.evaluation_pipeline")
+
+class BrokenAfterFirstPool:
+    """Yields one scored resume, then fails like a pool whose worker died"""
+    
+    def __init__(self):
+        self.shut_down = False
+    
+    def map(self, fn, items, chunksize=1):
+        yield ({'verdict': "High"}, None)
+        raise BrokenProcessPool("A process in the process pool was terminated abruptly")
+    
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+def test_broken_pool_turns_remaining_resumes_into_errors():
+    pipeline = evaluation_pipeline.ResumeEvaluationPipeline.__new__(evaluation_pipeline.ResumeEvaluationPipeline)
+    pool = BrokenAfterFirstPool()
+    pipeline._scoring_pool = pool
+    pipeline._scoring_pool_lock = threading.Lock()
+    
+    results = pipeline._score_resumes(["a.pdf", "b.pdf", "c.pdf"], "jd", {})
+    
+    assert results[0] == ({'verdict': "High"}, None)
+    assert [scored for scored, _ in results[1:]] == [None, None]
+    assert all("terminated abruptly" in error for _, error in results[1:])
+    assert pool.shut_down and pipeline._scoring_pool is None
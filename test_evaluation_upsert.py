@@ -0,0 +1,68 @@
+"""
+Tests for the (resume_id, job_id) evaluation upsert and the schema upgrade that enables it
+"""
+from sqlalchemy import create_engine, inspect, text
+
+from backend.db import init_db
+from backend.db.models import Base, evaluation_upsert_statement
+
+def _insert_evaluation(connection, resume_id, job_id, score):
+    connection.execute(
+        text("INSERT INTO evaluations (resume_id, job_id, overall_score, verdict) VALUES (:r, :j, :s, 'Low')"),
+        {"r": resume_id, "j": job_id, "s": score},
+    )
+
+def _legacy_engine(tmp_path):
+    """An evaluations table from before the unique index, holding duplicate pairs"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX uq_eval_r_j"))
+        _insert_evaluation(connection, 1, 1, 10.0)
+        _insert_evaluation(connection, 1, 1, 20.0)
+        _insert_evaluation(connection, 1, 1, 30.0)
+        _insert_evaluation(connection, 2, 1, 40.0)
+    return engine
+
+def test_upgrade_schema_keeps_newest_duplicate_and_builds_unique_index(tmp_path, monkeypatch):
+    engine = _legacy_engine(tmp_path)
+    monkeypatch.setattr(init_db, "engine", engine)
+    
+    assert init_db.upgrade_schema() is True
+    
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text("SELECT resume_id, job_id, overall_score FROM evaluations ORDER BY resume_id")
+        ).all()
+    assert [tuple(row) for row in rows] == [(1, 1, 30.0), (2, 1, 40.0)]
+    assert "uq_eval_r_j" in {index["name"] for index in inspect(engine).get_indexes("evaluations")}
+
+def test_upsert_updates_existing_pair_in_place(tmp_path, monkeypatch):
+    engine = _legacy_engine(tmp_path)
+    monkeypatch.setattr(init_db, "engine", engine)
+    init_db.upgrade_schema()
+    
+    row = {
+        "resume_id": 1, "job_id": 1, "overall_score": 75.0, "hard_match_score": 70.0,
+        "soft_match_score": 80.0, "verdict": "High", "matched_skills": ["python"],
+        "missing_skills": [], "skill_coverage": 100.0, "feedback": {},
+    }
+    with engine.begin() as connection:
+        connection.execute(evaluation_upsert_statement(), [row])
+        rows = connection.execute(
+            text("SELECT overall_score, verdict FROM evaluations WHERE resume_id = 1 AND job_id = 1")
+        ).all()
+    assert [tuple(r) for r in rows] == [(75.0, "High")]
+
+def test_ensure_schema_skips_marker_when_an_index_fails(tmp_path, monkeypatch):
+    marker = tmp_path / "marker"
+    monkeypatch.setattr(init_db, "SCHEMA_MARKER", marker)
+    monkeypatch.setattr(init_db, "create_tables", lambda: None)
+    
+    monkeypatch.setattr(init_db, "upgrade_schema", lambda: False)
+    assert init_db.ensure_schema() is True
+    assert not marker.exists()
+    
+    monkeypatch.setattr(init_db, "upgrade_schema", lambda: True)
+    assert init_db.ensure_schema() is True
+    assert marker.exists()
@@ -0,0 +1,77 @@
+"""
+Tests for batched LLM feedback generation
+"""
+import asyncio
+
+import pytest
+
+llm_feedback = pytest.importorskip("backend.feedback.llm_feedback")
+
+FEEDBACK = {
+    'overall_feedback': "Solid match",
+    'strengths': ["Python"],
+    'weaknesses': [],
+    'missing_skills': [],
+    'improvement_suggestions': [],
+    'verdict_explanation': "Most required skills are present",
+}
+
+class FakeStructuredLLM:
+    """Answers every prompt with FEEDBACK, failing the prompts listed in fail"""
+    
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.prompts = []
+    
+    def _responses(self, prompts):
+        for index, prompt in enumerate(prompts):
+            self.prompts.append(prompt)
+            yield index, RuntimeError("model unavailable") if index in self.fail else dict(FEEDBACK)
+    
+    def batch_as_completed(self, prompts, config=None, return_exceptions=False):
+        yield from reversed(list(self._responses(prompts)))
+    
+    async def abatch_as_completed(self, prompts, config=None, return_exceptions=False):
+        for item in reversed(list(self._responses(prompts))):
+            yield item
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    monkeypatch.setattr(llm_feedback, "FEEDBACK_CACHE_PATH", str(tmp_path / "feedback.db"))
+    generator = llm_feedback.LLMFeedbackGenerator.__new__(llm_feedback.LLMFeedbackGenerator)
+    generator.model_provider = "openai"
+    return generator
+
+def _items(n):
+    return [
+        ({'skills': [f"skill{i}"]}, {'skills_required': ["python"]}, {'final_score': 50.0}, "Medium")
+        for i in range(n)
+    ]
+
+def test_sync_batch_matches_responses_by_index_and_falls_back_per_item(generator):
+    generator.structured_llm = FakeStructuredLLM(fail={1})
+    
+    feedbacks = generator.generate_feedback_batch_sync(_items(3))
+    
+    assert feedbacks[0]['overall_feedback'] == "Solid match"
+    assert feedbacks[2]['overall_feedback'] == "Solid match"
+    assert feedbacks[1]['overall_feedback'] != "Solid match"
+
+def test_async_and_sync_batches_share_the_feedback_cache(generator):
+    generator.structured_llm = FakeStructuredLLM()
+    asyncio.run(generator.generate_feedback_batch(_items(2)))
+    
+    generator.structured_llm = FakeStructuredLLM()
+    feedbacks = generator.generate_feedback_batch_sync(_items(2))
+    
+    assert generator.structured_llm.prompts == []
+    assert [feedback['overall_feedback'] for feedback in feedbacks] == ["Solid match"] * 2
+
+def test_feedback_cache_connection_is_opened_once_per_process(generator):
+    llm_feedback._store_cached_feedback("key", FEEDBACK)
+    with llm_feedback._feedback_cache_lock:
+        first = llm_feedback._feedback_cache()
+    
+    assert llm_feedback._load_cached_feedback("key") == FEEDBACK
+    with llm_feedback._feedback_cache_lock:
+        assert llm_feedback._feedback_cache() is first
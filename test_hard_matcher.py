@@ -0,0 +1,34 @@
+"""
+Tests for HardMatcher scoring
+"""
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("sklearn")
+pytest.importorskip("rapidfuzz")
+from backend.matchers.hard_matcher import HardMatcher
+
+@pytest.fixture(scope="module")
+def matcher():
+    return HardMatcher()
+
+def test_bm25_saturates_jd_term_frequency(matcher):
+    # python: 2 * 2.5 / 3.5, sql: 1, over the best case 2 * 2.5
+    score = matcher._bm25_score_vec({"python", "sql"}, Counter(["python", "python", "sql", "docker"]))
+    
+    assert score == pytest.approx((2 * 2.5 / 3.5 + 1) / 5 * 100, rel=1e-5)
+
+def test_bm25_is_zero_without_shared_terms(matcher):
+    assert matcher._calculate_bm25_score(["java"], Counter(["python"])) == 0.0
+    assert matcher._calculate_bm25_score([], Counter(["python"])) == 0.0
+
+def test_bm25_contributes_to_the_hard_match_score(matcher):
+    result = matcher.calculate_hard_match_score(
+        resume_text="Python developer with SQL and Docker experience",
+        jd_text="Looking for a Python developer who knows SQL and Docker",
+        resume_skills=["Python", "SQL"],
+        jd_required_skills=["python", "sql"]
+    )
+    
+    assert result['bm25_score'] > 0
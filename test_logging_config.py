@@ -0,0 +1,47 @@
+"""
+Tests for the queued logging setup
+"""
+import logging
+import logging.handlers
+import os
+
+import pytest
+
+from backend import logging_config
+
+@pytest.fixture
+def restore_root_handlers():
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    yield root
+    root.handlers = handlers
+
+def test_worker_logging_replaces_an_inherited_queue_handler(restore_root_handlers):
+    root = restore_root_handlers
+    root.handlers = [logging.handlers.QueueHandler(None)]
+    
+    logging_config.setup_worker_logging()
+    
+    assert len(root.handlers) == 1
+    assert type(root.handlers[0]) is logging.StreamHandler
+
+def test_worker_logging_keeps_existing_stream_handlers(restore_root_handlers):
+    root = restore_root_handlers
+    handler = logging.StreamHandler()
+    root.handlers = [handler]
+    
+    logging_config.setup_worker_logging()
+    
+    assert root.handlers == [handler]
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_forked_child_does_not_log_into_the_parent_queue(restore_root_handlers):
+    logging_config.setup_logging()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        queued = any(isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger().handlers)
+        os.write(write_fd, b"1" if queued else b"0")
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b"0"
@@ -0,0 +1,28 @@
+"""
+Tests for ResumeParser skill extraction
+"""
+import pytest
+
+pytest.importorskip("pdfplumber")
+pytest.importorskip("docx2txt")
+from backend.parsers.resume_parser import ResumeParser
+
+@pytest.fixture(scope="module")
+def parser():
+    return ResumeParser()
+
+def test_short_keywords_match_whole_words_only(parser):
+    assert sorted(parser._extract_skills("Senior architect, good at negotiation")) == []
+    assert sorted(parser._extract_skills("Wrote services in Go and R")) == ["Go", "R"]
+
+def test_longest_keyword_wins_and_symbols_count_as_word_ends(parser):
+    assert sorted(parser._extract_skills("Fluent in JavaScript and C++")) == ["C++", "Javascript"]
+
+def test_free_form_skills_come_only_from_a_skills_heading(parser):
+    assert parser._extract_skills("I have strong soft skills: teamwork matters") == []
+    
+    skills = parser._extract_skills("Summary\nSkills: Kubernetes, Terraform\n\nOther")
+    assert sorted(skills) == ["Kubernetes", "Terraform"]
+    
+    skills = parser._extract_skills("Summary\nSkills:\nFastAPI, Celery, Airflow\n\nOther")
+    assert sorted(skills) == ["Airflow", "Celery", "Fastapi"]
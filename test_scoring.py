@@ -0,0 +1,37 @@
+"""
+Tests for ScoringEngine skill matching
+"""
+import pytest
+
+from backend.utils.scoring import ScoringEngine
+
+@pytest.fixture(scope="module")
+def engine():
+    return ScoringEngine()
+
+@pytest.mark.parametrize("skill1, skill2", [
+    ("Python", "python"),
+    ("machine learning", "ML"),
+    ("JS", "JavaScript"),
+    # Two aliases of the same canonical skill match each other
+    ("reactjs", "react.js"),
+    ("cpp", "c plus plus"),
+])
+def test_skill_variations_match(engine, skill1, skill2):
+    assert engine._skill_match(skill1, skill2)
+    assert engine._skill_match(skill2, skill1)
+
+def test_unrelated_skills_do_not_match(engine):
+    assert not engine._skill_match("rust", "csharp")
+
+def test_matched_skills_resolve_aliases_on_both_sides(engine):
+    result = engine.get_matched_skills(
+        resume_skills=["ML", "cpp", "ReactJS"],
+        jd_required_skills=["Machine Learning", "C Plus Plus", "Rust"],
+        jd_preferred_skills=["React.js"]
+    )
+    
+    assert result['matched_required'] == ["Machine Learning", "C Plus Plus"]
+    assert result['missing_required'] == ["Rust"]
+    assert result['matched_preferred'] == ["React.Js"]
+    assert result['missing_preferred'] == []
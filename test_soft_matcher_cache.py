@@ -0,0 +1,52 @@
+"""
+Tests for the SoftMatcher embedding caches
+"""
+import numpy as np
+import pytest
+
+soft_matcher = pytest.importorskip("backend.matchers.soft_matcher")
+SoftMatcher = soft_matcher.SoftMatcher
+
+def _bare_matcher(applied_precision):
+    """A SoftMatcher without a loaded model whose precision step reports applied_precision"""
+    matcher = SoftMatcher.__new__(SoftMatcher)
+    matcher._apply_precision = lambda: applied_precision
+    return matcher
+
+def test_cache_key_follows_the_precision_actually_applied():
+    fallback = _bare_matcher("fp32")
+    fallback._set_model_key("all-MiniLM-L6-v2")
+    assert fallback._cache_dtype == np.float32
+    assert fallback._model_key == "all-MiniLM-L6-v2:fp32:float32"
+    
+    half = _bare_matcher("fp16")
+    half._set_model_key("all-MiniLM-L6-v2")
+    assert half._cache_dtype == np.float16
+    assert half._model_key == "all-MiniLM-L6-v2:fp16:float16"
+
+def test_persisted_embeddings_round_trip_at_their_storage_dtype(tmp_path, monkeypatch):
+    monkeypatch.setattr(soft_matcher, "EMBEDDING_CACHE_PATH", str(tmp_path / "emb.db"))
+    vector = np.array([0.6, 0.8, 0.0], dtype=np.float16)
+    
+    soft_matcher._store_cached_embeddings("m:fp16:float16", {"k": vector})
+    
+    found = soft_matcher._load_cached_embeddings("m:fp16:float16", ["k"], np.dtype(np.float16))
+    np.testing.assert_array_equal(found["k"], vector)
+    assert soft_matcher._load_cached_embeddings("m:fp32:float32", ["k"], np.dtype(np.float32)) == {}
+
+def test_cache_connection_is_opened_once_per_process(tmp_path, monkeypatch):
+    monkeypatch.setattr(soft_matcher, "EMBEDDING_CACHE_PATH", str(tmp_path / "emb.db"))
+    
+    soft_matcher._store_cached_embeddings("m:fp32:float32", {"k": np.ones(3, dtype=np.float32)})
+    with soft_matcher._embedding_cache_lock:
+        first = soft_matcher._embedding_cache()
+    soft_matcher._load_cached_embeddings("m:fp32:float32", ["k"], np.dtype(np.float32))
+    with soft_matcher._embedding_cache_lock:
+        assert soft_matcher._embedding_cache() is first
+
+def test_embeddings_off_unit_length_are_normalized():
+    embeddings = np.array([[3.0, 4.0], [0.0, 0.0], [0.6, 0.8]], dtype=np.float32)
+    
+    normalized = soft_matcher._ensure_unit_length(embeddings)
+    
+    np.testing.assert_allclose(normalized, [[0.6, 0.8], [0.0, 0.0], [0.6, 0.8]], rtol=1e-6)